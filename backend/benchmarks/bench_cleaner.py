@@ -0,0 +1,78 @@
+# benchmarks/bench_cleaner.py
+#
+# Compare le nettoyage de texte par BeautifulSoup à chaque champ et le
+# chemin rapide de DataCleaner, sur des enregistrements synthétiques.
+# Lancement depuis backend/ : python -m benchmarks.bench_cleaner [nb_enregistrements]
+
+import random
+import re
+import sys
+import time
+import warnings
+
+from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
+
+from utils.cleaner import DataCleaner
+
+def generate_records(count=20000, seed=42):
+    """Enregistrements scrapés typiques : surtout du texte brut, quelques entités et balises"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        records.append({
+            'nom': f"Produit numéro {i} &amp; accessoires" if i % 5 == 0 else f"  Produit numéro {i}\n",
+            'prix': f"{rng.randint(1, 2999)},{rng.randint(0, 99):02d} €",
+            'description': (f"<p>Description du <b>produit {i}</b>,<br/> livraison rapide.</p>"
+                            if i % 10 == 0 else f"Description détaillée du produit {i}, livraison rapide."),
+            'marque': f"Marque {i % 37}",
+            'disponibilite': "En stock" if i % 3 else "Rupture&nbsp;de stock",
+            'image_url': f"https://exemple.fr/img/{i}.jpg?w=400&h=400",
+        })
+    return records
+
+def reference_clean_text(text):
+    """Nettoyage d'origine : un BeautifulSoup par chaîne"""
+    text = BeautifulSoup(text, "html.parser").get_text()
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+class ReferenceCleaner(DataCleaner):
+    def configure(self, options=None):
+        super().configure(options)
+        self._clean_value = reference_clean_text
+        return self
+
+def bench(cleaner, records, repetitions):
+    """Retourne (meilleur temps, données nettoyées)"""
+    times = []
+    cleaned = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        cleaned = cleaner.clean(records)
+        times.append(time.perf_counter() - start)
+    return min(times), cleaned
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repetitions = 3
+    records = generate_records(count)
+    fields = sum(isinstance(value, str) for record in records for value in record.values())
+    # Les URLs d'images font réagir BeautifulSoup (MarkupResemblesLocatorWarning)
+    warnings.filterwarnings('ignore', category=MarkupResemblesLocatorWarning)
+
+    print(f"🧹 {count} enregistrements, {fields} champs texte")
+    print(f"{'nettoyage':<16}{'temps':>10}{'champs/s':>14}{'speedup':>10}")
+
+    reference_time, reference = bench(ReferenceCleaner(), records, 1)
+    print(f"{'BeautifulSoup':<16}{reference_time:>9.3f}s{fields / reference_time:>14,.0f}{1:>9.1f}x")
+
+    fast_time, cleaned = bench(DataCleaner(), records, repetitions)
+    print(f"{'chemin rapide':<16}{fast_time:>9.3f}s{fields / fast_time:>14,.0f}{reference_time / fast_time:>9.1f}x")
+
+    if cleaned != reference:
+        print("❌ Résultats différents du nettoyage de référence")
+        sys.exit(1)
+    print("✅ Résultats identiques")
+
+if __name__ == "__main__":
+    main()
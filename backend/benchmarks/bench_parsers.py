@@ -0,0 +1,56 @@
+# benchmarks/bench_parsers.py
+#
+# Compare les backends de parsing sur une page catégorie synthétique.
+# Lancement depuis backend/ : python -m benchmarks.bench_parsers [nb_produits]
+
+import contextlib
+import io
+import sys
+import time
+
+from benchmarks.pages import generate_category_page
+from scraper.e_commerce_scraper import EcommerceScraper
+from scraper.parsers import available_backends
+from utils.selector_stats import get_selector_stats
+
+def bench(scraper, html, repetitions):
+    """Retourne (temps de parsing, temps parsing + extraction, nb produits)"""
+    parse_times = []
+    total_times = []
+    produits = []
+
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        scraper.parse_html(html)
+        parse_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            produits = scraper.scrape_html(html)
+        total_times.append(time.perf_counter() - start)
+
+    return min(parse_times), min(total_times), len(produits)
+
+def main():
+    products = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repetitions = 3
+    html = generate_category_page(products).encode('utf-8')
+
+    print(f"📄 Page synthétique : {len(html) / 1024 / 1024:.2f} Mo, {products} produits")
+    print(f"{'backend':<14}{'parsing':>12}{'+ extraction':>16}{'produits':>10}{'speedup':>10}")
+
+    scraper = EcommerceScraper("http://localhost/")
+    # Chaque backend extrait sans modèle appris ni résultat mémorisé par le précédent
+    scraper.disable_templates()
+    scraper.disable_fingerprints()
+    scraper.selector_stats = get_selector_stats()
+    reference = None
+    for backend in available_backends():
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper.set_parser_backend(backend)
+        parse_time, total_time, count = bench(scraper, html, repetitions)
+        reference = reference or total_time
+        print(f"{backend:<14}{parse_time:>11.3f}s{total_time:>15.3f}s{count:>10}{reference / total_time:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_records.py
+#
+# Mémoire occupée par les enregistrements scrapés : dicts, classes à slots
+# (Product, Quote, NewsItem) et lot en colonnes (RecordBatch).
+# Lancement depuis backend/ : python -m benchmarks.bench_records [nb_enregistrements]
+
+import random
+import sys
+import tracemalloc
+
+from utils.records import NewsItem, Product, Quote, RecordBatch
+
+def generate_values(count=100000, seed=42):
+    """Champs scrapés typiques par type d'enregistrement, créés hors mesure"""
+    rng = random.Random(seed)
+    products, quotes, news = [], [], []
+    for i in range(count):
+        prix_brut = f"{rng.randint(1, 2999)},{rng.randint(0, 99):02d} €"
+        products.append({
+            'nom': f"Produit numéro {i}",
+            'prix': prix_brut[:-2],
+            'prix_brut': prix_brut,
+            'description': f"Description détaillée du produit {i}, livraison rapide.",
+            'image_url': f"https://exemple.fr/img/{i}.jpg",
+            'index': i + 1
+        })
+        variation = f"{rng.uniform(-5, 5):+.2f}"
+        quotes.append({
+            'nom': f"VALEUR{i}",
+            'prix': f"{rng.uniform(1, 500):.2f}",
+            'prix_brut': f"{rng.uniform(1, 500):.2f} €",
+            'variation_absolue': variation,
+            'variation_pourcentage': f"{variation}%",
+            'variation_brute': f"{variation} ({variation}%)",
+            'index': i + 1,
+            'type': 'cotation'
+        })
+        news.append({
+            'titre': f"Titre de l'article {i}",
+            'description': f"Résumé de l'article {i}.",
+            'date': f"2026-10-{i % 28 + 1:02d}",
+            'lien': f"https://exemple.fr/actualites/{i}",
+            'index': i + 1,
+            'type': 'actualite'
+        })
+    return {'Product': (Product, products), 'Quote': (Quote, quotes), 'NewsItem': (NewsItem, news)}
+
+def measure(build):
+    """Octets alloués par `build()` et encore vivants (les valeurs des champs existent déjà)"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        container = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del container
+    return after - before
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"🧮 {count} enregistrements par type (valeurs des champs partagées, non comptées)")
+    print(f"{'type':<10}{'stockage':<14}{'octets/enr.':>12}{'gain':>8}")
+
+    below_target = False
+    for name, (record_class, rows) in generate_values(count).items():
+        results = {
+            'dict': measure(lambda: [dict(row) for row in rows]),
+            'slots': measure(lambda: [record_class(**row) for row in rows]),
+            'RecordBatch': measure(lambda: RecordBatch(record_class(**row) for row in rows)),
+        }
+        reference = results['dict']
+        for storage, size in results.items():
+            print(f"{name:<10}{storage:<14}{size / count:>12.1f}{reference / size:>7.1f}x")
+        below_target |= reference / results['RecordBatch'] < 3
+
+    if below_target:
+        print("⚠️ RecordBatch n'atteint pas un gain de 3x sur tous les types")
+        sys.exit(1)
+    print("✅ RecordBatch au moins 3x plus compact que les dicts")
+
+if __name__ == "__main__":
+    main()
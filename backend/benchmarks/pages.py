@@ -0,0 +1,33 @@
+# benchmarks/pages.py
+
+import random
+
+def generate_category_page(products=2000, seed=42):
+    """Génère une page catégorie e-commerce synthétique (≈ 1 Mo pour 2000 produits)"""
+    rng = random.Random(seed)
+
+    header = "".join(f'<li class="menu-item"><a href="/cat/{i}">Catégorie {i}</a></li>' for i in range(150))
+    scripts = "".join(f'<script>window.tracking_{i} = {{"id": {i}, "ts": {rng.random()}}};</script>' for i in range(40))
+
+    items = []
+    for i in range(products):
+        prix = f"{rng.randint(1, 2999)},{rng.randint(0, 99):02d} €"
+        items.append(
+            f'<div class="product-card" data-id="{i}">'
+            f'<a href="/p/{i}"><img src="/img/{i}.jpg" alt="Produit {i}"></a>'
+            f'<div class="meta"><span class="brand">Marque {i % 37}</span>'
+            f'<h3 class="product-title">Produit numéro {i} &amp; accessoires</h3></div>'
+            f'<p class="description">Description détaillée du produit {i}, livraison rapide.</p>'
+            f'<div class="pricing"><span class="old">{prix}</span><span class="price">{prix}</span></div>'
+            f'<button class="add-to-cart">Ajouter</button>'
+            f'</div>'
+        )
+
+    footer = "".join(f'<div class="footer-col"><p>Lien légal {i}</p></div>' for i in range(60))
+
+    return (
+        f'<html><head><title>Catégorie</title>{scripts}</head><body>'
+        f'<nav><ul>{header}</ul></nav>'
+        f'<main><div class="product-grid">{"".join(items)}</div></main>'
+        f'<footer>{footer}</footer></body></html>'
+    )
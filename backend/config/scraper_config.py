@@ -1,7 +1,12 @@
 # config/scraper_config.py
+import copy
 import json
+import threading
 from pathlib import Path
 
+# Dossier backend/ : base des chemins de cache relatifs, quel que soit le dossier courant
+BASE_DIRECTORY = Path(__file__).resolve().parent.parent
+
 class ScrapingConfig:
     """Gestionnaire de configuration pour le scraping"""
     
@@ -11,7 +16,18 @@ class ScrapingConfig:
             "default_delay": 1.0,
             "max_retries": 3,
             "timeout": 30,
-            "output_directory": "output"
+            "backoff_base": 0.5,
+            "backoff_max": 30,
+            "circuit_failure_threshold": 5,
+            "circuit_reset_timeout": 60,
+            "output_directory": "output",
+            "cache_directory": "cache"
+        },
+        "connection_pool": {
+            "pool_connections": 20,
+            "pool_maxsize": 10,
+            "host_pool_sizes": {},
+            "http2": False
         },
         "stealth": {
             "rotate_user_agents": True,
@@ -19,11 +35,36 @@ class ScrapingConfig:
             "random_delays": True,
             "delay_range": [1, 3]
         },
+        "parsing": {
+            "backend": "html.parser",
+            "structured_data": True
+        },
+        "templates": {
+            "enabled": True,
+            "path": "templates.json"
+        },
+        "fingerprints": {
+            "enabled": False,
+            "directory": "fingerprints"
+        },
+        "selector_stats": {
+            "persist": True,
+            "path": "selector_stats.json"
+        },
+        "sitemap": {
+            "watermarks_path": "sitemap_watermarks.json"
+        },
+        "http_cache": {
+            "directory": "http",
+            "max_size_mb": 200
+        },
         "cleaning": {
             "remove_html_tags": True,
             "normalize_whitespace": True,
             "remove_empty_fields": True,
-            "convert_prices": True
+            "convert_prices": True,
+            "normalize_dates": True,
+            "date_fields": ["date"]
         },
         "export": {
             "default_format": "json",
@@ -51,9 +92,9 @@ class ScrapingConfig:
                 return self.merge_configs(self.DEFAULT_CONFIG, loaded_config)
             except Exception as e:
                 print(f"Erreur lors du chargement de la config : {e}")
-                return self.DEFAULT_CONFIG.copy()
+                return copy.deepcopy(self.DEFAULT_CONFIG)
         else:
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
     
     def save_config(self):
         """Sauvegarde la configuration"""
@@ -62,8 +103,8 @@ class ScrapingConfig:
             json.dump(self.config, f, indent=2, ensure_ascii=False)
     
     def merge_configs(self, default, loaded):
-        """Fusionne deux configurations"""
-        result = default.copy()
+        """Fusionne deux configurations (sans modifier `default`)"""
+        result = copy.deepcopy(default)
         for key, value in loaded.items():
             if key in result and isinstance(result[key], dict) and isinstance(value, dict):
                 result[key].update(value)
@@ -84,6 +125,18 @@ class ScrapingConfig:
         
         return value
     
+    def cache_path(self, path, default):
+        """
+        Chemin d'un cache de la configuration (`path` : clé pointée)
+        
+        Un chemin relatif l'est au dossier general.cache_directory, lui-même
+        relatif à backend/ : les caches ne dépendent pas du dossier courant.
+        """
+        root = Path(self.get('general.cache_directory', 'cache'))
+        if not root.is_absolute():
+            root = BASE_DIRECTORY / root
+        return root / self.get(path, default)
+    
     def set(self, path, value):
         """Définit une valeur de configuration"""
         keys = path.split('.')
@@ -96,10 +149,18 @@ class ScrapingConfig:
         
         config_ref[keys[-1]] = value
 
+# Configuration lue une seule fois par processus, partagée par tous les scrapers
+_shared_config = None
+_shared_config_lock = threading.Lock()
+
 # Exemple d'utilisation avec le script principal
-def load_scraping_config():
-    """Charge la configuration pour le scraping"""
-    return ScrapingConfig()
+def load_scraping_config(reload=False):
+    """Charge la configuration pour le scraping (`reload` : relire le fichier)"""
+    global _shared_config
+    with _shared_config_lock:
+        if _shared_config is None or reload:
+            _shared_config = ScrapingConfig()
+        return _shared_config
 
 # Exemple de fichier de configuration JSON à créer
 EXAMPLE_CONFIG = {
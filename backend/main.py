@@ -1,14 +1,22 @@
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Imports de vos modules
 from scraper.e_commerce_scraper import EcommerceScraper
 from scraper.bource_scraper import BourseScraper
 from scraper.news_scraper import NewsScraper
+from scraper.base_scraper import BaseScraper
 from utils.exporter import export_data
 from utils.cleaner import DataCleaner
+from utils.columnar import to_columns
 from utils.robot_check import is_scraping_allowed
+from utils.http_pool import get_pool_registry
+from utils.sitemap import SitemapWatermarks, discover_sitemaps, iter_sitemap
+from utils.fingerprint import get_fingerprint_store
+from utils.records import RecordBatch
+from config.scraper_config import load_scraping_config
 
 class ScrapingManager:
     """Gestionnaire principal pour le scraping avec options avancées"""
@@ -20,6 +28,8 @@ class ScrapingManager:
             "news": NewsScraper
         }
         self.formats_supportes = ["csv", "json", "xlsx", "pdf"]
+        # Règles de nettoyage par défaut (section 'cleaning' de la configuration)
+        self.options_nettoyage = load_scraping_config().get('cleaning', {})
     
     def choisir_scraper(self, type_site, url):
         """Factory pattern pour créer le bon scraper"""
@@ -40,7 +50,7 @@ class ScrapingManager:
         
         return self.scrapers[type_site](url)
     
-    def verifier_robots_txt(self, url, force=False):
+    def verifier_robots_txt(self, url, force=False, interactif=True):
         """Vérifie robots.txt avec option de forçage"""
         if force:
             print("⚠️ Vérification robots.txt ignorée (mode forcé)")
@@ -50,6 +60,9 @@ class ScrapingManager:
             if not is_scraping_allowed(url):
                 print("🚫 Le scraping de ce site n'est pas autorisé selon robots.txt")
                 
+                if not interactif:
+                    return False
+                
                 choix = input("Voulez-vous continuer quand même ? (y/N): ").strip().lower()
                 if choix in ['y', 'yes', 'oui', 'o']:
                     print("⚠️ Scraping en mode non-conforme à robots.txt")
@@ -64,6 +77,44 @@ class ScrapingManager:
             print(f"⚠️ Impossible de vérifier robots.txt ({e}). Continuation...")
             return True
     
+    def configurer_scraper(self, scraper, options=None):
+        """Applique les options avancées (furtif, délai, cache...) à un scraper"""
+        options = options or {}
+        
+        if options.get('stealth_mode', False):
+            print("🥷 Mode furtif activé")
+            scraper.enable_stealth_mode()
+        
+        if options.get('delay', 0) > 0:
+            print(f"⏱️ Délai entre requêtes : {options['delay']}s")
+            scraper.set_delay(options['delay'])
+        
+        if options.get('respect_robots', True):
+            scraper.use_robots_delay()
+        
+        if options.get('parser'):
+            scraper.set_parser_backend(options['parser'])
+        
+        if options.get('cache'):
+            scraper.enable_cache()
+        
+        if options.get('templates') is False:
+            scraper.disable_templates()
+        
+        if options.get('structured_data') is False:
+            scraper.use_structured_data = False
+        
+        if options.get('fingerprints') is True:
+            scraper.enable_fingerprints()
+        elif options.get('fingerprints') is False:
+            scraper.disable_fingerprints()
+        
+        if options.get('user_agent'):
+            print(f"🔧 User-Agent personnalisé : {options['user_agent'][:50]}...")
+            scraper.set_user_agent(options['user_agent'])
+        
+        return scraper
+    
     def scraper_avec_options(self, scraper, options=None):
         """Lance le scraping avec des options avancées"""
         if options is None:
@@ -73,21 +124,28 @@ class ScrapingManager:
         start_time = time.time()
         
         try:
-            # Options de scraping avancées
-            if options.get('stealth_mode', False):
-                print("🥷 Mode furtif activé")
-                scraper.enable_stealth_mode()
-            
-            if options.get('delay', 0) > 0:
-                print(f"⏱️ Délai entre requêtes : {options['delay']}s")
-                scraper.set_delay(options['delay'])
-            
-            if options.get('user_agent'):
-                print(f"🔧 User-Agent personnalisé : {options['user_agent'][:50]}...")
-                scraper.set_user_agent(options['user_agent'])
+            self.configurer_scraper(scraper, options)
             
             # Lancement du scraping
-            data = scraper.scrape()
+            if options.get('stream'):
+                # Enregistrements reçus au fil du téléchargement
+                data = RecordBatch()
+                for record in scraper.scrape_stream():
+                    if not data:
+                        print(f"⚡ Premier enregistrement après {time.time() - start_time:.2f}s")
+                    data.append(record)
+                print(f"📦 {len(data)} enregistrements reçus en streaming")
+            elif options.get('crawl_depth') is not None and hasattr(scraper, 'crawl'):
+                data = RecordBatch(scraper.crawl(
+                    max_depth=options['crawl_depth'],
+                    max_pages=options.get('crawl_max_pages', 100),
+                    scope=options.get('crawl_scope', 'domain'),
+                    respect_robots=options.get('respect_robots', True)
+                ))
+            elif options.get('max_pages', 1) > 1 and hasattr(scraper, 'scrape_pages'):
+                data = scraper.scrape_pages(options['max_pages'])
+            else:
+                data = scraper.scrape()
             
             elapsed_time = time.time() - start_time
             print(f"✅ Scraping terminé en {elapsed_time:.2f}s")
@@ -98,8 +156,18 @@ class ScrapingManager:
             print(f"❌ Erreur lors du scraping : {e}")
             return None
     
-    def nettoyer_donnees(self, data, site_type, options_nettoyage=None):
-        """Nettoie les données avec options personnalisables"""
+    def nettoyer_donnees(self, data, site_type, options_nettoyage=None, workers=1, colonnes=False):
+        """
+        Nettoie les données avec options personnalisables
+        
+        Args:
+            options_nettoyage: Règles de nettoyage (par défaut, la section
+                'cleaning' de la configuration)
+            workers: Processus de nettoyage (None : un par cœur) ; les petits
+                volumes sont toujours nettoyés séquentiellement
+            colonnes: Nettoyage en colonnes (pandas), retourne un DataFrame
+                avec prix et variations en float64
+        """
         if not data:
             return data
         
@@ -107,11 +175,12 @@ class ScrapingManager:
         
         try:
             cleaner = DataCleaner(site_type=site_type)
+            cleaner.configure(self.options_nettoyage if options_nettoyage is None else options_nettoyage)
             
-            if options_nettoyage:
-                cleaner.configure(options_nettoyage)
-            
-            cleaned_data = cleaner.clean(data)
+            if colonnes:
+                cleaned_data = cleaner.clean_columns(data)
+            else:
+                cleaned_data = cleaner.clean(data, workers=workers)
             print(f"✅ {len(cleaned_data)} éléments nettoyés")
             
             return cleaned_data
@@ -122,7 +191,7 @@ class ScrapingManager:
     
     def exporter_donnees(self, data, filename, format_choisi, options_export=None):
         """Exporte les données avec gestion d'erreurs améliorée"""
-        if not data:
+        if data is None or len(data) == 0:
             print("❌ Aucune donnée à exporter")
             return False
         
@@ -148,6 +217,186 @@ class ScrapingManager:
             print(f"❌ Erreur lors de l'export : {e}")
             return False
 
+    def traiter_url(self, type_site, url, options=None, nettoyer=True, force=False):
+        """Scrape et nettoie une URL du lot, retourne (données, statut)"""
+        debut = time.time()
+        statut = {'url': url, 'statut': 'ok', 'elements': 0, 'erreur': ''}
+        
+        try:
+            if not self.verifier_robots_txt(url, force=force, interactif=False):
+                statut['statut'] = 'refuse'
+                statut['erreur'] = 'robots.txt'
+                return [], statut
+            
+            scraper = self.choisir_scraper(type_site, url)
+            data = self.scraper_avec_options(scraper, options)
+            
+            if not data:
+                statut['statut'] = 'vide'
+                return [], statut
+            
+            if nettoyer:
+                data = self.nettoyer_donnees(data, type_site)
+            
+            # Garder la trace de l'URL d'origine dans l'export combiné
+            if isinstance(data, RecordBatch):
+                data.set_field('url_source', url)
+            else:
+                for item in data:
+                    item['url_source'] = url
+            
+            statut['elements'] = len(data)
+            return data, statut
+            
+        except Exception as e:
+            statut['statut'] = 'erreur'
+            statut['erreur'] = str(e)
+            return [], statut
+        
+        finally:
+            statut['duree'] = round(time.time() - debut, 2)
+    
+    def scraper_lot(self, type_site, urls, options=None, workers=4, nettoyer=True, force=False):
+        """
+        Scrape une liste d'URLs avec un pool de workers
+        
+        Returns:
+            Tuple (données combinées, résumé par URL)
+        """
+        urls = list(dict.fromkeys(urls))
+        workers = max(1, min(workers, len(urls) or 1))
+        
+        print(f"📦 Lot de {len(urls)} URLs avec {workers} workers")
+        start_time = time.time()
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            resultats = list(executor.map(
+                lambda url: self.traiter_url(type_site, url, options, nettoyer, force),
+                urls
+            ))
+        
+        donnees = RecordBatch()
+        resume = []
+        for data, statut in resultats:
+            donnees.extend(data)
+            resume.append(statut)
+        
+        elapsed_time = time.time() - start_time
+        print(f"✅ Lot terminé en {elapsed_time:.2f}s")
+        
+        return donnees, resume
+    
+    def decouvrir_urls_sitemap(self, url, depuis_derniere_execution=True, limite=None, scraper=None):
+        """
+        Énumère les pages d'un site depuis ses sitemaps (robots.txt ou /sitemap.xml)
+        
+        Avec `depuis_derniere_execution`, seules les pages modifiées depuis la
+        marque enregistrée au dernier lot réussi sont retenues.
+        
+        Avec `limite`, les sitemaps sont lus en entier et les pages les plus
+        anciennes (par lastmod, pages sans lastmod en dernier) sont retenues :
+        la marque peut alors avancer sans sauter les pages reportées.
+        
+        Les sitemaps sont téléchargés par `scraper` (User-Agent, délai par
+        hôte, nouveaux essais et disjoncteur des autres requêtes).
+        
+        Returns:
+            (pages retenues, pages reportées par la limite, sitemaps en échec) :
+            listes de (url, lastmod ou None), puis d'URLs de sitemaps
+        """
+        depuis = self.marques_sitemap().get(url) if depuis_derniere_execution else None
+        if depuis:
+            print(f"🕒 Pages modifiées depuis le {depuis:%Y-%m-%d %H:%M} uniquement")
+        
+        scraper = scraper or BaseScraper(url)
+        fetch = lambda sitemap: scraper.get_html_requests(sitemap, stream=True)
+        
+        entrees = {}
+        echecs = []
+        for sitemap in discover_sitemaps(url):
+            print(f"🗺️ Lecture du sitemap {sitemap}")
+            for page, lastmod in iter_sitemap(sitemap, since=depuis, fetch=fetch, failures=echecs):
+                entrees.setdefault(page, lastmod)
+        
+        if echecs:
+            print(f"❌ {len(echecs)} sitemap(s) inaccessible(s) ou illisible(s) : {', '.join(echecs)}")
+        print(f"📑 {len(entrees)} URLs trouvées dans les sitemaps")
+        entrees = list(entrees.items())
+        if not limite or len(entrees) <= limite:
+            return entrees, [], echecs
+        
+        entrees.sort(key=lambda entree: (entree[1] is None, entree[1] or 0))
+        print(f"✂️ {limite} pages les plus anciennes retenues, {len(entrees) - limite} reportées")
+        return entrees[:limite], entrees[limite:], echecs
+    
+    def marques_sitemap(self):
+        """Marques lastmod par site (section 'sitemap' de la configuration)"""
+        return SitemapWatermarks(load_scraping_config().cache_path('sitemap.watermarks_path', 'sitemap_watermarks.json'))
+    
+    def valider_sitemap(self, url, entrees, resume, reportees=(), echecs=()):
+        """
+        Avance la marque `lastmod` du site après un lot
+        
+        La marque s'arrête avant la première page en erreur, et avant le plus
+        petit lastmod des pages `reportees` (non traitées à cause de la
+        limite) : ces pages seront reproposées à la prochaine exécution.
+        
+        Une page sans résultat ('vide') ou refusée par robots.txt compte comme
+        traitée : la réessayer ne changerait rien tant que son lastmod ne
+        change pas, et elle bloquerait la marque indéfiniment. Elle revient
+        d'elle-même dans le sitemap quand elle est modifiée.
+        
+        Si un sitemap (`echecs`) n'a pas pu être lu, ses pages sont inconnues :
+        la marque n'avance pas.
+        """
+        if echecs:
+            print("⚠️ Marque du sitemap conservée : sitemaps incomplets")
+            return
+        
+        termines = {statut['url'] for statut in resume if statut['statut'] in ('ok', 'vide', 'refuse')}
+        plafond = min((lastmod for _, lastmod in reportees if lastmod is not None), default=None)
+        
+        par_date = {}
+        for page, lastmod in entrees:
+            if lastmod is not None:
+                par_date.setdefault(lastmod, []).append(page)
+        
+        marque = None
+        for lastmod in sorted(par_date):
+            if plafond is not None and lastmod >= plafond:
+                break
+            if not all(page in termines for page in par_date[lastmod]):
+                break
+            marque = lastmod
+        
+        self.marques_sitemap().update(url, marque)
+    
+    def afficher_resume(self, resume):
+        """Affiche le statut de chaque URL d'un lot"""
+        print("\n📋 RÉSUMÉ DU LOT")
+        print("=" * 60)
+        
+        icones = {'ok': '✅', 'vide': '⚠️', 'refuse': '🚫', 'erreur': '❌'}
+        for statut in resume:
+            ligne = f"{icones.get(statut['statut'], '•')} {statut['url']} : {statut['elements']} éléments ({statut['duree']}s)"
+            if statut['erreur']:
+                ligne += f" - {statut['erreur']}"
+            print(ligne)
+        
+        reussis = sum(1 for statut in resume if statut['statut'] == 'ok')
+        print(f"\n📊 {reussis}/{len(resume)} URLs scrapées avec succès")
+
+def lire_urls(source):
+    """Lit une liste d'URLs depuis un fichier ('-' pour l'entrée standard)"""
+    if source == '-':
+        lignes = sys.stdin.read().splitlines()
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            lignes = f.read().splitlines()
+    
+    # Ignorer les lignes vides et les commentaires
+    return [ligne.strip() for ligne in lignes if ligne.strip() and not ligne.strip().startswith('#')]
+
 def interface_utilisateur():
     """Interface utilisateur interactive"""
     manager = ScrapingManager()
@@ -202,6 +451,7 @@ def interface_utilisateur():
     options_scraping = {
         'stealth_mode': stealth_mode,
         'delay': delay,
+        'respect_robots': not force_scraping,
         'user_agent': None  # Peut être étendu
     }
     
@@ -237,42 +487,179 @@ def mode_commande():
     
     parser = argparse.ArgumentParser(description="Scraper universel")
     parser.add_argument("type", choices=["ecommerce", "bourse", "news"], help="Type de site")
-    parser.add_argument("url", help="URL à scraper")
+    parser.add_argument("url", nargs="?", help="URL à scraper")
+    parser.add_argument("--urls-file", help="Fichier contenant une URL par ligne ('-' pour l'entrée standard)")
+    parser.add_argument("--workers", type=int, default=4, help="Nombre de workers en mode lot")
     parser.add_argument("-o", "--output", default="output", help="Nom du fichier de sortie")
     parser.add_argument("-f", "--format", choices=["csv", "json", "xlsx", "pdf"], default="json", help="Format de sortie")
     parser.add_argument("--force", action="store_true", help="Ignorer robots.txt")
     parser.add_argument("--stealth", action="store_true", help="Mode furtif")
     parser.add_argument("--delay", type=float, default=0, help="Délai entre requêtes")
     parser.add_argument("--no-clean", action="store_true", help="Ne pas nettoyer les données")
+    parser.add_argument("--columnar", action="store_true", help="Nettoyage en colonnes (pandas) avec prix et variations en float64")
+    parser.add_argument("--clean-workers", type=int, default=1, help="Processus de nettoyage pour les gros volumes (0 : un par cœur)")
+    parser.add_argument("--cache", action="store_true", help="Cache HTTP sur disque (revalidation ETag / Last-Modified)")
+    parser.add_argument("--parser", choices=["auto", "html.parser", "lxml", "html5lib", "selectolax"], help="Backend de parsing HTML")
+    parser.add_argument("--stream", action="store_true", help="Extraire les enregistrements pendant le téléchargement")
+    parser.add_argument("--pages", type=int, default=1, help="Nombre maximal de pages à suivre (e-commerce)")
+    parser.add_argument("--crawl-depth", type=int, help="Crawler le site jusqu'à cette profondeur (actualités)")
+    parser.add_argument("--crawl-max-pages", type=int, default=100, help="Nombre maximal de pages visitées par le crawl")
+    parser.add_argument("--scope", choices=["host", "domain", "all"], default="domain", help="Périmètre du crawl")
+    parser.add_argument("--sitemap", action="store_true", help="Scraper les pages listées dans les sitemaps du site")
+    parser.add_argument("--sitemap-all", action="store_true", help="Ignorer la date de la dernière exécution (toutes les pages du sitemap)")
+    parser.add_argument("--sitemap-limit", type=int, help="Nombre maximal de pages scrapées par exécution (les plus anciennes d'abord)")
+    parser.add_argument("--no-templates", action="store_true", help="Ne pas utiliser les sélecteurs appris par site")
+    parser.add_argument("--no-structured-data", action="store_true", help="Ignorer le JSON-LD / JSON embarqué (extraction CSS uniquement)")
+    parser.add_argument("--fingerprints", action="store_true", help="Réutiliser les résultats des pages inchangées depuis la dernière exécution (empreintes de contenu)")
+    parser.add_argument("--no-fingerprints", action="store_true", help="Toujours réextraire les pages, même si la configuration active les empreintes")
+    parser.add_argument("--fingerprint-stats", action="store_true", help="Afficher les pages inchangées (empreintes de contenu)")
+    parser.add_argument("--selector-stats", action="store_true", help="Afficher le taux de succès des sélecteurs")
+    parser.add_argument("--pool-stats", action="store_true", help="Afficher la réutilisation des connexions HTTP")
     
     args = parser.parse_args()
     
+    if not args.url and not args.urls_file:
+        parser.error("une URL ou --urls-file est requis")
+    if args.sitemap and not args.url:
+        parser.error("--sitemap nécessite l'URL du site")
+    
     manager = ScrapingManager()
     
+    if args.urls_file:
+        mode_lot(manager, args)
+        return
+    
+    if args.sitemap:
+        mode_sitemap(manager, args)
+        return
+    
     # Vérification robots.txt
     if not manager.verifier_robots_txt(args.url, force=args.force):
         return
     
     # Options
-    options_scraping = {
-        'stealth_mode': args.stealth,
-        'delay': args.delay
-    }
+    options_scraping = options_depuis_arguments(args)
     
     try:
         scraper = manager.choisir_scraper(args.type, args.url)
         data = manager.scraper_avec_options(scraper, options_scraping)
         
-        if data and not args.no_clean:
-            data = manager.nettoyer_donnees(data, args.type)
+        data = nettoyer_selon_arguments(manager, args, data)
         
-        if data:
+        if data is not None and len(data):
             manager.exporter_donnees(data, args.output, args.format)
+        
+        if args.pool_stats:
+            get_pool_registry().print_stats()
+        
+        if args.selector_stats:
+            scraper.print_selector_stats()
+        
+        if args.fingerprint_stats:
+            afficher_stats_empreintes()
     
     except Exception as e:
         print(f"Erreur : {e}")
         sys.exit(1)
 
+def mode_lot(manager, args):
+    """Scrape toutes les URLs d'un fichier vers un export unique"""
+    try:
+        urls = lire_urls(args.urls_file)
+    except OSError as e:
+        print(f"Erreur : {e}")
+        sys.exit(1)
+    
+    if args.url:
+        urls.insert(0, args.url)
+    
+    if not urls:
+        print("❌ Aucune URL à scraper")
+        sys.exit(1)
+    
+    lancer_lot(manager, args, urls)
+
+def mode_sitemap(manager, args):
+    """Scrape les pages listées dans les sitemaps du site (modifiées depuis la dernière exécution)"""
+    # Sitemaps téléchargés avec les mêmes options (User-Agent, délai...) que les pages
+    scraper = manager.configurer_scraper(manager.choisir_scraper(args.type, args.url), options_depuis_arguments(args))
+    entrees, reportees, echecs = manager.decouvrir_urls_sitemap(
+        args.url,
+        depuis_derniere_execution=not args.sitemap_all,
+        limite=args.sitemap_limit,
+        scraper=scraper
+    )
+    if not entrees:
+        if echecs:
+            print("❌ Aucune page lue : sitemaps inaccessibles")
+            sys.exit(1)
+        print("✅ Aucune page nouvelle ou modifiée")
+        return
+    
+    resume = lancer_lot(manager, args, [page for page, _ in entrees])
+    manager.valider_sitemap(args.url, entrees, resume, reportees, echecs)
+
+def lancer_lot(manager, args, urls):
+    """Scrape un lot d'URLs vers un export unique, retourne le résumé"""
+    options_scraping = options_depuis_arguments(args)
+    
+    data, resume = manager.scraper_lot(
+        args.type,
+        urls,
+        options_scraping,
+        workers=args.workers,
+        nettoyer=False,
+        force=args.force
+    )
+    
+    # Nettoyage unique du lot combiné : --clean-workers et --columnar s'appliquent au volume total
+    data = nettoyer_selon_arguments(manager, args, data)
+    
+    if data is not None and len(data):
+        manager.exporter_donnees(data, args.output, args.format)
+    
+    manager.afficher_resume(resume)
+    
+    if args.pool_stats:
+        get_pool_registry().print_stats()
+    
+    if args.fingerprint_stats:
+        afficher_stats_empreintes()
+    
+    return resume
+
+def nettoyer_selon_arguments(manager, args, data):
+    """Nettoie les données selon --no-clean, --clean-workers et --columnar"""
+    if data and not args.no_clean:
+        return manager.nettoyer_donnees(data, args.type, workers=args.clean_workers or None,
+                                        colonnes=args.columnar)
+    if data and args.columnar:
+        return to_columns(data, clean_text=False)
+    return data
+
+def afficher_stats_empreintes():
+    """Affiche les pages inchangées détectées par empreinte de contenu"""
+    config = load_scraping_config()
+    get_fingerprint_store(config.cache_path('fingerprints.directory', 'fingerprints')).print_stats()
+
+def options_depuis_arguments(args):
+    """Options de scraping correspondant aux arguments de la ligne de commande"""
+    return {
+        'stealth_mode': args.stealth,
+        'delay': args.delay,
+        'respect_robots': not args.force,
+        'cache': args.cache,
+        'parser': args.parser,
+        'stream': args.stream,
+        'templates': not args.no_templates,
+        'structured_data': not args.no_structured_data,
+        'max_pages': args.pages,
+        'crawl_depth': args.crawl_depth,
+        'crawl_max_pages': args.crawl_max_pages,
+        'crawl_scope': args.scope,
+        'fingerprints': False if args.no_fingerprints else (True if args.fingerprints else None)
+    }
+
 def main():
     """Point d'entrée principal"""
     if len(sys.argv) > 1:
@@ -0,0 +1,131 @@
+# scraper/async_scraper.py
+
+import asyncio
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from scraper.base_scraper import BaseScraper
+
+class AsyncBaseScraper(BaseScraper):
+    """Scraper capable de récupérer un lot d'URLs en parallèle avec asyncio"""
+
+    def __init__(self, site_url, user_agent=None):
+        super().__init__(site_url, user_agent)
+
+        # Limites de concurrence (globale et par hôte)
+        self.max_concurrency = 10
+        self.max_per_host = 2
+
+        # Code HTTP par URL du dernier fetch_many (None : sans réponse ou cache)
+        self.last_statuses = {}
+
+    def set_concurrency(self, max_concurrency=None, max_per_host=None):
+        """Configure les limites de requêtes simultanées"""
+        if max_concurrency:
+            self.max_concurrency = max(1, int(max_concurrency))
+        if max_per_host:
+            self.max_per_host = max(1, int(max_per_host))
+        print(f"⚡ Concurrence : {self.max_concurrency} requêtes max, {self.max_per_host} par hôte")
+
+    async def fetch_many_async(self, urls, max_concurrency=None, max_per_host=None):
+        """
+        Récupère plusieurs URLs en parallèle
+
+        Les requêtes passent par `get_html_requests` (headers furtifs, rotation
+        du User-Agent) exécuté dans un pool de threads ; asyncio se charge de
+        l'ordonnancement, du délai par hôte et des limites de concurrence.
+        `last_status_code` étant propre à chaque thread, celui de l'appelant
+        n'est pas modifié : les codes HTTP sont rangés par URL dans
+        `last_statuses`.
+
+        Returns:
+            Dictionnaire {url: contenu HTML ou None}, dans l'ordre des URLs
+        """
+        max_concurrency = max_concurrency or self.max_concurrency
+        max_per_host = max_per_host or self.max_per_host
+
+        # Supprimer les doublons en conservant l'ordre
+        urls = list(dict.fromkeys(urls))
+        self.last_statuses = {}
+        if not urls:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        global_semaphore = asyncio.Semaphore(max_concurrency)
+        host_semaphores = {}
+        statuses = {}
+
+        async def fetch_one(url, executor):
+            host = urllib.parse.urlparse(url).netloc
+            host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(max_per_host))
+
+            # Page fraîche en cache : ni délai ni requête
+            if self.http_cache:
+                html = self.http_cache.get_fresh(url, count_miss=False)
+                if html is not None:
+                    return html
+
+            # Attendre d'abord la place sur l'hôte pour ne pas bloquer
+            # un créneau global pendant qu'un hôte est saturé
+            async with host_semaphore:
+                # Le délai par hôte est respecté sans occuper de thread
+                await self.apply_delay_async(url)
+                async with global_semaphore:
+                    return await loop.run_in_executor(executor, fetch_in_thread, url)
+
+        def fetch_in_thread(url):
+            html = self.get_html_requests(url, throttle=False)
+            # Lu dans le thread qui a fait la requête
+            statuses[url] = self.last_status_code
+            return html
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            results = await asyncio.gather(
+                *(fetch_one(url, executor) for url in urls),
+                return_exceptions=True
+            )
+
+        pages = {}
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                print(f"[Exception] {url} : {result}")
+                result = None
+            pages[url] = result
+        self.last_statuses = {url: statuses.get(url) for url in urls}
+        return pages
+
+    def fetch_many(self, urls, max_concurrency=None, max_per_host=None):
+        """Version synchrone de `fetch_many_async` (hors d'une boucle asyncio)"""
+        return asyncio.run(self.fetch_many_async(urls, max_concurrency, max_per_host))
+
+    def scrape_many(self, urls, max_concurrency=None, max_per_host=None):
+        """
+        Scrape un lot d'URLs : téléchargement concurrent puis extraction
+        avec la logique `scrape_html` du scraper
+
+        Returns:
+            Dictionnaire {url: liste des éléments extraits}
+        """
+        urls = list(dict.fromkeys(urls))
+        print(f"🚀 Récupération de {len(urls)} URLs en parallèle...")
+        pages = self.fetch_many(urls, max_concurrency, max_per_host)
+
+        resultats = {}
+        url_origine = self.site_url
+        try:
+            for url in urls:
+                html = pages.get(url)
+                if not html:
+                    print(f"❌ Échec de la récupération : {url}")
+                    resultats[url] = []
+                    continue
+
+                # Les extracteurs résolvent les liens relatifs via `site_url`
+                self.site_url = url
+                resultats[url] = self.scrape_fetched(html)
+        finally:
+            self.site_url = url_origine
+
+        total = sum(len(items) for items in resultats.values())
+        print(f"✅ {total} éléments extraits depuis {len(urls)} URLs")
+        return resultats
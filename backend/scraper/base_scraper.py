@@ -1,13 +1,27 @@
 # scraper/base_scraper.py
 
 import urllib.request
+import json
 import urllib.parse
 from urllib.error import URLError, HTTPError
-from bs4 import BeautifulSoup
 import time
 import random
+import threading
 import requests
 from fake_useragent import UserAgent
+from scraper.parsers import parse_document, resolve_backend
+from scraper.selector_cascade import get_cascade
+from scraper.streaming import ContainerStreamParser, decode_chunks
+from scraper.structure_detector import group_selector
+from utils.rate_limiter import get_rate_limiter
+from utils.http_cache import get_http_cache
+from utils.http_pool import get_pool_registry
+from utils.fingerprint import content_fingerprint, get_fingerprint_store
+from utils.robot_check import get_crawl_delay
+from utils.selector_stats import TrackedCascade, get_selector_stats
+from utils.template_store import get_template_store
+from utils.retry import RETRY_STATUSES, RetryableError, backoff_delay, get_circuit_breaker, parse_retry_after
+from config.scraper_config import load_scraping_config
 
 class BaseScraper:
     def __init__(self, site_url, user_agent=None):
@@ -18,9 +32,66 @@ class BaseScraper:
         # Options pour le mode furtif
         self.stealth_mode = False
         self.delay = 0
+        self.burst = 1
+        self.rate_limiter = get_rate_limiter()
+        self.http_cache = None
         self.session = requests.Session()
         self.ua_generator = None
         
+        # Nouveaux essais et disjoncteur, pilotés par la configuration
+        config = load_scraping_config()
+        self.max_retries = config.get('general.max_retries', 3)
+        self.timeout = config.get('general.timeout', 30)
+        self.backoff_base = config.get('general.backoff_base', 0.5)
+        self.backoff_max = config.get('general.backoff_max', 30)
+        # Dernière réponse reçue, propre à chaque thread (fetch_many récupère
+        # les pages en parallèle sur les mêmes instances)
+        self._last_response = threading.local()
+        self.circuit_breaker = get_circuit_breaker()
+        self.circuit_breaker.configure(
+            config.get('general.circuit_failure_threshold'),
+            config.get('general.circuit_reset_timeout')
+        )
+        
+        # Pools de connexions partagés entre toutes les instances (keep-alive)
+        self.pool_registry = get_pool_registry()
+        self.pool_registry.configure(
+            config.get('connection_pool.pool_connections'),
+            config.get('connection_pool.pool_maxsize'),
+            config.get('connection_pool.host_pool_sizes')
+        )
+        if config.get('connection_pool.http2') and not self.pool_registry.http2_enabled:
+            self.pool_registry.enable_http2()
+        self.pool_registry.mount(self.session)
+        
+        # Backend de parsing HTML (html.parser, lxml, html5lib, selectolax)
+        self.parser_backend = resolve_backend(config.get('parsing.backend', 'html.parser'))
+        self.use_structured_data = config.get('parsing.structured_data', True)
+        
+        # Taux de succès des sélecteurs par hôte (réordonnancement des cascades),
+        # conservés d'une exécution à l'autre
+        self.selector_stats = get_selector_stats(
+            config.cache_path('selector_stats.path', 'selector_stats.json')
+            if config.get('selector_stats.persist', True) else None
+        )
+        
+        # Sélecteurs appris par hôte, réutilisés d'une exécution à l'autre
+        self.template_store = None
+        if config.get('templates.enabled', True):
+            self.template_store = get_template_store(config.cache_path('templates.path', 'templates.json'))
+        
+        # Résultats réutilisés quand une page n'a pas changé (empreinte du contenu, sur option)
+        self.fingerprint_store = None
+        if config.get('fingerprints.enabled', False):
+            self.enable_fingerprints()
+        
+        # Régions utiles de la page (sélecteurs simples) pour un parsing partiel
+        self.parse_regions = None
+        
+        # Mémo des réponses : une exécution logique = un téléchargement et un parsing
+        self.memo_ttl = 300
+        self._memo = {}
+        
         # Initialiser fake_useragent si disponible
         try:
             self.ua_generator = UserAgent()
@@ -52,11 +123,34 @@ class BaseScraper:
         parsed_url = urllib.parse.urlparse(self.site_url)
         self.session.headers['Referer'] = f"https://www.google.com/search?q={parsed_url.netloc}"
     
-    def set_delay(self, delay):
-        """Définit le délai entre les requêtes"""
+    def set_delay(self, delay, burst=None):
+        """Définit le délai entre les requêtes vers un même hôte"""
         self.delay = delay
+        if burst:
+            self.burst = burst
         print(f"⏱️ Délai configuré : {delay}s")
     
+    def use_robots_delay(self, user_agent='*'):
+        """Aligne le délai sur le Crawl-delay / Request-rate de robots.txt s'il est plus long"""
+        robots_delay = get_crawl_delay(self.site_url, user_agent)
+        if robots_delay and robots_delay > self.delay:
+            print(f"🤖 Délai imposé par robots.txt : {robots_delay}s")
+            self.delay = robots_delay
+        return robots_delay
+    
+    def set_parser_backend(self, backend):
+        """Choisit le backend de parsing HTML ('auto' pour le plus rapide installé)"""
+        self.parser_backend = resolve_backend(backend)
+        print(f"🧩 Parser HTML : {self.parser_backend}")
+    
+    def enable_cache(self, directory=None, max_size_mb=None):
+        """Active le cache HTTP sur disque (revalidation ETag / Last-Modified, section 'http_cache')"""
+        config = load_scraping_config()
+        directory = directory or config.cache_path('http_cache.directory', 'http')
+        max_size_mb = max_size_mb or config.get('http_cache.max_size_mb', 200)
+        self.http_cache = get_http_cache(directory, max_size_mb)
+        print(f"💾 Cache HTTP activé ({directory}, {max_size_mb} Mo max)")
+    
     def set_user_agent(self, user_agent):
         """Définit un User-Agent personnalisé"""
         self.current_user_agent = user_agent
@@ -81,17 +175,20 @@ class BaseScraper:
         ]
         return random.choice(user_agents)
     
-    def apply_delay(self):
-        """Applique un délai avant la requête"""
+    def _delay_jitter(self):
+        """Variation aléatoire du délai en mode furtif"""
+        return (-0.5, 1.0) if self.stealth_mode else None
+    
+    def apply_delay(self, url=None):
+        """Applique le délai de l'hôte ciblé avant la requête"""
         if self.delay > 0:
-            if self.stealth_mode:
-                # Délai aléatoire en mode furtif
-                actual_delay = self.delay + random.uniform(-0.5, 1.0)
-                actual_delay = max(0.1, actual_delay)  # Minimum 0.1s
-            else:
-                actual_delay = self.delay
-            
-            time.sleep(actual_delay)
+            # Limiteur partagé par hôte : seul l'hôte ciblé est ralenti
+            self.rate_limiter.acquire(url or self.site_url, self.delay, self.burst, self._delay_jitter())
+    
+    async def apply_delay_async(self, url=None):
+        """Équivalent asyncio de `apply_delay`"""
+        if self.delay > 0:
+            await self.rate_limiter.acquire_async(url or self.site_url, self.delay, self.burst, self._delay_jitter())
     
     def get_html_urllib(self):
         """Méthode originale avec urllib (fallback)"""
@@ -99,7 +196,7 @@ class BaseScraper:
             headers = {'User-Agent': self.current_user_agent}
             req = urllib.request.Request(self.site_url, headers=headers)
             
-            with urllib.request.urlopen(req, timeout=30) as response:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
                 return response.read()
                 
         except HTTPError as e:
@@ -110,67 +207,495 @@ class BaseScraper:
             print(f"[Exception] {str(e)}")
         return None
     
-    def get_html_requests(self):
-        """Méthode améliorée avec requests et mode furtif"""
-        try:
-            # Appliquer le délai
-            self.apply_delay()
-            
-            # Headers dynamiques en mode furtif
-            if self.stealth_mode:
-                self.session.headers['User-Agent'] = self.get_random_user_agent()
-            else:
-                self.session.headers['User-Agent'] = self.current_user_agent
-            
-            # Faire la requête
-            response = self.session.get(
-                self.site_url,
-                timeout=30,
-                allow_redirects=True
-            )
-            
-            response.raise_for_status()  # Lève une exception pour les codes d'erreur HTTP
-            
-            return response.content
+    @property
+    def last_status_code(self):
+        """Code HTTP de la dernière requête de ce thread (None sans réponse)"""
+        return getattr(self._last_response, 'status_code', None)
+    
+    @last_status_code.setter
+    def last_status_code(self, value):
+        self._last_response.status_code = value
+    
+    @property
+    def last_response_headers(self):
+        """Headers de la dernière réponse de ce thread"""
+        return getattr(self._last_response, 'headers', None)
+    
+    @last_response_headers.setter
+    def last_response_headers(self, value):
+        self._last_response.headers = value
+    
+    def build_request_headers(self):
+        """Construit les headers propres à une requête (rotation du User-Agent)"""
+        if self.stealth_mode:
+            return {'User-Agent': self.get_random_user_agent()}
+        return {'User-Agent': self.current_user_agent}
+    
+    def get_html_requests(self, url=None, throttle=True, stream=False):
+        """
+        Méthode améliorée avec requests, mode furtif et nouveaux essais
+        
+        Avec `stream=True`, retourne la réponse ouverte (corps non lu) au lieu
+        de son contenu, sans passer par le cache HTTP ; l'appelant la ferme.
+        """
+        url = url or self.site_url
+        self.last_status_code = None
+        self.last_response_headers = None
+        
+        # Réponse encore fraîche en cache : pas de requête réseau
+        cache_entry = None
+        if self.http_cache and not stream:
+            html = self.http_cache.get_fresh(url)
+            if html is not None:
+                return html
+            cache_entry = self.http_cache.lookup(url)
+        
+        for attempt in range(self.max_retries + 1):
+            # Hôte en échec répété : ne pas insister
+            if not self.circuit_breaker.allow(url):
+                print(f"⛔ Hôte indisponible, requête ignorée : {url}")
+                return None
             
-        except requests.exceptions.HTTPError as e:
-            print(f"[HTTPError] {e.response.status_code} - {e}")
-        except requests.exceptions.ConnectionError as e:
-            print(f"[ConnectionError] {e}")
-        except requests.exceptions.Timeout as e:
-            print(f"[Timeout] {e}")
-        except requests.exceptions.RequestException as e:
-            print(f"[RequestException] {e}")
-        except Exception as e:
-            print(f"[Exception] {str(e)}")
+            retry_after = None
+            try:
+                # Appliquer le délai (sauf si l'appelant l'a déjà fait)
+                if throttle or attempt > 0:
+                    self.apply_delay(url)
+                
+                # Headers dynamiques en mode furtif (passés par requête pour
+                # pouvoir partager la session entre plusieurs threads)
+                headers = self.build_request_headers()
+                if cache_entry:
+                    headers.update(self.http_cache.conditional_headers(cache_entry))
+                
+                # Faire la requête
+                response = self.session.get(
+                    url,
+                    headers=headers,
+                    timeout=self.timeout,
+                    allow_redirects=True,
+                    stream=stream
+                )
+                
+                # Page inchangée depuis la dernière visite
+                if response.status_code == 304 and self.http_cache:
+                    html = self.http_cache.revalidated(cache_entry, response.headers) if cache_entry else None
+                    if html is not None:
+                        self.last_status_code = response.status_code
+                        self.last_response_headers = response.headers
+                        self.circuit_breaker.record_success(url)
+                        return html
+                    
+                    # Corps en cache disparu (éviction par un autre thread...) : un
+                    # 304 ne peut pas être servi, redemander la page sans validateurs
+                    print(f"♻️ Corps en cache introuvable, nouvelle requête complète : {url}")
+                    response.close()
+                    self.http_cache.remove(url)
+                    cache_entry = None
+                    response = self.session.get(
+                        url,
+                        headers=self.build_request_headers(),
+                        timeout=self.timeout,
+                        allow_redirects=True,
+                        stream=stream
+                    )
+                
+                self.last_status_code = response.status_code
+                self.last_response_headers = response.headers
+                
+                if response.status_code in RETRY_STATUSES:
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    self.circuit_breaker.record_failure(url, retry_after)
+                    if attempt < self.max_retries:
+                        response.close()
+                        raise RetryableError(f"{response.status_code} - {response.reason}")
+                else:
+                    # L'hôte répond, même si c'est une erreur définitive (404...)
+                    self.circuit_breaker.record_success(url)
+                
+                if stream and not response.ok:
+                    response.close()
+                response.raise_for_status()  # Lève une exception pour les codes d'erreur HTTP
+                
+                if stream:
+                    return response
+                
+                # Un 304 n'a pas de corps : ne jamais l'enregistrer
+                if self.http_cache and response.status_code != 304:
+                    self.http_cache.store(url, response.headers, response.content)
+                
+                return response.content
+                
+            except (RetryableError, requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not isinstance(e, RetryableError):
+                    print(f"[{type(e).__name__}] {e}")
+                    self.circuit_breaker.record_failure(url)
+                    if attempt >= self.max_retries:
+                        return None
+                
+                # Attente imposée trop longue : laisser le disjoncteur gérer l'hôte
+                if retry_after is not None and retry_after > self.backoff_max:
+                    print(f"⏳ Retry-After de {retry_after:.0f}s, abandon : {url}")
+                    return None
+                
+                wait = backoff_delay(attempt, self.backoff_base, self.backoff_max, retry_after)
+                print(f"🔁 Nouvel essai {attempt + 1}/{self.max_retries} dans {wait:.1f}s ({e})")
+                time.sleep(wait)
+            except requests.exceptions.HTTPError as e:
+                print(f"[HTTPError] {e.response.status_code} - {e}")
+                return None
+            except requests.exceptions.RequestException as e:
+                # Boucle de redirections, URL invalide... : un échec pour le disjoncteur
+                print(f"[RequestException] {e}")
+                self.circuit_breaker.record_failure(url)
+                return None
+            except Exception as e:
+                print(f"[Exception] {str(e)}")
+                # Sans réponse de l'hôte, la tentative compte comme un échec
+                if self.last_status_code is None:
+                    self.circuit_breaker.record_failure(url)
+                return None
         return None
     
+    def set_memo_ttl(self, ttl):
+        """Durée de validité (secondes) du mémo des réponses, 0 pour le désactiver"""
+        self.memo_ttl = ttl
+        if not ttl:
+            self.invalidate_memo()
+    
+    def invalidate_memo(self, url=None):
+        """Oublie la réponse mémorisée d'une URL (ou de toutes)"""
+        if url is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(url, None)
+    
+    def _get_memo(self, url):
+        """Entrée du mémo encore valide pour une URL (ou None)"""
+        entry = self._memo.get(url)
+        if entry is None:
+            return None
+        if time.monotonic() - entry['time'] > self.memo_ttl:
+            self._memo.pop(url, None)
+            return None
+        return entry
+    
     def get_html(self):
         """Point d'entrée principal pour récupérer le HTML"""
+        entry = self._get_memo(self.site_url)
+        if entry:
+            return entry['html']
+        
         if self.stealth_mode:
-            return self.get_html_requests()
+            html = self.get_html_requests()
         else:
-            # Essayer d'abord avec requests, fallback sur urllib
+            # Essayer d'abord avec requests, fallback sur urllib uniquement si
+            # le serveur n'a jamais répondu (inutile de retélécharger une erreur HTTP)
             html = self.get_html_requests()
-            if html is None:
+            if html is None and self.last_status_code is None and self.circuit_breaker.allow(self.site_url):
                 print("🔄 Tentative avec urllib...")
                 html = self.get_html_urllib()
-            return html
+        
+        if html and self.memo_ttl:
+            self._memo[self.site_url] = {
+                'time': time.monotonic(),
+                'html': html,
+                'soups': {},
+                'status': self.last_status_code,
+                'headers': self.last_response_headers
+            }
+        return html
     
-    def get_soup(self):
-        """Récupère et parse le HTML avec BeautifulSoup"""
-        html = self.get_html()
+    def parse_html(self, html, partial=True):
+        """
+        Parse un contenu HTML déjà récupéré avec le backend configuré
+        
+        Si le scraper déclare des `parse_regions`, seuls ces sous-arbres sont
+        construits (`partial=False` pour forcer l'arbre complet).
+        """
         if html:
+            regions = self.parse_regions if partial else None
+            memo_key = (self.parser_backend, bool(regions))
+            
+            # Réutiliser l'arbre déjà construit pour la page mémorisée
+            entry = self._get_memo(self.site_url)
+            if entry and entry['html'] is html and memo_key in entry['soups']:
+                return entry['soups'][memo_key]
+            
             try:
-                return BeautifulSoup(html, 'html.parser')
+                soup = parse_document(html, self.parser_backend, regions)
+                
+                # Aucune région trouvée : la page n'a pas la structure attendue
+                if regions and soup is not None and soup.find() is None:
+                    print("⚠️ Régions attendues absentes, parsing complet de la page")
+                    soup = parse_document(html, self.parser_backend)
             except Exception as e:
-                print(f"[BeautifulSoup Error] {e}")
+                print(f"[Parser Error] {self.parser_backend} : {e}")
                 return None
+            
+            if entry and entry['html'] is html:
+                entry['soups'][memo_key] = soup
+            return soup
         return None
     
+    def get_soup(self):
+        """Récupère et parse le HTML complet"""
+        return self.parse_html(self.get_html(), partial=False)
+    
+    def get_cascades(self, *fields, template=None):
+        """
+        Cascades compilées pour des champs de `self.selectors` (défini par les classes filles)
+        
+        Les sélecteurs sont réordonnés selon leur taux de succès sur l'hôte.
+        Avec un modèle appris, son sélecteur passe en tête de cascade : le
+        parcours s'arrête dès qu'il correspond.
+        """
+        host = self._template_host()
+        learned = (template or {}).get('fields', {})
+        cascades = {}
+        for field in fields:
+            # Ordre observé sur l'hôte, l'ordre statique servant de départage
+            selectors = self.selector_stats.order(host, field, self.selectors[field])
+            if learned.get(field):
+                selectors = [learned[field]] + [s for s in selectors if s != learned[field]]
+            cascades[field] = TrackedCascade(get_cascade(selectors), self.selector_stats, host, field)
+        return cascades
+    
+    def print_selector_stats(self):
+        """Affiche les taux de succès des sélecteurs pour l'hôte courant"""
+        host = self._template_host()
+        report = self.selector_stats.report(host)
+        
+        print(f"\n🎯 SÉLECTEURS POUR {host}")
+        print("=" * 50)
+        if not report:
+            print("   Aucune statistique (aucun scraping sur cet hôte)")
+            return
+        
+        for field, (probes, hits) in sorted(report.items()):
+            print(f"📌 {field} ({probes} essais)")
+            static_order = self.selectors.get(field, [])
+            for selector, count in hits:
+                rank = static_order.index(selector) + 1 if selector in static_order else '-'
+                print(f"   {selector}: {count} succès ({count / probes:.0%}), rang statique {rank}")
+            misses = probes - sum(count for _, count in hits)
+            if misses:
+                print(f"   (aucun sélecteur) : {misses} échecs")
+    
+    def disable_templates(self):
+        """Désactive les modèles d'extraction appris"""
+        self.template_store = None
+    
+    def _template_host(self):
+        return urllib.parse.urlparse(self.site_url).netloc.lower()
+    
+    def find_containers(self, soup, kind, selectors, detect=None):
+        """
+        Conteneurs d'un type de contenu : modèle appris pour l'hôte, puis
+        sélecteurs standards, puis détection automatique (`detect(soup)`)
+        
+        Un modèle qui ne correspond plus est oublié dès qu'une autre méthode
+        trouve des conteneurs (il sera réappris) ; une page vide le conserve.
+        
+        Returns:
+            (conteneurs, sélecteur des conteneurs ou None, modèle ou None)
+        """
+        host = self._template_host()
+        template = None
+        if self.template_store:
+            template = self.template_store.get(host, kind)
+        if template:
+            containers = soup.select(template['container'])
+            if containers:
+                print(f"📐 Modèle mémorisé pour {host} : '{template['container']}'")
+                return containers, template['container'], template
+            print(f"⚠️ Le modèle mémorisé ({template['container']}) ne correspond pas à cette page")
+        
+        containers, selector = self._find_containers_without_template(soup, host, kind, selectors, detect)
+        if template and containers:
+            self.template_store.forget(host, kind)
+        return containers, selector, None
+    
+    def _find_containers_without_template(self, soup, host, kind, selectors, detect):
+        # Chaque sélecteur raté coûte un parcours complet : les plus fructueux d'abord
+        for selector in self.selector_stats.order(host, kind, selectors):
+            containers = soup.select(selector)
+            if containers:
+                self.selector_stats.record(host, kind, selector)
+                return containers, selector
+        self.selector_stats.record(host, kind, None)
+        
+        if detect is None:
+            return [], None
+        
+        containers = detect(soup)
+        if not containers:
+            return [], None
+        
+        # Le sélecteur du groupe détecté n'est mémorisable que s'il ne désigne que lui
+        selector = group_selector(containers)
+        if len(soup.select(selector)) != len(containers):
+            selector = None
+        return containers, selector
+    
+    def learn_template(self, kind, container_selector, cascades, containers, sample=5):
+        """Mémorise les sélecteurs qui ont effectivement trouvé les conteneurs et les champs"""
+        if not self.template_store or not container_selector or not containers:
+            return
+        
+        fields = {}
+        for field, cascade in cascades.items():
+            # Cascade brute : ces essais ne comptent pas dans les statistiques
+            cascade = getattr(cascade, 'cascade', cascade)
+            for item in containers[:sample]:
+                _, index = cascade.first_with_index(item)
+                if index is not None:
+                    fields[field] = cascade.selectors[index]
+                    break
+        
+        if self.template_store.learn(self._template_host(), kind, container_selector, fields):
+            print(f"📐 Modèle appris pour {self._template_host()} : '{container_selector}'")
+    
     def scrape(self):
+        """Récupère la page de `site_url` et en extrait les données"""
+        html = self.get_html()
+        if not html:
+            print("❌ Impossible de récupérer le contenu HTML")
+            return []
+        return self.scrape_fetched(html)
+    
+    def scrape_fetched(self, html):
+        """
+        Extrait les données d'une page de `site_url` déjà téléchargée
+        
+        Si les empreintes sont activées et que le contenu (hors parties
+        volatiles : commentaires, jetons CSRF...) et les réglages d'extraction
+        sont identiques à la dernière visite, les résultats mémorisés sont
+        retournés sans parsing ni extraction.
+        """
+        if not self.fingerprint_store:
+            records = self.scrape_html(html)
+            self.selector_stats.save()
+            return records
+        
+        fingerprint = content_fingerprint(html, self._fingerprint_scope())
+        records = self.fingerprint_store.lookup(self.site_url, fingerprint)
+        if records is not None:
+            print(f"♻️ Page inchangée, {len(records)} éléments réutilisés")
+            return records
+        
+        records = self.scrape_html(html)
+        self.selector_stats.save()
+        if records:
+            self.fingerprint_store.store(self.site_url, fingerprint, records)
+        return records
+    
+    def _fingerprint_scope(self):
+        """
+        Réglages qui changent les résultats d'une même page (clé de l'empreinte)
+        
+        Les sélecteurs y figurent dans l'ordre effectif des cascades (taux de
+        succès sur l'hôte) : quand les statistiques réordonnent une cascade, la
+        page est réextraite, plusieurs sélecteurs pouvant correspondre.
+        """
+        host = self._template_host()
+        templates = self.template_store.host_templates(host) if self.template_store else None
+        selectors = {
+            field: self.selector_stats.order(host, field, values) if isinstance(values, (list, tuple)) else values
+            for field, values in (getattr(self, 'selectors', None) or {}).items()
+        }
+        return json.dumps({
+            'scraper': type(self).__name__,
+            'selectors': selectors,
+            'structured_data': self.use_structured_data,
+            'parser': self.parser_backend,
+            'regions': self.parse_regions,
+            'templates': templates
+        }, sort_keys=True, default=str)
+    
+    def enable_fingerprints(self):
+        """Réutilise les résultats des pages inchangées (section 'fingerprints' de la configuration)"""
+        config = load_scraping_config()
+        self.fingerprint_store = get_fingerprint_store(config.cache_path('fingerprints.directory', 'fingerprints'))
+    
+    def disable_fingerprints(self):
+        """Désactive la réutilisation des résultats des pages inchangées"""
+        self.fingerprint_store = None
+    
+    def scrape_html(self, html):
         """Méthode abstraite à implémenter dans les classes filles"""
-        raise NotImplementedError("La méthode `scrape` doit être définie dans la classe fille.")
+        raise NotImplementedError("La méthode `scrape_html` doit être définie dans la classe fille.")
+    
+    def iter_html_chunks(self, url=None, chunk_size=16384):
+        """Télécharge une page morceau par morceau (texte décodé)"""
+        url = url or self.site_url
+        
+        # Réponse fraîche en cache : un seul morceau, sans requête
+        if self.http_cache:
+            html = self.http_cache.get_fresh(url)
+            if html is not None:
+                yield from decode_chunks([html])
+                return
+        
+        response = self.get_html_requests(url, stream=True)
+        if response is None:
+            return
+        
+        # Charset déclaré par le serveur, sinon UTF-8 (pas le latin-1 par défaut de requests)
+        content_type = response.headers.get('Content-Type', '')
+        encoding = response.encoding if 'charset' in content_type.lower() else None
+        with response:
+            yield from decode_chunks(response.iter_content(chunk_size), encoding)
+    
+    def stream_containers(self, watchers, url=None):
+        """
+        Parse la page pendant son téléchargement et produit (type, conteneur)
+        dès que chaque conteneur est refermé
+        
+        Les fragments sont parsés avec html.parser, qui ne réorganise pas
+        l'arbre (un <tr> isolé reste un <tr>) et retourne des Tag bs4.
+        """
+        parser = ContainerStreamParser(watchers)
+        for text in self.iter_html_chunks(url):
+            parser.feed(text)
+            for kind, fragment in parser.drain():
+                yield kind, parse_document(fragment, 'html.parser').find()
+        
+        parser.close()
+        for kind, fragment in parser.drain():
+            yield kind, parse_document(fragment, 'html.parser').find()
+    
+    def scrape_stream(self, url=None):
+        """
+        Mode streaming : produit les enregistrements au fil du téléchargement
+        
+        Les classes filles déclarent les conteneurs à surveiller
+        (`stream_watchers`) et la façon d'en extraire un enregistrement
+        (`extract_streamed`). Pas de détection automatique dans ce mode.
+        """
+        counts = {}
+        for kind, item in self.stream_containers(self.stream_watchers(), url):
+            index = counts.get(kind, 0)
+            counts[kind] = index + 1
+            try:
+                record = self.extract_streamed(kind, item, index)
+            except Exception as e:
+                print(f"⚠️ Erreur lors de l'extraction ({kind} {index + 1}): {e}")
+                continue
+            if record:
+                yield record
+        
+        self.selector_stats.save()
+        if not counts:
+            print("⚠️ Aucun conteneur trouvé en streaming (essayez le mode normal)")
+    
+    def stream_watchers(self):
+        """Conteneurs à surveiller en streaming : {type: [sélecteurs]}"""
+        raise NotImplementedError("Le mode streaming n'est pas disponible pour ce scraper.")
+    
+    def extract_streamed(self, kind, item, index):
+        """Extrait un enregistrement d'un conteneur reçu en streaming"""
+        raise NotImplementedError("Le mode streaming n'est pas disponible pour ce scraper.")
     
     def test_connection(self):
         """Teste la connexion au site"""
@@ -189,20 +714,25 @@ class BaseScraper:
         if hasattr(self.session, 'cookies') and self.session.cookies:
             print(f"🍪 Cookies reçus : {len(self.session.cookies)}")
         
-        # Faire une requête HEAD pour obtenir les headers
-        try:
-            response = self.session.head(self.site_url, timeout=10)
-            print(f"📊 Status: {response.status_code}")
-            print(f"📋 Headers reçus : {len(response.headers)}")
-            
-            # Headers intéressants
-            interesting_headers = ['server', 'x-powered-by', 'cloudflare-ray-id', 'cf-ray']
-            for header in interesting_headers:
-                if header in response.headers:
-                    print(f"   {header}: {response.headers[header]}")
-                    
-        except Exception as e:
-            print(f"⚠️ Impossible d'obtenir les infos de réponse : {e}")
+        # Réutiliser les headers de la page déjà téléchargée plutôt qu'un HEAD
+        if not self.get_html():
+            print("⚠️ Impossible d'obtenir les infos de réponse")
+            return
+        
+        entry = self._get_memo(self.site_url) or {}
+        headers = entry.get('headers')
+        if entry.get('status'):
+            print(f"📊 Status: {entry['status']}")
+        if headers is None:
+            print("📋 Headers non disponibles (réponse servie par le cache)")
+            return
+        print(f"📋 Headers reçus : {len(headers)}")
+        
+        # Headers intéressants
+        interesting_headers = ['server', 'x-powered-by', 'cloudflare-ray-id', 'cf-ray']
+        for header in interesting_headers:
+            if header in headers:
+                print(f"   {header}: {headers[header]}")
 
     def save_html_debug(self, filename="debug.html"):
         """Sauvegarde le HTML pour débogage"""
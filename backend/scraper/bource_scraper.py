@@ -1,10 +1,14 @@
 # scraper/bource_scraper.py
 
-from scraper.base_scraper import BaseScraper
+from scraper.async_scraper import AsyncBaseScraper
+from scraper.structure_detector import detect_record_group
+from scraper.structured_data import extract_articles, extract_quotes
+from utils.records import NewsItem, Quote
 import re
 from datetime import datetime
+from urllib.parse import urljoin
 
-class BourseScraper(BaseScraper):
+class BourseScraper(AsyncBaseScraper):
     def __init__(self, site_url, user_agent=None):
         super().__init__(site_url, user_agent)
         
@@ -96,162 +100,166 @@ class BourseScraper(BaseScraper):
         """Scrape les actualités financières"""
         print("📰 Recherche d'actualités financières...")
         
-        news_containers = self.find_elements_by_selectors(soup, self.selectors['news_containers'])
+        # Modèle appris, sélecteurs standards puis détection automatique
+        news_containers, container_selector, template = self.find_containers(
+            soup, 'news_containers', self.selectors['news_containers'], self._detect_news
+        )
         
-        if not news_containers:
-            print("⚠️ Aucun conteneur d'actualités trouvé avec les sélecteurs standards")
-            # Tentative de détection automatique
-            news_containers = self.auto_detect_news(soup)
+        # Cascades de sélecteurs compilées une seule fois
+        cascades = self.get_cascades('news_title', 'news_description', template=template)
         
         actualites = []
         for i, item in enumerate(news_containers):
             try:
-                # Extraire le titre
-                title_element = None
-                for selector in self.selectors['news_title']:
-                    title_element = item.select_one(selector)
-                    if title_element:
-                        break
-                
-                titre = title_element.get_text(strip=True) if title_element else f"Actualité {i+1}"
-                
-                # Extraire la description
-                desc_element = None
-                for selector in self.selectors['news_description']:
-                    desc_element = item.select_one(selector)
-                    if desc_element:
-                        break
-                
-                description = desc_element.get_text(strip=True) if desc_element else ""
-                
-                # Extraire des métadonnées supplémentaires
-                date_element = item.select_one('.date, .timestamp, time, [datetime]')
-                date_str = ""
-                if date_element:
-                    date_str = date_element.get_text(strip=True) or date_element.get('datetime', '')
-                
-                link_element = item.select_one('a')
-                link = ""
-                if link_element:
-                    link = link_element.get('href', '')
-                    if link and not link.startswith('http'):
-                        # URL relative, construire l'URL complète
-                        from urllib.parse import urljoin
-                        link = urljoin(self.site_url, link)
-                
-                actualite = {
-                    "titre": titre,
-                    "description": description,
-                    "date": date_str,
-                    "lien": link,
-                    "index": i + 1
-                }
-                
-                actualites.append(actualite)
-                
+                actualites.append(self.extract_news_item(item, i, cascades))
             except Exception as e:
                 print(f"⚠️ Erreur lors de l'extraction de l'actualité {i+1}: {e}")
                 continue
         
+        if actualites:
+            self.learn_template('news_containers', container_selector, cascades, news_containers)
+        
         return actualites
     
+    def _detect_news(self, soup):
+        print("⚠️ Aucun conteneur d'actualités trouvé avec les sélecteurs standards")
+        # Tentative de détection automatique
+        return self.auto_detect_news(soup)
+    
+    def extract_news_item(self, item, i, cascades):
+        """Extrait une actualité d'un conteneur (i : position dans la page)"""
+        # Extraire le titre
+        title_element = cascades['news_title'].first(item)
+        
+        titre = title_element.get_text(strip=True) if title_element else f"Actualité {i+1}"
+        
+        # Extraire la description
+        desc_element = cascades['news_description'].first(item)
+        
+        description = desc_element.get_text(strip=True) if desc_element else ""
+        
+        # Extraire des métadonnées supplémentaires
+        date_element = item.select_one('.date, .timestamp, time, [datetime]')
+        date_str = ""
+        if date_element:
+            date_str = date_element.get_text(strip=True) or date_element.get('datetime', '')
+        
+        link_element = item.select_one('a')
+        link = ""
+        if link_element:
+            link = link_element.get('href', '')
+            if link and not link.startswith('http'):
+                # URL relative, construire l'URL complète
+                from urllib.parse import urljoin
+                link = urljoin(self.site_url, link)
+        
+        actualite = NewsItem(
+            titre=titre,
+            description=description,
+            date=date_str,
+            lien=link,
+            index=i + 1
+        )
+        
+        return actualite
+    
     def scrape_market_data(self, soup):
         """Scrape les données de marché/cotations"""
         print("📈 Recherche de données de marché...")
         
-        market_containers = self.find_elements_by_selectors(soup, self.selectors['market_data'])
+        # Modèle appris, sélecteurs standards puis tableaux ou listes de cotations
+        market_containers, container_selector, template = self.find_containers(
+            soup, 'market_data', self.selectors['market_data'] + ['table tr, .quote-row, .stock-row']
+        )
         
-        if not market_containers:
-            # Chercher des tableaux ou listes de cotations
-            market_containers = soup.select('table tr, .quote-row, .stock-row')
+        # Cascades de sélecteurs compilées une seule fois
+        cascades = self.get_cascades('stock_name', 'stock_price', 'stock_change', 'stock_percent', template=template)
         
         market_data = []
         for i, item in enumerate(market_containers):
             try:
-                # Nom/Symbole
-                name_element = None
-                for selector in self.selectors['stock_name']:
-                    name_element = item.select_one(selector)
-                    if name_element:
-                        break
-                
-                nom = name_element.get_text(strip=True) if name_element else f"Valeur {i+1}"
-                
-                # Prix
-                price_element = None
-                for selector in self.selectors['stock_price']:
-                    price_element = item.select_one(selector)
-                    if price_element:
-                        break
-                
-                prix_brut = price_element.get_text(strip=True) if price_element else ""
-                prix = self.extract_price(prix_brut)
-                
-                # Variation
-                change_element = None
-                for selector in self.selectors['stock_change']:
-                    change_element = item.select_one(selector)
-                    if change_element:
-                        break
-                
-                variation_brute = change_element.get_text(strip=True) if change_element else ""
-                variation_abs, variation_pct = self.extract_change(variation_brute)
-                
-                # Pourcentage séparé si disponible
-                percent_element = None
-                for selector in self.selectors['stock_percent']:
-                    percent_element = item.select_one(selector)
-                    if percent_element:
-                        break
-                
-                if percent_element and not variation_pct:
-                    variation_pct = percent_element.get_text(strip=True)
-                
-                cotation = {
-                    "nom": nom,
-                    "prix": prix,
-                    "prix_brut": prix_brut,
-                    "variation_absolue": variation_abs,
-                    "variation_pourcentage": variation_pct,
-                    "variation_brute": variation_brute,
-                    "index": i + 1
-                }
-                
-                market_data.append(cotation)
-                
+                market_data.append(self.extract_quote(item, i, cascades))
             except Exception as e:
                 print(f"⚠️ Erreur lors de l'extraction de la cotation {i+1}: {e}")
                 continue
         
+        if market_data:
+            self.learn_template('market_data', container_selector, cascades, market_containers)
+        
         return market_data
     
+    def extract_quote(self, item, i, cascades):
+        """Extrait une cotation d'un conteneur (i : position dans la page)"""
+        # Nom/Symbole
+        name_element = cascades['stock_name'].first(item)
+        
+        nom = name_element.get_text(strip=True) if name_element else f"Valeur {i+1}"
+        
+        # Prix
+        price_element = cascades['stock_price'].first(item)
+        
+        prix_brut = price_element.get_text(strip=True) if price_element else ""
+        prix = self.extract_price(prix_brut)
+        
+        # Variation
+        change_element = cascades['stock_change'].first(item)
+        
+        variation_brute = change_element.get_text(strip=True) if change_element else ""
+        variation_abs, variation_pct = self.extract_change(variation_brute)
+        
+        # Pourcentage séparé si disponible
+        percent_element = cascades['stock_percent'].first(item)
+        
+        if percent_element and not variation_pct:
+            variation_pct = percent_element.get_text(strip=True)
+        
+        cotation = Quote(
+            nom=nom,
+            prix=prix,
+            prix_brut=prix_brut,
+            variation_absolue=variation_abs,
+            variation_pourcentage=variation_pct,
+            variation_brute=variation_brute,
+            index=i + 1
+        )
+        
+        return cotation
+    
+    def stream_watchers(self):
+        # Mêmes replis que `scrape_market_data` pour les cotations
+        return {
+            'actualite': self.selectors['news_containers'],
+            'cotation': self.selectors['market_data'] + ['table tr', '.quote-row', '.stock-row']
+        }
+    
+    def extract_streamed(self, kind, item, index):
+        if kind == 'actualite':
+            record = self.extract_news_item(item, index, self.get_cascades('news_title', 'news_description'))
+        else:
+            record = self.extract_quote(item, index, self.get_cascades('stock_name', 'stock_price', 'stock_change', 'stock_percent'))
+        record['type'] = kind
+        return record
+    
     def auto_detect_news(self, soup):
-        """Détection automatique des actualités"""
+        """Détection automatique des actualités (blocs frères répétés)"""
         print("🤖 Détection automatique des actualités...")
         
-        potential_news = []
-        
-        # Chercher des patterns courants
-        patterns = [
-            'div[class*="news"]',
-            'article',
-            'div[class*="story"]',
-            'div[class*="headline"]',
-            'li[class*="item"]',
-            '.article, .story, .news'
-        ]
-        
-        for pattern in patterns:
-            elements = soup.select(pattern)
-            if len(elements) > 1:  # Au moins 2 éléments similaires
-                potential_news.extend(elements)
-                print(f"   Trouvé {len(elements)} éléments avec '{pattern}'")
-        
-        return potential_news[:20]  # Limiter à 20 actualités
+        group = detect_record_group(soup, min_repeat=2, keywords=('news', 'story', 'article', 'headline'))
+        if not group:
+            return []
+        
+        print(f"   Trouvé {len(group['items'])} éléments avec '{group['selector']}'")
+        return group['items']
     
-    def scrape(self):
+    def scrape_html(self, html):
         """Méthode principale de scraping"""
-        soup = self.get_soup()
+        # Données structurées (JSON-LD, JSON embarqué) : pas de DOM à construire
+        if self.use_structured_data:
+            all_data = self.scrape_structured(html)
+            if all_data:
+                return all_data
+        
+        soup = self.parse_html(html)
         if not soup:
             print("❌ Impossible de récupérer le contenu HTML")
             return []
@@ -285,6 +293,40 @@ class BourseScraper(BaseScraper):
         print(f"✅ {len(all_data)} éléments extraits au total")
         return all_data
     
+    def scrape_structured(self, html):
+        """Actualités JSON-LD et cotations embarquées (format Yahoo Finance)"""
+        all_data = []
+        
+        for i, article in enumerate(extract_articles(html)):
+            all_data.append(NewsItem(
+                titre=article['headline'],
+                description=article['description'],
+                date=article['date'],
+                lien=urljoin(self.site_url, article['url']) if article['url'] else "",
+                index=i + 1,
+                type="actualite"
+            ))
+        
+        for i, quote in enumerate(extract_quotes(html)):
+            variation_brute = "" if quote['change'] is None else str(quote['change'])
+            variation_abs, variation_pct = self.extract_change(variation_brute)
+            if quote['change_percent'] is not None:
+                variation_pct = str(quote['change_percent'])
+            all_data.append(Quote(
+                nom=quote['name'] or f"Valeur {i+1}",
+                prix=self.extract_price(str(quote['price'])),
+                prix_brut=str(quote['price']),
+                variation_absolue=variation_abs,
+                variation_pourcentage=variation_pct,
+                variation_brute=variation_brute,
+                index=i + 1,
+                type="cotation"
+            ))
+        
+        if all_data:
+            print(f"🧬 {len(all_data)} éléments lus dans les données structurées")
+        return all_data
+    
     def scrape_fallback(self, soup):
         """Méthode de fallback (votre code original amélioré)"""
         actualites = []
@@ -298,11 +340,11 @@ class BourseScraper(BaseScraper):
                 titre = titre_elem.text.strip() if titre_elem else "Titre non disponible"
                 description = desc_elem.text.strip() if desc_elem else "Description non disponible"
                 
-                actualites.append({
-                    "titre": titre, 
-                    "description": description,
-                    "type": "actualite"
-                })
+                actualites.append(NewsItem(
+                    titre=titre,
+                    description=description,
+                    type="actualite"
+                ))
             except Exception as e:
                 print(f"⚠️ Erreur fallback: {e}")
                 continue
@@ -338,6 +380,9 @@ class BourseScraper(BaseScraper):
         links = soup.find_all('a', href=True)
         financial_links = [link for link in links if any(kw in link.get('href', '').lower() for kw in ['news', 'article', 'story'])]
         print(f"\n🔗 Liens vers articles: {len(financial_links)}")
+        
+        # Sélecteurs effectivement utilisés sur cet hôte
+        self.print_selector_stats()
 
 # Classes spécialisées pour des sites spécifiques
 class YahooFinanceScraper(BourseScraper):
@@ -345,11 +390,13 @@ class YahooFinanceScraper(BourseScraper):
         super().__init__(site_url)
         self.selectors['news_containers'] = ['[data-testid="story-item"]', '.js-content-viewer']
         self.selectors['stock_price'] = ['[data-field="regularMarketPrice"]']
+        self.parse_regions = self.selectors['news_containers'] + self.selectors['market_data'] + ['table']
 
 class BloombergScraper(BourseScraper):
     def __init__(self, site_url):
         super().__init__(site_url)
         self.selectors['news_containers'] = ['.story-list-story', '.headline-link']
+        self.parse_regions = self.selectors['news_containers'] + self.selectors['market_data'] + ['table']
 
 class MarketwatchScraper(BourseScraper):
     def __init__(self, site_url):
@@ -1,9 +1,13 @@
 # scraper/e_commerce_scraper.py
 
-from scraper.base_scraper import BaseScraper
+from scraper.async_scraper import AsyncBaseScraper
+from scraper.structure_detector import detect_record_group
+from scraper.structured_data import extract_products, format_price
+from scraper.pagination import find_next_link, find_page_pattern
+from utils.records import Product, RecordBatch
 import re
 
-class EcommerceScraper(BaseScraper):
+class EcommerceScraper(AsyncBaseScraper):
     def __init__(self, site_url, user_agent=None):
         super().__init__(site_url, user_agent)
         
@@ -57,24 +61,25 @@ class EcommerceScraper(BaseScraper):
                 return elements
         return []
     
-    def scrape(self):
+    def scrape_html(self, html):
         """Scrape les produits e-commerce"""
-        soup = self.get_soup()
+        # Données structurées (JSON-LD, état d'hydratation) : pas de DOM à construire
+        if self.use_structured_data:
+            produits = self.scrape_structured(html)
+            if produits:
+                return produits
+        
+        soup = self.parse_html(html)
         if not soup:
             print("❌ Impossible de récupérer le contenu HTML")
             return []
         
         print(f"📄 HTML récupéré ({len(str(soup))} caractères)")
         
-        # Chercher les produits avec différents sélecteurs
-        products_containers = self.find_elements_by_selectors(soup, self.selectors['products'])
-        
-        if not products_containers:
-            print("⚠️ Aucun conteneur de produit trouvé avec les sélecteurs standards")
-            print("🔍 Essai de détection automatique...")
-            
-            # Tentative de détection automatique
-            products_containers = self.auto_detect_products(soup)
+        # Modèle appris, sélecteurs standards puis détection automatique
+        products_containers, container_selector, template = self.find_containers(
+            soup, 'products', self.selectors['products'], self._detect_products
+        )
         
         if not products_containers:
             print("❌ Aucun produit détecté")
@@ -82,80 +87,205 @@ class EcommerceScraper(BaseScraper):
         
         print(f"🛍️ {len(products_containers)} produits détectés")
         
+        # Cascades de sélecteurs compilées une seule fois
+        cascades = self.get_cascades('name', 'price', template=template)
+        
         produits = []
         for i, item in enumerate(products_containers):
             try:
-                # Extraire le nom
-                nom_element = None
-                for selector in self.selectors['name']:
-                    nom_element = item.select_one(selector)
-                    if nom_element:
-                        break
-                
-                nom = nom_element.get_text(strip=True) if nom_element else f"Produit {i+1}"
-                
-                # Extraire le prix
-                prix_element = None
-                for selector in self.selectors['price']:
-                    prix_element = item.select_one(selector)
-                    if prix_element:
-                        break
-                
-                prix_brut = prix_element.get_text(strip=True) if prix_element else "Prix non disponible"
-                prix = self.extract_price(prix_brut)
-                
-                # Informations supplémentaires optionnelles
-                description = ""
-                desc_element = item.select_one('.description, .product-description, .summary')
-                if desc_element:
-                    description = desc_element.get_text(strip=True)[:200]  # Limiter à 200 chars
-                
-                image_url = ""
-                img_element = item.select_one('img')
-                if img_element:
-                    image_url = img_element.get('src', '') or img_element.get('data-src', '')
-                
-                produit = {
-                    "nom": nom,
-                    "prix": prix,
-                    "prix_brut": prix_brut,
-                    "description": description,
-                    "image_url": image_url,
-                    "index": i + 1
-                }
-                
-                produits.append(produit)
-                
+                produits.append(self.extract_product(item, i, cascades))
             except Exception as e:
                 print(f"⚠️ Erreur lors de l'extraction du produit {i+1}: {e}")
                 continue
         
+        if produits:
+            self.learn_template('products', container_selector, cascades, products_containers)
+        
         print(f"✅ {len(produits)} produits extraits avec succès")
         return produits
     
+    def scrape_pages(self, max_pages=10):
+        """Scrape une catégorie paginée, retourne les produits combinés (RecordBatch)"""
+        produits = RecordBatch(self.iter_pages(max_pages))
+        print(f"📚 {len(produits)} produits au total")
+        return produits
+    
+    def iter_pages(self, max_pages=10):
+        """
+        Produit les produits de `site_url` puis des pages suivantes
+        
+        Les liens numérotés (?page=N, /page/N) permettent de récupérer en
+        parallèle (dans les limites par hôte) les pages annoncées, puis celles
+        annoncées par ces pages ; sinon le lien rel="next" est suivi page par
+        page. Arrêt sur une page vide, déjà vue ou en échec (404...), ou
+        quand plus aucun lien n'annonce la page suivante. L'`index` des
+        produits est global à toutes les pages.
+        """
+        html = self.get_html()
+        if not html:
+            print("❌ Impossible de récupérer le contenu HTML")
+            return
+        
+        seen = set()
+        counter = [0]
+        
+        def new_products(url, page_html, number):
+            """Produits inédits d'une page (None : arrêter la pagination)"""
+            url_origine = self.site_url
+            try:
+                # Les extracteurs résolvent les liens relatifs via `site_url`
+                self.site_url = url
+                produits = self.scrape_fetched(page_html)
+            finally:
+                self.site_url = url_origine
+            
+            if not produits:
+                print(f"🛑 Page {number} vide, fin de la pagination")
+                return None
+            
+            nouveaux = []
+            for produit in produits:
+                signature = (produit.get('nom'), produit.get('prix_brut'), produit.get('image_url'))
+                if signature in seen:
+                    continue
+                seen.add(signature)
+                counter[0] += 1
+                produit['index'] = counter[0]
+                nouveaux.append(produit)
+            
+            if not nouveaux:
+                print(f"🛑 Page {number} déjà vue, fin de la pagination")
+                return None
+            return nouveaux
+        
+        yield from new_products(self.site_url, html, 1) or []
+        if max_pages <= 1:
+            return
+        
+        pattern = find_page_pattern(html, self.site_url)
+        if pattern:
+            print(f"📑 Pagination détectée : {pattern.url('N')}")
+            number = 2
+            highest = pattern.highest
+            while number <= max_pages:
+                # Seules les pages annoncées par les liens sont demandées, en un lot
+                last = min(max_pages, highest)
+                if last < number:
+                    print(f"🛑 Aucun lien vers la page {number}, fin de la pagination")
+                    return
+                urls = [pattern.url(n) for n in range(number, last + 1)]
+                pages = self.fetch_many(urls)
+                
+                for offset, url in enumerate(urls):
+                    # Page absente (404, erreur) : la catégorie s'arrête là, comme avec rel="next"
+                    if not pages.get(url):
+                        status = self.last_statuses.get(url)
+                        detail = f" (HTTP {status})" if status else ""
+                        print(f"❌ Échec de la récupération : {url}{detail}, fin de la pagination")
+                        return
+                    produits = new_products(url, pages[url], number + offset)
+                    if produits is None:
+                        return
+                    yield from produits
+                    
+                    # Paginations glissantes (1 2 3 … 7) : liens vers les pages suivantes
+                    page_pattern = find_page_pattern(pages[url], url)
+                    if page_pattern and (page_pattern.prefix, page_pattern.suffix) == (pattern.prefix, pattern.suffix):
+                        highest = max(highest, page_pattern.highest)
+                number = last + 1
+            return
+        
+        # Pas de numérotation : suivre rel="next"
+        url = self.site_url
+        visited = {url}
+        for number in range(2, max_pages + 1):
+            url = find_next_link(html, url)
+            if not url or url in visited:
+                return
+            visited.add(url)
+            html = self.get_html_requests(url)
+            if not html:
+                print(f"❌ Échec de la récupération : {url}")
+                return
+            produits = new_products(url, html, number)
+            if produits is None:
+                return
+            yield from produits
+    
+    def scrape_structured(self, html):
+        """Produits déclarés en JSON-LD ou dans l'état d'hydratation de la page"""
+        produits = []
+        for i, product in enumerate(extract_products(html)):
+            prix_brut = format_price(product['price'], product['currency']) or "Prix non disponible"
+            produits.append(Product(
+                nom=product['name'],
+                prix=self.extract_price(prix_brut),
+                prix_brut=prix_brut,
+                description=product['description'][:200],
+                image_url=product['image'],
+                index=i + 1
+            ))
+        
+        if produits:
+            print(f"🧬 {len(produits)} produits lus dans les données structurées")
+        return produits
+    
+    def extract_product(self, item, i, cascades):
+        """Extrait un produit d'un conteneur (i : position dans la page)"""
+        # Extraire le nom
+        nom_element = cascades['name'].first(item)
+        
+        nom = nom_element.get_text(strip=True) if nom_element else f"Produit {i+1}"
+        
+        # Extraire le prix
+        prix_element = cascades['price'].first(item)
+        
+        prix_brut = prix_element.get_text(strip=True) if prix_element else "Prix non disponible"
+        prix = self.extract_price(prix_brut)
+        
+        # Informations supplémentaires optionnelles
+        description = ""
+        desc_element = item.select_one('.description, .product-description, .summary')
+        if desc_element:
+            description = desc_element.get_text(strip=True)[:200]  # Limiter à 200 chars
+        
+        image_url = ""
+        img_element = item.select_one('img')
+        if img_element:
+            image_url = img_element.get('src', '') or img_element.get('data-src', '')
+        
+        produit = Product(
+            nom=nom,
+            prix=prix,
+            prix_brut=prix_brut,
+            description=description,
+            image_url=image_url,
+            index=i + 1
+        )
+        
+        return produit
+    
+    def stream_watchers(self):
+        return {'produit': self.selectors['products']}
+    
+    def extract_streamed(self, kind, item, index):
+        return self.extract_product(item, index, self.get_cascades('name', 'price'))
+    
+    def _detect_products(self, soup):
+        print("⚠️ Aucun conteneur de produit trouvé avec les sélecteurs standards")
+        print("🔍 Essai de détection automatique...")
+        return self.auto_detect_products(soup)
+    
     def auto_detect_products(self, soup):
-        """Tentative de détection automatique des produits"""
+        """Tentative de détection automatique des produits (blocs frères répétés)"""
         print("🤖 Détection automatique des conteneurs de produits...")
         
-        # Chercher des divs avec beaucoup d'éléments similaires
-        potential_containers = []
-        
-        # Chercher des patterns courants
-        common_patterns = [
-            'div[class*="product"]',
-            'div[class*="item"]',
-            'article',
-            'li[class*="product"]',
-            'div[data-*="product"]'
-        ]
-        
-        for pattern in common_patterns:
-            elements = soup.select(pattern)
-            if len(elements) > 2:  # Au moins 3 éléments similaires
-                potential_containers.extend(elements)
-                print(f"   Trouvé {len(elements)} éléments avec '{pattern}'")
-        
-        return potential_containers[:50]  # Limiter à 50 produits max
+        group = detect_record_group(soup, min_repeat=3, keywords=('product', 'item', 'card'))
+        if not group:
+            return []
+        
+        print(f"   Trouvé {len(group['items'])} éléments avec '{group['selector']}'")
+        return group['items']
     
     def debug_structure(self):
         """Analyse la structure HTML pour aider au débogage"""
@@ -192,6 +322,9 @@ class EcommerceScraper(BaseScraper):
         print(f"   Listes (ul/ol): {len(soup.find_all(['ul', 'ol']))}")
         print(f"   Images: {len(soup.find_all('img'))}")
         print(f"   Liens: {len(soup.find_all('a'))}")
+        
+        # Sélecteurs effectivement utilisés sur cet hôte
+        self.print_selector_stats()
 
 # Version spécialisée pour des sites spécifiques
 class AmazonScraper(EcommerceScraper):
@@ -202,6 +335,7 @@ class AmazonScraper(EcommerceScraper):
             'name': ['h2 a span', '.a-size-base-plus'],
             'price': ['.a-price-whole', '.a-price .a-offscreen']
         }
+        self.parse_regions = self.selectors['products']
 
 class EbayScraper(EcommerceScraper):
     def __init__(self, site_url):
@@ -210,4 +344,5 @@ class EbayScraper(EcommerceScraper):
             'products': ['.s-item', '.lvresult'],
             'name': ['.s-item__title', '.lvtitle'],
             'price': ['.s-item__price', '.amt']
-        }
\ No newline at end of file
+        }
+        self.parse_regions = self.selectors['products']
\ No newline at end of file
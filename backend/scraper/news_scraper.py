@@ -1,12 +1,121 @@
-from scraper.base_scraper import BaseScraper
+import heapq
+import re
 
-class NewsScraper(BaseScraper):
-    def scrape(self):
-        soup = self.get_soup()
+from scraper.async_scraper import AsyncBaseScraper
+from utils.bloom import BloomFilter
+from utils.records import NewsItem
+from utils.robot_check import get_robots_cache
+from utils.url_tools import canonicalize_url, in_scope, is_probably_html
+
+# Indices d'une URL d'article : date, identifiant numérique, slug à tirets
+ARTICLE_HINTS_RE = re.compile(r'/(?:19|20)\d{2}/|\d{5,}|/[a-z0-9]+(?:-[a-z0-9]+){3,}', re.I)
+SECTION_HINTS = ('news', 'article', 'actualite', 'actu', 'info', 'story')
+
+class NewsScraper(AsyncBaseScraper):
+    def scrape_html(self, html):
+        soup = self.parse_html(html)
+        if not soup:
+            print("❌ Impossible de parser le contenu HTML")
+            return []
         news = []
+        seen = set()
         for item in soup.find_all("a"):
             titre = item.get_text().strip()
-            lien = item.get("href")
-            if lien and titre:
-                news.append({"titre": titre, "lien": lien})
+            # Liens relatifs résolus, paramètres de suivi retirés
+            lien = canonicalize_url(item.get("href"), self.site_url)
+            if lien and titre and lien not in seen:
+                seen.add(lien)
+                news.append(NewsItem(titre=titre, lien=lien))
         return news
+
+    def stream_watchers(self):
+        return {'lien': ['a[href]']}
+
+    def extract_streamed(self, kind, item, index):
+        titre = item.get_text().strip()
+        lien = canonicalize_url(item.get("href"), self.site_url)
+        if lien and titre:
+            return NewsItem(titre=titre, lien=lien)
+        return None
+
+    @staticmethod
+    def link_priority(url):
+        """Score d'une URL : plus il est élevé, plus elle ressemble à un article"""
+        score = 0
+        if ARTICLE_HINTS_RE.search(url):
+            score += 2
+        if any(hint in url.lower() for hint in SECTION_HINTS):
+            score += 1
+        return score
+
+    def crawl(self, max_depth=2, max_pages=100, scope='domain', respect_robots=True, capacity=100000):
+        """
+        Crawl borné à partir de `site_url` : produit les liens découverts
+
+        Les pages sont visitées par profondeur croissante puis par score
+        (`link_priority`), par lots récupérés en parallèle. Les URLs sont
+        canonicalisées et dédoublonnées par un filtre de Bloom : aucune page
+        n'est téléchargée deux fois et la mémoire reste fixe (taux de faux
+        positifs 0,1 % : une URL jamais vue peut être ignorée à ce taux).
+
+        Args:
+            max_depth: Profondeur maximale des pages visitées (0 : page de départ seule)
+            max_pages: Nombre maximal de pages téléchargées
+            scope: 'host', 'domain' ou 'all' (voir `in_scope`)
+            respect_robots: Ignorer les URLs interdites par robots.txt
+            capacity: Nombre d'URLs prévu pour le filtre de Bloom
+        """
+        start_url = canonicalize_url(self.site_url)
+        if not start_url:
+            print("❌ URL de départ invalide")
+            return
+
+        seen = BloomFilter(capacity)
+        seen.add(start_url)
+        frontier = [(0, 0, 0, start_url)]
+        # La frontière est bornée : au-delà, les liens sont émis mais pas suivis
+        max_frontier = max_pages * 10
+        sequence = 1
+        fetched = 0
+        robots = get_robots_cache() if respect_robots else None
+        url_origine = self.site_url
+
+        try:
+            while frontier and fetched < max_pages:
+                batch = []
+                while frontier and len(batch) < min(self.max_concurrency, max_pages - fetched):
+                    batch.append(heapq.heappop(frontier))
+
+                pages = self.fetch_many([url for _, _, _, url in batch])
+                fetched += len(batch)
+
+                for depth, _, _, url in batch:
+                    html = pages.get(url)
+                    if not html:
+                        print(f"❌ Échec de la récupération : {url}")
+                        continue
+
+                    self.site_url = url
+                    links = self.scrape_fetched(html)
+                    print(f"🕸️ [{fetched}/{max_pages}] profondeur {depth} : {len(links)} liens sur {url}")
+
+                    for link in links:
+                        if not seen.add(link['lien']):
+                            continue
+                        link['profondeur'] = depth + 1
+                        yield link
+
+                        if depth + 1 > max_depth or len(frontier) >= max_frontier:
+                            continue
+                        if not is_probably_html(link['lien']) or not in_scope(link['lien'], start_url, scope):
+                            continue
+                        if robots and not robots.is_allowed(link['lien']):
+                            continue
+                        heapq.heappush(frontier, (depth + 1, -self.link_priority(link['lien']), sequence, link['lien']))
+                        sequence += 1
+        finally:
+            self.site_url = url_origine
+
+        if seen.saturated:
+            print("⚠️ Capacité du filtre de Bloom dépassée, augmentez `capacity`")
+        print(f"✅ Crawl terminé : {fetched} pages visitées, {len(seen)} URLs vues")
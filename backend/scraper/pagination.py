@@ -0,0 +1,85 @@
+# scraper/pagination.py
+
+import re
+from collections import Counter
+from html import unescape
+from urllib.parse import urljoin, urlparse
+
+# Liens et leurs attributs (scan du HTML brut, sans DOM)
+LINK_TAG_RE = re.compile(rb'<(?:a|link)\b[^>]*>', re.I)
+HREF_RE = re.compile(rb'\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.I)
+REL_NEXT_RE = re.compile(rb'\brel\s*=\s*["\']?[^"\'>]*\bnext\b', re.I)
+
+# Numéro de page dans l'URL : ?page=3, &p=3, /page/3
+PAGE_NUMBER_RES = [
+    re.compile(r'([?&](?:page|p|pg|paged|pagenumber|page_number)=)(\d+)', re.I),
+    re.compile(r'(/page/)(\d+)', re.I)
+]
+
+def _to_bytes(html):
+    if isinstance(html, str):
+        return html.encode('utf-8')
+    return html or b''
+
+def iter_links(html, base_url):
+    """Liens <a>/<link> de la page : (URL absolue, rel=next)"""
+    for tag in LINK_TAG_RE.finditer(_to_bytes(html)):
+        tag = tag.group()
+        href = HREF_RE.search(tag)
+        if not href:
+            continue
+        value = next(group for group in href.groups() if group is not None)
+        value = unescape(value.decode('utf-8', errors='replace')).strip()
+        if not value or value.startswith(('#', 'javascript:', 'mailto:')):
+            continue
+        yield urljoin(base_url, value), bool(REL_NEXT_RE.search(tag))
+
+def find_next_link(html, base_url):
+    """URL de la page suivante déclarée (rel="next"), ou None"""
+    for url, is_next in iter_links(html, base_url):
+        if is_next:
+            return url
+    return None
+
+class PageUrlPattern:
+    """Modèle d'URL numérotée (…?page={n}) déduit des liens de pagination"""
+
+    def __init__(self, prefix, suffix, highest):
+        self.prefix = prefix
+        self.suffix = suffix
+        # Plus grand numéro de page vu dans les liens
+        self.highest = highest
+
+    def url(self, number):
+        return f"{self.prefix}{number}{self.suffix}"
+
+    def __repr__(self):
+        return f"<PageUrlPattern {self.prefix}{{n}}{self.suffix} (≥ {self.highest})>"
+
+def find_page_pattern(html, base_url):
+    """
+    Modèle d'URL de pagination le plus fréquent parmi les liens du même hôte
+
+    Returns:
+        PageUrlPattern ou None si aucun lien numéroté
+    """
+    host = urlparse(base_url).netloc
+    counts = Counter()
+    highest = {}
+
+    for url, _ in iter_links(html, base_url):
+        if urlparse(url).netloc != host:
+            continue
+        for pattern in PAGE_NUMBER_RES:
+            match = pattern.search(url)
+            if match:
+                key = (url[:match.start(2)], url[match.end(2):])
+                counts[key] += 1
+                highest[key] = max(highest.get(key, 0), int(match.group(2)))
+                break
+
+    if not counts:
+        return None
+    # Plus fréquent, puis premier rencontré (Counter conserve l'ordre d'insertion)
+    (prefix, suffix), _ = counts.most_common(1)[0]
+    return PageUrlPattern(prefix, suffix, highest[(prefix, suffix)])
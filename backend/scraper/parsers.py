@@ -0,0 +1,219 @@
+# scraper/parsers.py
+
+import importlib.util
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from scraper.selector_cascade import compile_simple_selector
+
+try:
+    # bs4 >= 4.13 : filtrage pendant le parsing via ElementFilter
+    from bs4.filter import ElementFilter
+except ImportError:
+    ElementFilter = None
+
+# Backends supportés, du plus tolérant au plus rapide
+PARSER_BACKENDS = ['html.parser', 'html5lib', 'lxml', 'selectolax']
+
+# Ordre de préférence pour le mode "auto"
+AUTO_PREFERENCE = ['lxml', 'html.parser']
+
+# Backends bs4 qui respectent `parse_only`
+PARTIAL_PARSE_BACKENDS = ('html.parser', 'lxml')
+
+_BACKEND_MODULES = {
+    'html.parser': None,
+    'html5lib': 'html5lib',
+    'lxml': 'lxml',
+    'selectolax': 'selectolax'
+}
+
+def is_backend_available(backend):
+    """Vrai si le module nécessaire au backend est installé"""
+    module = _BACKEND_MODULES.get(backend)
+    return module is None or importlib.util.find_spec(module) is not None
+
+def available_backends():
+    """Liste des backends utilisables dans cet environnement"""
+    return [backend for backend in PARSER_BACKENDS if is_backend_available(backend)]
+
+def resolve_backend(backend):
+    """Valide un nom de backend, avec repli sur html.parser s'il est indisponible"""
+    backend = (backend or 'html.parser').lower()
+
+    if backend == 'auto':
+        return next(b for b in AUTO_PREFERENCE if is_backend_available(b))
+
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Parser '{backend}' non reconnu. Parsers disponibles : {PARSER_BACKENDS}")
+
+    if not is_backend_available(backend):
+        print(f"⚠️ Parser '{backend}' non installé, utilisation de html.parser")
+        return 'html.parser'
+
+    return backend
+
+def _region_matcher(regions):
+    """Prédicat (nom, attributs) vrai si le tag ouvre une des régions"""
+    predicates = []
+    for selector in regions:
+        compiled = compile_simple_selector(selector)
+        if compiled is None:
+            raise ValueError(f"Région '{selector}' : seuls les sélecteurs simples (tag, .classe, [attribut]) sont supportés")
+        predicates.append(compiled[0])
+
+    def matches(name, attrs):
+        attrs = attrs or {}
+        return any(predicate(name, attrs) for predicate in predicates)
+
+    return matches
+
+if ElementFilter is not None:
+    class RegionFilter(ElementFilter):
+        """Ne construit que les sous-arbres des régions (bs4 >= 4.13)"""
+
+        def __init__(self, regions):
+            super().__init__()
+            self._matches = _region_matcher(regions)
+
+        def allow_tag_creation(self, nsprefix, name, attrs):
+            return self._matches(name, attrs)
+
+        def allow_string_creation(self, string):
+            # Texte hors des régions : ignoré
+            return False
+
+def region_filter(regions):
+    """Filtre `parse_only` limitant le parsing aux régions (sélecteurs CSS simples)"""
+    if ElementFilter is not None:
+        return RegionFilter(regions)
+
+    # bs4 < 4.13 : une fonction sur `name` reçoit (nom, attributs) pendant le parsing
+    matches = _region_matcher(regions)
+    return SoupStrainer(lambda name, attrs=None: matches(name, attrs))
+
+def parse_document(html, backend='html.parser', regions=None):
+    """
+    Parse un document HTML avec le backend choisi
+
+    Les backends bs4 (html.parser, lxml, html5lib) retournent un BeautifulSoup.
+    `selectolax` retourne un `FastNode` qui expose le sous-ensemble de l'API
+    bs4 utilisé par les scrapers (select, select_one, get_text, get, find_all).
+
+    Avec `regions`, seuls les sous-arbres correspondants sont construits
+    (html.parser et lxml) ; les autres backends parsent tout le document.
+    """
+    if backend == 'selectolax':
+        from selectolax.lexbor import LexborHTMLParser
+        tree = LexborHTMLParser(html)
+        return FastNode(tree.root, tree) if tree.root is not None else None
+
+    if regions and backend in PARTIAL_PARSE_BACKENDS:
+        return BeautifulSoup(html, backend, parse_only=region_filter(regions))
+
+    return BeautifulSoup(html, backend)
+
+class FastNode:
+    """Nœud selectolax présenté avec l'interface bs4 utilisée par les scrapers"""
+
+    __slots__ = ('_node', '_tree')
+
+    def __init__(self, node, tree=None):
+        self._node = node
+        # Garder l'arbre vivant tant qu'un de ses nœuds est référencé
+        self._tree = tree
+
+    def _wrap(self, node):
+        return FastNode(node, self._tree)
+
+    @property
+    def name(self):
+        return self._node.tag
+
+    @property
+    def attrs(self):
+        attrs = dict(self._node.attributes)
+        if 'class' in attrs:
+            attrs['class'] = (attrs['class'] or '').split()
+        return attrs
+
+    @property
+    def text(self):
+        return self.get_text()
+
+    @property
+    def children(self):
+        """Enfants éléments (sans les nœuds texte)"""
+        return [self._wrap(node) for node in self._node.iter(include_text=False)]
+
+    @property
+    def own_text(self):
+        """Texte porté directement par le nœud (hors descendants)"""
+        return self._node.text(deep=False)
+
+    def select(self, selector):
+        """Descendants correspondant au sélecteur CSS (hors nœud courant, comme bs4)"""
+        own_id = self._node.mem_id
+        return [self._wrap(node) for node in self._node.css(selector) if node.mem_id != own_id]
+
+    def select_one(self, selector):
+        results = self.select(selector)
+        return results[0] if results else None
+
+    def get_text(self, separator='', strip=False):
+        return self._node.text(deep=True, separator=separator, strip=strip)
+
+    def get(self, attribute, default=None):
+        value = self.attrs.get(attribute)
+        return default if value is None else value
+
+    def __getitem__(self, attribute):
+        return self.attrs[attribute]
+
+    def _matches(self, node, names, attributes):
+        if names and node.tag not in names:
+            return False
+
+        node_attrs = node.attributes
+        for attribute, expected in attributes.items():
+            value = node_attrs.get(attribute)
+            if expected is True:
+                if attribute not in node_attrs:
+                    return False
+                continue
+            if value is None:
+                return False
+            values = value.split() if attribute == 'class' else [value]
+            if isinstance(expected, re.Pattern):
+                if not any(expected.search(v) for v in values):
+                    return False
+            elif expected not in values:
+                return False
+        return True
+
+    def find_all(self, name=None, **attributes):
+        """Version simplifiée de bs4.find_all : nom(s) de tag et filtres d'attributs"""
+        if 'class_' in attributes:
+            attributes['class'] = attributes.pop('class_')
+        if isinstance(name, str):
+            names = {name}
+        else:
+            names = set(name or [])
+
+        own_id = self._node.mem_id
+        return [
+            self._wrap(node)
+            for node in self._node.traverse()
+            if node.mem_id != own_id and self._matches(node, names, attributes)
+        ]
+
+    def find(self, name=None, **attributes):
+        results = self.find_all(name, **attributes)
+        return results[0] if results else None
+
+    def __str__(self):
+        return self._node.html or ''
+
+    def __repr__(self):
+        return f"<FastNode {self._node.tag}>"
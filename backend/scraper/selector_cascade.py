@@ -0,0 +1,172 @@
+# scraper/selector_cascade.py
+
+import re
+from functools import lru_cache
+
+import soupsieve
+from bs4 import Tag
+
+# Sélecteur composé simple : tag, .classes et [attributs], sans combinateur
+SIMPLE_SELECTOR_RE = re.compile(
+    r'^(?P<tag>[a-zA-Z][\w-]*)?'
+    r'(?P<classes>(?:\.[\w-]+)*)'
+    r'(?P<attrs>(?:\[[\w-]+(?:[*^$]?=(?:"[^"]*"|\'[^\']*\'))?\])*)$'
+)
+ATTRIBUTE_RE = re.compile(r'\[([\w-]+)(?:([*^$]?=)(?:"([^"]*)"|\'([^\']*)\'))?\]')
+
+def compile_simple_selector(selector):
+    """
+    Compile un sélecteur simple en prédicat Python (plus rapide que soupsieve)
+
+    Le prédicat reçoit le nom du tag et ses attributs, sous forme d'arbre
+    (bs4 : classes en liste) ou bruts (pendant le parsing : classes en chaîne).
+
+    Returns:
+        (prédicat(nom, attributs), clé d'index) ou None si le sélecteur n'est pas simple
+    """
+    match = SIMPLE_SELECTOR_RE.match(selector.strip())
+    if not match or not selector.strip():
+        return None
+
+    tag = match.group('tag')
+    tag = tag.lower() if tag else None
+    classes = [c for c in match.group('classes').split('.') if c]
+    attributes = []
+    for name, operator, value_dq, value_sq in ATTRIBUTE_RE.findall(match.group('attrs')):
+        value = value_dq or value_sq
+        attributes.append((name.lower(), operator, value))
+
+    def predicate(element_name, element_attrs):
+        if tag and element_name != tag:
+            return False
+        if classes:
+            element_classes = element_attrs.get('class') or ()
+            if isinstance(element_classes, str):
+                element_classes = element_classes.split()
+            if any(c not in element_classes for c in classes):
+                return False
+        for name, operator, value in attributes:
+            actual = element_attrs.get(name)
+            if actual is None:
+                return False
+            if isinstance(actual, list):
+                actual = ' '.join(actual)
+            if operator == '=' and actual != value:
+                return False
+            if operator == '*=' and value not in actual:
+                return False
+            if operator == '^=' and not actual.startswith(value):
+                return False
+            if operator == '$=' and not actual.endswith(value):
+                return False
+        return True
+
+    # Index sur la caractéristique la plus sélective
+    if classes:
+        key = ('class', classes[0])
+    elif attributes:
+        key = ('attr', attributes[0][0])
+    elif tag:
+        key = ('tag', tag)
+    else:
+        return None
+    return predicate, key
+
+class SelectorCascade:
+    """
+    Liste de sélecteurs CSS par ordre de priorité, compilée une seule fois
+
+    `first(item)` retourne le même élément que la boucle
+    `for selector in selectors: item.select_one(selector)`, mais en un seul
+    parcours du sous-arbre. Les sélecteurs simples sont indexés par tag,
+    classe ou attribut : chaque descendant n'est testé que contre les
+    sélecteurs qui peuvent lui correspondre. Les autres passent par soupsieve.
+    """
+
+    def __init__(self, selectors):
+        self.selectors = tuple(selectors)
+        self.predicates = []
+        self._by_tag = {}
+        self._by_class = {}
+        self._by_attr = {}
+        self._complex = []
+
+        for index, selector in enumerate(self.selectors):
+            compiled = compile_simple_selector(selector)
+            if compiled is None:
+                self.predicates.append(soupsieve.compile(selector).match)
+                self._complex.append(index)
+                continue
+
+            predicate, (kind, value) = compiled
+            self.predicates.append(predicate)
+            index_map = {'tag': self._by_tag, 'class': self._by_class, 'attr': self._by_attr}[kind]
+            index_map.setdefault(value, []).append(index)
+
+    def _candidates(self, element):
+        """Index des sélecteurs pouvant correspondre à l'élément"""
+        candidates = list(self._complex)
+        candidates.extend(self._by_tag.get(element.name, ()))
+
+        attrs = element.attrs
+        if self._by_class:
+            for class_name in attrs.get('class') or ():
+                candidates.extend(self._by_class.get(class_name, ()))
+        if self._by_attr:
+            for name in attrs:
+                candidates.extend(self._by_attr.get(name, ()))
+        return candidates
+
+    def first_with_index(self, item):
+        """Retourne (élément, index du sélecteur) ou (None, None)"""
+        if not self.selectors:
+            return None, None
+
+        # Arbres non-bs4 (selectolax) : cascade classique
+        if not isinstance(item, Tag):
+            for index, selector in enumerate(self.selectors):
+                element = item.select_one(selector)
+                if element:
+                    return element, index
+            return None, None
+
+        best_element = None
+        best_index = len(self.selectors)
+
+        complex_indexes = self._complex
+
+        for element in item.descendants:
+            if not isinstance(element, Tag):
+                continue
+
+            # Seuls les sélecteurs plus prioritaires que le meilleur actuel comptent
+            for index in sorted(self._candidates(element)):
+                if index >= best_index:
+                    break
+                if index in complex_indexes:
+                    matched = self.predicates[index](element)
+                else:
+                    matched = self.predicates[index](element.name, element.attrs)
+                if matched:
+                    best_element = element
+                    best_index = index
+                    break
+
+            if best_index == 0:
+                break
+
+        if best_element is None:
+            return None, None
+        return best_element, best_index
+
+    def first(self, item):
+        """Premier élément trouvé, dans l'ordre de priorité des sélecteurs"""
+        return self.first_with_index(item)[0]
+
+@lru_cache(maxsize=256)
+def _compile_cascade(selectors):
+    return SelectorCascade(selectors)
+
+def get_cascade(selectors):
+    """Cascade compilée partagée pour une liste de sélecteurs"""
+    return _compile_cascade(tuple(selectors))
@@ -0,0 +1,209 @@
+# scraper/streaming.py
+
+import codecs
+import itertools
+import re
+from html import escape
+from html.parser import HTMLParser
+
+from scraper.selector_cascade import compile_simple_selector
+
+# Éléments sans balise fermante
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+])
+
+def compile_descendant_selector(selector):
+    """
+    Compile un sélecteur simple ou descendant ('.liste .item', 'table tr')
+
+    Returns:
+        Liste de prédicats (nom, attributs), du plus externe au plus interne,
+        ou None si le sélecteur utilise d'autres combinateurs
+    """
+    if any(combinator in selector for combinator in '>+~,'):
+        return None
+
+    chain = []
+    for part in selector.split():
+        compiled = compile_simple_selector(part)
+        if compiled is None:
+            return None
+        chain.append(compiled[0])
+    return chain or None
+
+# Octets examinés pour trouver un <meta charset> (pré-analyse HTML5)
+PRESCAN_BYTES = 1024
+# <meta charset="..."> ou <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET_RE = re.compile(rb'<meta\b[^>]*?charset\s*=\s*["\']?\s*([-\w.:]+)', re.I)
+
+def sniff_encoding(head):
+    """Encodage déclaré au début du document (BOM ou <meta>), None sinon"""
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    match = META_CHARSET_RE.search(head[:PRESCAN_BYTES])
+    if not match:
+        return None
+    try:
+        encoding = codecs.lookup(match.group(1).decode('ascii')).name
+    except (LookupError, UnicodeDecodeError):
+        return None
+    # Un document lu comme octets ne peut pas être en UTF-16 (règle HTML5)
+    return 'utf-8' if encoding.startswith('utf-16') else encoding
+
+def decode_chunks(chunks, encoding=None):
+    """
+    Décode un flux d'octets en texte, sans couper les caractères multi-octets
+
+    Sans `encoding` (charset absent du Content-Type), les premiers octets
+    sont examinés comme le fait BeautifulSoup : BOM puis <meta charset> ou
+    http-equiv ; à défaut, UTF-8.
+    """
+    chunks = iter(chunks)
+    head = b''
+    if encoding is None:
+        # Accumuler assez d'octets pour la pré-analyse avant de décoder
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= PRESCAN_BYTES:
+                break
+        encoding = sniff_encoding(head)
+
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    for chunk in itertools.chain([head], chunks):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+class ContainerStreamParser(HTMLParser):
+    """
+    Parser HTML incrémental qui extrait les conteneurs au fil du téléchargement
+
+    `watchers` associe un type de conteneur à sa liste de sélecteurs
+    ({'produit': ['.product', '.item']}). Chaque conteneur refermé est
+    disponible via `drain()` sous forme de fragment HTML (type, html).
+    Seul le HTML du conteneur en cours est conservé en mémoire.
+
+    Comme `find_elements_by_selectors`, un seul sélecteur est retenu par
+    type : le premier qui correspond dans le document. Les sélecteurs
+    autres que simples ou descendants sont ignorés.
+    """
+
+    def __init__(self, watchers):
+        super().__init__(convert_charrefs=True)
+        self._watchers = []
+        for kind, selectors in watchers.items():
+            chains = [compile_descendant_selector(selector) for selector in selectors]
+            self._watchers.append((kind, [chain for chain in chains if chain]))
+        self._locked = {}
+        self._stack = []
+        self._capture = None
+        self._completed = []
+
+    def _chain_matches(self, chain, name, attrs):
+        if not chain[-1](name, attrs):
+            return False
+
+        # Ancêtres : correspondance gloutonne du plus proche au plus lointain
+        remaining = len(chain) - 2
+        for ancestor_name, ancestor_attrs in reversed(self._stack):
+            if remaining < 0:
+                break
+            if chain[remaining](ancestor_name, ancestor_attrs):
+                remaining -= 1
+        return remaining < 0
+
+    def _match(self, name, attrs):
+        """Type du conteneur ouvert par ce tag (ou None)"""
+        for kind, chains in self._watchers:
+            locked = self._locked.get(kind)
+            candidates = [locked] if locked is not None else range(len(chains))
+            for index in candidates:
+                if self._chain_matches(chains[index], name, attrs):
+                    self._locked[kind] = index
+                    return kind
+        return None
+
+    def _finish_capture(self):
+        capture = self._capture
+        self._capture = None
+        self._completed.append((capture['kind'], ''.join(capture['parts'])))
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: value or '' for name, value in attrs}
+
+        if self._capture is not None:
+            self._capture['parts'].append(self.get_starttag_text())
+            if tag == self._capture['tag'] and tag not in VOID_ELEMENTS:
+                self._capture['depth'] += 1
+        else:
+            kind = self._match(tag, attrs)
+            if kind is not None and tag in VOID_ELEMENTS:
+                self._completed.append((kind, self.get_starttag_text()))
+            elif kind is not None:
+                self._capture = {
+                    'kind': kind,
+                    'tag': tag,
+                    'depth': 1,
+                    'base': len(self._stack),
+                    'parts': [self.get_starttag_text()]
+                }
+
+        if tag not in VOID_ELEMENTS:
+            self._stack.append((tag, attrs))
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/>, <img ... /> : pas de contenu, pas de fermeture attendue
+        if self._capture is not None:
+            self._capture['parts'].append(self.get_starttag_text())
+            return
+
+        kind = self._match(tag, {name: value or '' for name, value in attrs})
+        if kind is not None:
+            self._completed.append((kind, self.get_starttag_text()))
+
+    def handle_endtag(self, tag):
+        capture = self._capture
+        if capture is not None:
+            # Un ancêtre se ferme sans que la balise soit ouverte dans le conteneur :
+            # le conteneur était implicitement fermé
+            if (tag != capture['tag']
+                    and not any(name == tag for name, _ in self._stack[capture['base']:])
+                    and any(name == tag for name, _ in self._stack[:capture['base']])):
+                self._finish_capture()
+            else:
+                capture['parts'].append(f"</{tag}>")
+                if tag == capture['tag']:
+                    capture['depth'] -= 1
+                    if capture['depth'] == 0:
+                        self._finish_capture()
+
+        # Dépiler jusqu'à l'élément fermé (balises non fermées tolérées)
+        for position in range(len(self._stack) - 1, -1, -1):
+            if self._stack[position][0] == tag:
+                del self._stack[position:]
+                break
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            # Contenu de <script>/<style> : texte brut, à ne pas échapper
+            if self.cdata_elem:
+                self._capture['parts'].append(data)
+            else:
+                self._capture['parts'].append(escape(data, quote=False))
+
+    def close(self):
+        super().close()
+        # Document tronqué : livrer le conteneur entamé
+        if self._capture is not None:
+            self._finish_capture()
+
+    def drain(self):
+        """Retourne et oublie les conteneurs complets depuis le dernier appel"""
+        completed = self._completed
+        self._completed = []
+        return completed
@@ -0,0 +1,158 @@
+# scraper/structure_detector.py
+
+import math
+import re
+
+from bs4 import Tag
+from bs4.element import NavigableString, PreformattedString
+
+# Tags qui ne peuvent pas être des enregistrements
+IGNORED_TAGS = frozenset([
+    'script', 'style', 'noscript', 'template', 'head', 'meta', 'link',
+    'br', 'hr', 'option', 'svg', 'path'
+])
+
+DIGITS_RE = re.compile(r'\d+')
+
+def _children(element):
+    """Enfants éléments (bs4 ou FastNode)"""
+    if isinstance(element, Tag):
+        return [child for child in element.contents if isinstance(child, Tag)]
+    return element.children
+
+def _own_text_length(element):
+    """Longueur du texte porté directement par l'élément"""
+    if isinstance(element, Tag):
+        return sum(
+            len(child.strip()) for child in element.contents
+            if isinstance(child, NavigableString) and not isinstance(child, PreformattedString)
+        )
+    return len(element.own_text.strip())
+
+def _classes(element):
+    classes = element.get('class') or []
+    if isinstance(classes, str):
+        classes = classes.split()
+    return classes
+
+def node_key(element):
+    """Tag + classes, chiffres normalisés ('item-42' et 'item-7' sont équivalents)"""
+    classes = sorted(set(DIGITS_RE.sub('0', c) for c in _classes(element)))
+    return (element.name, tuple(classes))
+
+def group_selector(items):
+    """Sélecteur CSS simple commun à un groupe d'éléments (tag + classes partagées)"""
+    shared = None
+    for item in items:
+        classes = [c for c in _classes(item) if not DIGITS_RE.search(c)]
+        shared = classes if shared is None else [c for c in shared if c in classes]
+    return items[0].name + ''.join(f'.{c}' for c in shared or [])
+
+def detect_record_group(root, min_repeat=3, keywords=()):
+    """
+    Détecte le groupe d'éléments répétés le plus probable comme liste d'enregistrements
+
+    Un seul parcours (post-ordre) de l'arbre : chaque élément reçoit une
+    empreinte de forme (son tag/classes et ceux de ses enfants) et des
+    statistiques sur son sous-arbre (taille, texte, liens, images). Les
+    enfants d'un même parent ayant la même empreinte forment un groupe ;
+    le mieux noté l'emporte (répétitions × richesse du sous-arbre).
+
+    Un élément dont tous les enfants ont la même forme peut n'être qu'une
+    enveloppe (rangée d'une grille) : les enfants réunis d'un groupe
+    d'enveloppes sont notés comme un groupe (10 rangées de 4 produits
+    donnent 40 produits) et l'emportent sur les enveloppes à score égal.
+    Les éléments retournés ont la même forme, sans doublon ni imbrication,
+    dans l'ordre du document. Égalité de score : le premier groupe gagne.
+
+    Args:
+        root: Soup bs4 ou FastNode
+        min_repeat: Nombre minimal de répétitions
+        keywords: Mots-clés de classe favorisant un groupe ('product', 'news'...)
+
+    Returns:
+        {'items': [...], 'selector': 'div.card', 'score': float} ou None
+    """
+    # stats[id] = (taille du sous-arbre, longueur de texte, contient un lien,
+    #             contient une image, formes des enfants)
+    stats = {}
+    # wrapped[id] = (forme, [(élément, stats)]) : enfants d'une enveloppe,
+    # eux-mêmes développés s'ils sont des enveloppes
+    wrapped = {}
+    best = None
+
+    stack = [(root, None)]
+    while stack:
+        element, children = stack.pop()
+
+        if children is None:
+            # Premier passage : les enfants seront traités avant l'élément
+            children = _children(element)
+            stack.append((element, children))
+            stack.extend((child, None) for child in reversed(children) if child.name not in IGNORED_TAGS)
+            continue
+
+        size, text = 1, _own_text_length(element)
+        has_link, has_image = element.name == 'a', element.name == 'img'
+        groups = {}
+        for child in children:
+            child_stats = stats.pop(id(child), None)
+            child_wrapped = wrapped.pop(id(child), None)
+            if child_stats is None:
+                continue
+            size += child_stats[0]
+            text += child_stats[1]
+            has_link = has_link or child_stats[2]
+            has_image = has_image or child_stats[3]
+
+            # Forme : tag/classes de l'élément et ensemble de ceux de ses enfants
+            shape = (node_key(child), child_stats[4])
+            groups.setdefault(shape, []).append((child, child_stats, child_wrapped))
+        stats[id(element)] = (size, text, has_link, has_image, frozenset(node_key(child) for child in children))
+
+        if len(groups) == 1:
+            (shape, members), = groups.items()
+            if len(members) >= 2:
+                wrapped[id(element)] = (shape, _unwrap(members) or _plain(members))
+
+        for members in groups.values():
+            # Les enveloppes et leurs enfants réunis concourent ; à score égal, les enfants
+            for candidate in (_unwrap(members), _plain(members)):
+                if not candidate or len(members) < 2 or len(candidate) < min_repeat:
+                    continue
+                score = _score(candidate, keywords)
+                if score and (best is None or score > best[0]):
+                    best = (score, [child for child, _ in candidate])
+
+    if best is None:
+        return None
+    score, items = best
+    return {'items': items, 'selector': group_selector(items), 'score': score}
+
+def _plain(members):
+    return [(child, child_stats) for child, child_stats, _ in members]
+
+def _unwrap(members):
+    """Enfants réunis des membres si ce sont tous des enveloppes de même forme, sinon None"""
+    contents = [member[2] for member in members]
+    if all(contents) and len({content[0] for content in contents}) == 1:
+        return [item for content in contents for item in content[1]]
+    return None
+
+def _score(members, keywords):
+    """Répétitions × richesse moyenne (taille, texte, liens et images)"""
+    count = len(members)
+    avg_size = sum(s[0] for _, s in members) / count
+    with_text = sum(1 for _, s in members if s[1]) / count
+    if avg_size < 2 or with_text < 0.5:
+        return 0
+
+    link_ratio = sum(1 for _, s in members if s[2]) / count
+    image_ratio = sum(1 for _, s in members if s[3]) / count
+    score = count * math.log2(1 + avg_size) ** 2 * with_text * (1 + link_ratio + image_ratio / 2)
+
+    if keywords:
+        classes = ' '.join(node_key(members[0][0])[1]).lower()
+        if any(keyword in classes for keyword in keywords):
+            score *= 2
+    return score
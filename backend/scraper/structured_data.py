@@ -0,0 +1,268 @@
+# scraper/structured_data.py
+
+import json
+import re
+
+# Balises <script> : attributs et contenu (scan des octets, sans construire de DOM)
+SCRIPT_RE = re.compile(rb'<script\b([^>]*)>(.*?)</script\s*>', re.S | re.I)
+LD_JSON_RE = re.compile(rb'type\s*=\s*["\']?application/ld\+json', re.I)
+JSON_TYPE_RE = re.compile(rb'type\s*=\s*["\']?application/json', re.I)
+NEXT_DATA_RE = re.compile(rb'id\s*=\s*["\']?__NEXT_DATA__', re.I)
+STATE_ASSIGNMENT_RE = re.compile(r'window\.(__INITIAL_STATE__|__PRELOADED_STATE__)\s*=\s*')
+
+# Marqueurs recherchés avant tout parsing : absents, la page n'a pas de données structurées
+MARKERS = (b'ld+json', b'__NEXT_DATA__', b'__INITIAL_STATE__', b'__PRELOADED_STATE__', b'application/json')
+
+ARTICLE_TYPES = {'NewsArticle', 'Article', 'ReportageNewsArticle', 'AnalysisNewsArticle', 'BlogPosting'}
+
+NAME_KEYS = ('name', 'title', 'productName', 'displayName')
+PRICE_KEYS = ('price', 'salePrice', 'currentPrice', 'finalPrice', 'prix')
+CURRENCY_KEYS = ('priceCurrency', 'currency', 'currencyCode')
+IMAGE_KEYS = ('image', 'imageUrl', 'image_url', 'thumbnail', 'img')
+# Clés propres à un produit : un objet nom + prix sans aucune d'elles (mode de
+# livraison, option, forfait...) n'est pas retenu
+PRODUCT_SIGNAL_KEYS = ('sku', 'productId', 'product_id', 'gtin', 'gtin13', 'ean', 'mpn', 'url', 'href', 'slug') + IMAGE_KEYS
+
+CURRENCY_SYMBOLS = {'EUR': '€', 'USD': '$', 'GBP': '£', 'JPY': '¥'}
+
+_decoder = json.JSONDecoder()
+
+def _to_bytes(html):
+    if isinstance(html, str):
+        return html.encode('utf-8')
+    return html or b''
+
+def _loads(raw):
+    try:
+        return json.loads(raw)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+def iter_json_blobs(html):
+    """
+    Blobs JSON embarqués dans la page : (source, données)
+
+    Sources : 'json-ld' (application/ld+json), 'next-data' (__NEXT_DATA__),
+    'initial-state' (window.__INITIAL_STATE__ = {...}) et 'json'
+    (application/json, y compris les réponses d'API rejouées dont le corps
+    est lui-même du JSON encodé en chaîne).
+    """
+    html = _to_bytes(html)
+    if not any(marker in html for marker in MARKERS):
+        return
+
+    for match in SCRIPT_RE.finditer(html):
+        attrs, body = match.group(1), match.group(2).strip()
+        if not body:
+            continue
+
+        if LD_JSON_RE.search(attrs):
+            # Les éditeurs entourent parfois le JSON-LD de commentaires HTML
+            data = _loads(body.strip(b'<!->\n\r\t '))
+            if data is not None:
+                yield 'json-ld', data
+        elif NEXT_DATA_RE.search(attrs):
+            data = _loads(body)
+            if data is not None:
+                yield 'next-data', data
+        elif JSON_TYPE_RE.search(attrs):
+            data = _loads(body)
+            if data is None:
+                continue
+            yield 'json', data
+            nested = data.get('body') if isinstance(data, dict) else None
+            if isinstance(nested, str) and nested[:1] in ('{', '['):
+                nested = _loads(nested)
+                if nested is not None:
+                    yield 'json', nested
+        elif b'_STATE__' in body:
+            text = body.decode('utf-8', errors='replace')
+            for assignment in STATE_ASSIGNMENT_RE.finditer(text):
+                try:
+                    data, _ = _decoder.raw_decode(text, assignment.end())
+                except ValueError:
+                    # Littéral JavaScript (undefined, fonctions...) : pas du JSON
+                    continue
+                yield 'initial-state', data
+
+def iter_objects(data):
+    """Tous les objets (dict) d'un document JSON, en profondeur"""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            yield value
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+
+def _types(obj):
+    types = obj.get('@type') or []
+    if isinstance(types, str):
+        types = [types]
+    return {t.split('/')[-1] for t in types if isinstance(t, str)}
+
+def _first(value):
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+def _scalar(value, keys=('value', 'amount', 'raw', 'current', 'price')):
+    """Valeur simple d'un champ éventuellement imbriqué ({'raw': 1.2, 'fmt': '1,20'})"""
+    value = _first(value)
+    if isinstance(value, dict):
+        for key in keys:
+            if value.get(key) not in (None, ''):
+                return _scalar(value[key], keys)
+        return None
+    return value
+
+def _image(value):
+    value = _first(value)
+    if isinstance(value, dict):
+        value = value.get('url') or value.get('contentUrl') or value.get('src')
+    return value if isinstance(value, str) else ''
+
+def _text(value):
+    value = _scalar(value, ('text', 'value', '@value', 'name'))
+    return str(value).strip() if value is not None else ''
+
+def _product_from_ld(obj):
+    offers = _first(obj.get('offers')) or {}
+    if not isinstance(offers, dict):
+        offers = {}
+    price = offers.get('price', offers.get('lowPrice'))
+    if price is None:
+        price = _scalar(offers.get('priceSpecification'))
+    return {
+        'name': _text(obj.get('name')),
+        'price': _scalar(price),
+        'currency': offers.get('priceCurrency') or '',
+        'description': _text(obj.get('description')),
+        'image': _image(obj.get('image')),
+        'url': _text(obj.get('url'))
+    }
+
+def _first_key(obj, keys):
+    for key in keys:
+        if obj.get(key) not in (None, ''):
+            return obj[key]
+    return None
+
+def _product_from_state(obj):
+    price = _first_key(obj, PRICE_KEYS)
+    currency = _first_key(obj, CURRENCY_KEYS)
+    if currency is None and isinstance(price, dict):
+        currency = _first_key(price, CURRENCY_KEYS)
+    return {
+        'name': _text(_first_key(obj, NAME_KEYS)),
+        'price': _scalar(price),
+        'currency': currency if isinstance(currency, str) else '',
+        'description': _text(obj.get('description')),
+        'image': _image(_first_key(obj, IMAGE_KEYS)),
+        'url': _text(obj.get('url') or obj.get('href'))
+    }
+
+def _looks_like_product(obj):
+    """Objet nom + prix portant un signal de produit (type Product, sku, image ou lien)"""
+    if not isinstance(obj, dict) or _first_key(obj, NAME_KEYS) is None or _first_key(obj, PRICE_KEYS) is None:
+        return False
+    typename = obj.get('__typename') or obj.get('@type') or obj.get('type')
+    if isinstance(typename, str) and 'product' in typename.lower():
+        return True
+    return _first_key(obj, PRODUCT_SIGNAL_KEYS) is not None
+
+def _unique(records, key):
+    seen = set()
+    unique = []
+    for record in records:
+        identity = key(record)
+        if identity in seen:
+            continue
+        seen.add(identity)
+        unique.append(record)
+    return unique
+
+def extract_products(html):
+    """
+    Produits déclarés dans la page (JSON-LD Product / ItemList, ou liste de
+    produits d'un état d'hydratation), normalisés en
+    {'name', 'price', 'currency', 'description', 'image', 'url'}
+    """
+    from_ld = []
+    best_state_list = []
+
+    for source, data in iter_json_blobs(html):
+        if source == 'json-ld':
+            from_ld.extend(_product_from_ld(obj) for obj in iter_objects(data) if 'Product' in _types(obj))
+            continue
+
+        # États d'hydratation : la plus longue liste d'objets nom + prix ayant l'air de produits
+        for obj in iter_objects(data):
+            for value in obj.values():
+                if not isinstance(value, list) or len(value) < 2 or len(value) <= len(best_state_list):
+                    continue
+                if sum(1 for item in value if _looks_like_product(item)) * 2 >= len(value):
+                    best_state_list = [item for item in value if _looks_like_product(item)]
+
+    products = from_ld or [_product_from_state(obj) for obj in best_state_list]
+    products = [product for product in products if product['name']]
+    return _unique(products, lambda p: (p['name'], str(p['price']), p['url']))
+
+def extract_articles(html):
+    """Articles JSON-LD (NewsArticle, Article...) : {'headline', 'description', 'date', 'url'}"""
+    articles = []
+    for source, data in iter_json_blobs(html):
+        if source != 'json-ld':
+            continue
+        for obj in iter_objects(data):
+            if not _types(obj) & ARTICLE_TYPES:
+                continue
+            url = obj.get('url')
+            if not url and isinstance(obj.get('mainEntityOfPage'), dict):
+                url = obj['mainEntityOfPage'].get('@id')
+            articles.append({
+                'headline': _text(obj.get('headline') or obj.get('name')),
+                'description': _text(obj.get('description')),
+                'date': _text(obj.get('datePublished') or obj.get('dateCreated')),
+                'url': _text(url)
+            })
+    articles = [article for article in articles if article['headline']]
+    return _unique(articles, lambda a: (a['headline'], a['url']))
+
+def _formatted(value):
+    """Valeur affichée d'un champ Yahoo ({'raw': -0.52, 'fmt': '-0,52 %'})"""
+    if isinstance(value, dict):
+        return value.get('fmt') if value.get('fmt') is not None else value.get('raw')
+    return value
+
+def extract_quotes(html):
+    """
+    Cotations embarquées (format Yahoo Finance : regularMarketPrice...) :
+    {'name', 'symbol', 'price', 'change', 'change_percent'}
+    """
+    quotes = []
+    for source, data in iter_json_blobs(html):
+        if source == 'json-ld':
+            continue
+        for obj in iter_objects(data):
+            if 'regularMarketPrice' not in obj:
+                continue
+            price = _scalar(obj['regularMarketPrice'])
+            if price is None:
+                continue
+            quotes.append({
+                'name': _text(obj.get('shortName') or obj.get('longName') or obj.get('symbol')),
+                'symbol': _text(obj.get('symbol')),
+                'price': price,
+                'change': _formatted(obj.get('regularMarketChange')),
+                'change_percent': _formatted(obj.get('regularMarketChangePercent'))
+            })
+    return _unique(quotes, lambda q: (q['symbol'] or q['name'], str(q['price'])))
+
+def format_price(price, currency=''):
+    """Prix brut lisible ('19.99 €') à partir d'une valeur et d'un code devise"""
+    if price is None or price == '':
+        return ''
+    symbol = CURRENCY_SYMBOLS.get((currency or '').upper(), currency or '')
+    return f"{price} {symbol}".strip()
@@ -0,0 +1,8 @@
+# tests/conftest.py
+#
+# Les modules s'importent depuis backend/ (from scraper.x, from utils.x)
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
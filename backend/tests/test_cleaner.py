@@ -0,0 +1,37 @@
+# tests/test_cleaner.py
+
+import pytest
+from bs4 import BeautifulSoup
+
+from utils import cleaner
+from utils.cleaner import DataCleaner, clean_text
+from utils.records import Product
+
+SAMPLES = [
+    "Prix :  <b>19,90&nbsp;€</b>\n",
+    "<p>Un</p><p>deux &amp; trois</p>",
+    "Q&A <a href='/x?a=1&b=2' class=lien>lien</a>",
+    "&copy 2026 &#233;t&#xE9; &unknown; 5 < 6",
+    "<script>var x = '<b>';</script>texte",
+    "<!-- commentaire -->visible",
+    "sans balise",
+]
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_fast_cleaning_matches_beautifulsoup(text):
+    expected = ' '.join(BeautifulSoup(text, "html.parser").get_text().split())
+    assert clean_text(text) == expected
+
+def test_parallel_clean_matches_sequential(monkeypatch):
+    records = [Product(nom=f" <b>Produit</b> {i} ", prix_brut=f"{i},50 €", index=i) for i in range(40)]
+    data_cleaner = DataCleaner(site_type="ecommerce").configure({'convert_prices': True})
+    sequential = data_cleaner.clean(records)
+
+    # Pool de processus forcé même sur une machine à un cœur
+    monkeypatch.setattr(cleaner, 'PARALLEL_MIN_RECORDS', 10)
+    monkeypatch.setattr(cleaner.os, 'cpu_count', lambda: 2)
+    parallel = data_cleaner.clean(records, workers=2, chunk_size=7)
+
+    assert parallel == sequential
+    assert all(type(record) is Product for record in parallel)
+    assert sequential[3]['nom'] == "Produit 3" and sequential[3]['prix_valeur'] == 3.5
@@ -0,0 +1,13 @@
+# tests/test_columnar.py
+
+import pandas as pd
+
+from utils.cleaner import DataCleaner
+from utils.columnar import clean_site_columns
+
+def test_bourse_site_types_match_cleaner():
+    for site_type in ("bourse", "boursier"):
+        frame = clean_site_columns(pd.DataFrame({"variation": ["+1.5% ", "-0.2%"]}), site_type)
+        expected = [DataCleaner(site_type=site_type).clean_item({"variation": value})["variation"]
+                    for value in ["+1.5% ", "-0.2%"]]
+        assert list(frame["variation"]) == expected
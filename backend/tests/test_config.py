@@ -0,0 +1,21 @@
+# tests/test_config.py
+
+import json
+
+from config.scraper_config import ScrapingConfig, load_scraping_config
+from scraper.base_scraper import BaseScraper
+
+def test_config_loaded_once_per_process():
+    assert load_scraping_config() is load_scraping_config()
+    first = BaseScraper("https://exemple.fr/a")
+    second = BaseScraper("https://exemple.fr/b")
+    assert first.circuit_breaker is second.circuit_breaker
+
+def test_merge_keeps_defaults_untouched(tmp_path):
+    config_file = tmp_path / "scraper_config.json"
+    config_file.write_text(json.dumps({"general": {"max_retries": 9}}), encoding='utf-8')
+    defaults = json.dumps(ScrapingConfig.DEFAULT_CONFIG, sort_keys=True)
+
+    assert ScrapingConfig(config_file).get('general.max_retries') == 9
+    assert json.dumps(ScrapingConfig.DEFAULT_CONFIG, sort_keys=True) == defaults
+    assert ScrapingConfig(tmp_path / "absent.json").get('general.max_retries') == 3
@@ -0,0 +1,29 @@
+# tests/test_fingerprint.py
+
+from scraper.e_commerce_scraper import EcommerceScraper
+from utils.fingerprint import content_fingerprint
+from utils.selector_stats import SelectorStats
+
+PAGE = '<div class="product"><h2>A</h2><span class="title">B</span><span class="price">1 €</span></div>'
+
+def make_scraper():
+    scraper = EcommerceScraper("https://exemple.fr/catalogue")
+    scraper.disable_templates()
+    scraper.selector_stats = SelectorStats(min_samples=3)
+    return scraper
+
+def test_scope_follows_selector_reordering():
+    scraper = make_scraper()
+    before = content_fingerprint(PAGE, scraper._fingerprint_scope())
+
+    # Quelques essais où seul '.title' correspond : la cascade 'name' est réordonnée
+    for _ in range(3):
+        scraper.selector_stats.record("exemple.fr", "name", ".title")
+    assert scraper.selector_stats.order("exemple.fr", "name", scraper.selectors['name'])[0] == ".title"
+
+    after = content_fingerprint(PAGE, scraper._fingerprint_scope())
+    assert after != before
+
+def test_scope_stable_without_reordering():
+    first, second = make_scraper(), make_scraper()
+    assert first._fingerprint_scope() == second._fingerprint_scope()
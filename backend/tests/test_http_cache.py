@@ -0,0 +1,133 @@
+# tests/test_http_cache.py
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scraper.base_scraper import BaseScraper
+from utils.http_cache import HttpCache
+
+PAGE = b"<html><body><p>page</p></body></html>"
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Page avec ETag : 304 si If-None-Match correspond"""
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('ETag', '"v1"')
+            self.send_header('Cache-Control', self.server.revalidation_cache_control)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ETagHandler)
+    httpd.revalidation_cache_control = 'no-cache'
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def make_scraper(url, directory):
+    scraper = BaseScraper(url)
+    scraper.max_retries = 0
+    scraper.enable_cache(directory=directory)
+    return scraper
+
+def test_revalidation_serves_cached_body(server, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/page"
+    scraper = make_scraper(url, tmp_path / "revalidation")
+    assert scraper.get_html_requests(url) == PAGE
+    assert scraper.get_html_requests(url) == PAGE
+    assert scraper.http_cache.stats['revalidated'] == 1
+
+def test_304_with_missing_body_refetches_page(server, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/page"
+    scraper = make_scraper(url, tmp_path / "missing")
+    assert scraper.get_html_requests(url) == PAGE
+
+    # Corps évincé pendant l'aller-retour réseau : après lookup(), avant le 304
+    cache = scraper.http_cache
+    original_headers = cache.conditional_headers
+    def headers_then_evict(entry):
+        cache._body_path(entry['key']).unlink()
+        return original_headers(entry)
+    cache.conditional_headers = headers_then_evict
+    assert scraper.get_html_requests(url) == PAGE
+    cache.conditional_headers = original_headers
+
+    # Le cache n'est pas empoisonné : ni cette instance ni une nouvelle ne lisent b''
+    assert scraper.get_html_requests(url) == PAGE
+    assert make_scraper(url, tmp_path / "missing").get_html_requests(url) == PAGE
+
+def test_no_store_on_304_drops_entry(server, tmp_path):
+    server.revalidation_cache_control = 'no-store'
+    url = f"http://127.0.0.1:{server.server_port}/page"
+    scraper = make_scraper(url, tmp_path / "no-store")
+    assert scraper.get_html_requests(url) == PAGE
+    assert scraper.get_html_requests(url) == PAGE
+    assert scraper.http_cache.lookup(url) is None
+
+def test_stats_count_each_fetch_once(server, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/page"
+    scraper = make_scraper(url, tmp_path / "stats")
+    scraper.get_html_requests(url)
+    scraper.get_html_requests(url)
+    # Un miss par URL absente du cache, la revalidation ne compte pas comme un miss
+    scraper.get_html_requests(f"http://127.0.0.1:{server.server_port}/autre")
+    stats = scraper.http_cache.stats
+    assert (stats['misses'], stats['revalidated'], stats['stored']) == (2, 1, 2)
+
+def test_store_requires_validator_or_max_age(tmp_path):
+    cache = HttpCache(tmp_path)
+    assert not cache.store("http://a/", {}, b"x")
+    assert not cache.store("http://a/", {'ETag': '"1"', 'Cache-Control': 'no-store'}, b"x")
+    assert cache.store("http://a/", {'ETag': '"1"'}, b"x")
+    assert cache.lookup("http://a/")['etag'] == '"1"'
+
+def test_fresh_entry_served_without_request(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store("http://a/", {'Cache-Control': 'max-age=60'}, b"frais")
+    cache.store("http://b/", {'Cache-Control': 'max-age=60, no-cache'}, b"a revalider")
+    assert cache.get_fresh("http://a/") == b"frais"
+    assert cache.get_fresh("http://b/") is None
+    assert cache.stats['hits'] == 1
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache = HttpCache(tmp_path, max_size_mb=25 / (1024 * 1024))
+    for name in "abc":
+        cache.store(f"http://{name}/", {'ETag': '"1"'}, b"0123456789")
+        if name == "b":
+            # 'a' utilisé après 'b' : 'b' devient le moins récent
+            cache.read_body(cache.lookup("http://a/"))
+    assert cache.lookup("http://b/") is None
+    assert cache.lookup("http://a/") is not None
+    assert cache.lookup("http://c/") is not None
+    assert cache.stats['evicted'] == 1
+
+def test_index_reloaded_from_disk(tmp_path):
+    HttpCache(tmp_path).store("http://a/", {'ETag': '"1"'}, b"corps")
+    cache = HttpCache(tmp_path)
+    assert cache.read_body(cache.lookup("http://a/")) == b"corps"
+
+def test_stale_entry_revalidated_then_refreshed(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store("http://a/", {'ETag': '"1"', 'Cache-Control': 'max-age=0'}, b"corps")
+    entry = cache.lookup("http://a/")
+    assert not cache.is_fresh(entry)
+    assert cache.conditional_headers(entry) == {'If-None-Match': '"1"'}
+
+    assert cache.revalidated(entry, {'ETag': '"2"', 'Cache-Control': 'max-age=60'}) == b"corps"
+    refreshed = cache.lookup("http://a/")
+    assert refreshed['etag'] == '"2"' and cache.is_fresh(refreshed)
@@ -0,0 +1,32 @@
+# tests/test_rate_limiter.py
+
+import pytest
+
+from utils import rate_limiter
+from utils.rate_limiter import HostRateLimiter
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', lambda: now[0])
+    return now
+
+def test_interval_spaces_requests_per_host(clock):
+    limiter = HostRateLimiter()
+    assert limiter.reserve("https://a.fr/1", 2) == 0
+    assert limiter.reserve("https://a.fr/2", 2) == pytest.approx(2)
+    assert limiter.reserve("https://a.fr/3", 2) == pytest.approx(4)
+    # Autre hôte : seau indépendant
+    assert limiter.reserve("https://b.fr/1", 2) == 0
+
+def test_tokens_refill_and_burst(clock):
+    limiter = HostRateLimiter()
+    assert [limiter.reserve("https://a.fr/", 1, burst=3) for _ in range(4)] == [0, 0, 0, pytest.approx(1)]
+    clock[0] += 10
+    # Jamais plus de `burst` jetons accumulés
+    assert [limiter.reserve("https://a.fr/", 1, burst=3) for _ in range(3)] == [0, 0, 0]
+    assert limiter.reserve("https://a.fr/", 1, burst=3) == pytest.approx(1)
+
+def test_zero_interval_never_waits(clock):
+    limiter = HostRateLimiter()
+    assert all(limiter.reserve("https://a.fr/", 0) == 0 for _ in range(5))
@@ -0,0 +1,99 @@
+# tests/test_records.py
+
+import csv
+import json
+import pickle
+
+import pytest
+
+from utils.cleaner import DataCleaner
+from utils.exporter import export_data
+from utils.records import NewsItem, Product, Quote, RecordBatch, record_type, restore_records
+
+def make_batch():
+    return RecordBatch([
+        Product(nom="Pull", prix="39,90 €", index=1),
+        {'titre': "Article", 'lien': "https://exemple.fr/a"},
+    ])
+
+def test_rows_are_read_only():
+    batch = make_batch()
+    with pytest.raises(TypeError):
+        batch[0]['index'] = 2
+    with pytest.raises(TypeError):
+        del batch[0]['prix']
+    for row in batch:
+        with pytest.raises(TypeError):
+            row['url_source'] = "https://exemple.fr"
+    with pytest.raises(TypeError):
+        batch[1].update(titre="Autre")
+    assert batch[0]['index'] == 1
+    assert 'url_source' not in batch[1]
+
+def test_rows_keep_their_class_and_copy_is_writable():
+    batch = make_batch()
+    row = batch[0]
+    assert isinstance(row, Product) and record_type(row) is Product
+    assert isinstance(batch[1], dict)
+
+    record = row.copy()
+    assert type(record) is Product
+    record['index'] = 2
+    batch[0] = record
+    assert batch[0]['index'] == 2
+    assert type(batch[0].copy()) is Product
+
+def test_set_field_writes_every_row():
+    batch = make_batch()
+    batch.set_field('url_source', "https://exemple.fr")
+    assert batch.column('url_source') == ["https://exemple.fr"] * 2
+
+def test_rows_pickle_and_clean_like_records():
+    batch = make_batch()
+    assert pickle.loads(pickle.dumps(list(batch))) == list(batch)
+
+    cleaned = DataCleaner().clean(batch)
+    assert isinstance(cleaned, RecordBatch)
+    assert [record_type(row) for row in cleaned] == [Product, dict]
+
+def test_round_trip_keeps_classes_fields_and_order():
+    records = [
+        Product(nom="Pull", prix="39,90 €", index=1),
+        Quote(nom="ACME", variation_pourcentage="+1,2%", type='cotation'),
+        NewsItem(titre="Article", lien="https://exemple.fr/a"),
+        {'titre': "Libre", 'extra': [1, 2]},
+    ]
+    records[0]['couleur'] = "rouge"
+    batch = RecordBatch(records)
+
+    assert len(batch) == 4
+    assert [record_type(row) for row in batch] == [Product, Quote, NewsItem, dict]
+    assert list(batch) == records
+    assert list(batch[0]) == ['nom', 'prix', 'index', 'couleur']
+    assert 'prix' not in batch[2]
+    assert batch.column('nom') == ["Pull", "ACME", None, None]
+    assert list(batch[1:3]) == records[1:3]
+
+    del batch[1]
+    batch.insert(0, Quote(nom="INITECH"))
+    assert [row.get('nom') for row in batch] == ["INITECH", "Pull", None, None]
+
+def test_json_export_restores_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    batch = make_batch()
+    assert export_data(batch, "lot", "json")
+    exported = json.loads((tmp_path / "lot.json").read_text(encoding='utf-8'))
+    assert exported['data'] == [dict(row) for row in batch]
+
+    kinds = [record_type(row).__name__ for row in batch]
+    restored = restore_records(exported['data'], kinds)
+    assert [type(record) for record in restored] == [Product, dict]
+    assert restored == list(batch)
+
+def test_csv_export_of_batch(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert export_data(make_batch(), "lot", "csv")
+    with open(tmp_path / "lot.csv", newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['nom'] for row in rows] == ["Pull", ""]
+    assert rows[1]['lien'] == "https://exemple.fr/a"
@@ -0,0 +1,88 @@
+# tests/test_retry.py
+
+import pytest
+
+from utils import retry
+from utils.retry import CircuitBreaker, backoff_delay, parse_retry_after
+
+URL = "https://exemple.fr/page"
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(retry.time, 'monotonic', clock)
+    return clock
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(URL)
+
+def test_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    breaker.record_failure(URL)
+    breaker.record_failure(URL)
+    assert breaker.allow(URL)
+    breaker.record_failure(URL)
+    assert not breaker.allow(URL)
+    # Un autre hôte n'est pas concerné
+    assert breaker.allow("https://autre.fr/")
+
+def test_half_open_allows_a_single_probe(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    open_breaker(breaker)
+    clock.now += 10
+    assert breaker.allow(URL)
+    assert breaker.status()['exemple.fr']['state'] == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow(URL)
+
+def test_probe_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    open_breaker(breaker)
+    clock.now += 10
+    assert breaker.allow(URL)
+    breaker.record_success(URL)
+    assert breaker.allow(URL) and breaker.allow(URL)
+    assert breaker.status()['exemple.fr']['failures'] == 0
+
+def test_probe_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    open_breaker(breaker)
+    clock.now += 10
+    assert breaker.allow(URL)
+    breaker.record_failure(URL)
+    assert breaker.status()['exemple.fr']['state'] == CircuitBreaker.OPEN
+    assert not breaker.allow(URL)
+    clock.now += 10
+    assert breaker.allow(URL)
+
+def test_unrecorded_probe_is_replaced_after_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    open_breaker(breaker)
+    clock.now += 10
+    assert breaker.allow(URL)
+    # Ni succès ni échec enregistré pour la requête de test
+    clock.now += 5
+    assert not breaker.allow(URL)
+    clock.now += 5
+    assert breaker.allow(URL)
+
+def test_retry_after_extends_open_period(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure(URL, retry_after=60)
+    clock.now += 30
+    assert not breaker.allow(URL)
+    clock.now += 30
+    assert breaker.allow(URL)
+
+def test_backoff_and_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("bientôt") is None
+    assert backoff_delay(3, retry_after=7) == 7
+    assert all(0 <= backoff_delay(attempt, 0.5, 2) <= 2 for attempt in range(10))
@@ -0,0 +1,110 @@
+# tests/test_sitemap.py
+
+import io
+
+import pytest
+
+from utils.sitemap import SitemapWatermarks, iter_sitemap
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://exemple.fr/a</loc><lastmod>2026-10-01</lastmod></url>
+  <url><loc>https://exemple.fr/b</loc></url>
+</urlset>"""
+
+class FakeRaw(io.BytesIO):
+    decode_content = False
+    auto_close = True
+
+class FakeResponse:
+    """Réponse requests minimale ouverte en streaming"""
+
+    def __init__(self, body, content_type="application/xml"):
+        self.headers = {'Content-Type': content_type}
+        self.raw = FakeRaw(body)
+
+    def close(self):
+        self.raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def test_sitemap_read_through_fetch():
+    failures = []
+    pages = list(iter_sitemap("https://exemple.fr/sitemap.xml", fetch=lambda url: FakeResponse(SITEMAP), failures=failures))
+    assert [page for page, _ in pages] == ["https://exemple.fr/a", "https://exemple.fr/b"]
+    assert pages[1][1] is None
+    assert failures == []
+
+def test_html_error_page_is_a_failure_not_an_empty_sitemap():
+    failures = []
+    blocked = lambda url: FakeResponse(b"<html><body>Access denied</body></html>", "text/html; charset=utf-8")
+    assert list(iter_sitemap("https://exemple.fr/sitemap.xml", fetch=blocked, failures=failures)) == []
+    assert failures == ["https://exemple.fr/sitemap.xml"]
+
+def test_unreachable_sitemap_is_a_failure():
+    failures = []
+    assert list(iter_sitemap("https://exemple.fr/sitemap.xml", fetch=lambda url: None, failures=failures)) == []
+    assert failures == ["https://exemple.fr/sitemap.xml"]
+
+DATED_SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://exemple.fr/d</loc><lastmod>2026-10-04</lastmod></url>
+  <url><loc>https://exemple.fr/b</loc><lastmod>2026-10-02</lastmod></url>
+  <url><loc>https://exemple.fr/a</loc><lastmod>2026-10-01</lastmod></url>
+  <url><loc>https://exemple.fr/c</loc><lastmod>2026-10-03</lastmod></url>
+</urlset>"""
+
+class FakeScraper:
+    """Scraper dont les téléchargements de sitemap sont simulés"""
+
+    def __init__(self, body=DATED_SITEMAP):
+        self.body = body
+
+    def get_html_requests(self, url, stream=False):
+        return FakeResponse(self.body) if self.body is not None else None
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    import main
+
+    manager = main.ScrapingManager()
+    watermarks = SitemapWatermarks(tmp_path / "marques.json")
+    monkeypatch.setattr(manager, 'marques_sitemap', lambda: watermarks)
+    monkeypatch.setattr(main, 'discover_sitemaps', lambda url: ["https://exemple.fr/sitemap.xml"])
+    return manager
+
+def run(manager, limite=2, echouees=(), scraper=None):
+    """Une exécution du mode sitemap : pages retenues, en erreur si dans `echouees`"""
+    entrees, reportees, echecs = manager.decouvrir_urls_sitemap(
+        "https://exemple.fr/", limite=limite, scraper=scraper or FakeScraper()
+    )
+    resume = [{'url': page, 'statut': 'erreur' if page in echouees else 'ok'} for page, _ in entrees]
+    manager.valider_sitemap("https://exemple.fr/", entrees, resume, reportees, echecs)
+    return [page.rsplit('/', 1)[-1] for page, _ in entrees]
+
+def watermark(manager):
+    mark = manager.marques_sitemap().get("https://exemple.fr/")
+    return mark and mark.date().isoformat()
+
+def test_limit_processes_oldest_first_and_watermark_follows(manager):
+    assert run(manager) == ['a', 'b']
+    assert watermark(manager) == '2026-10-02'
+    assert sorted(run(manager)) == ['c', 'd']
+    assert watermark(manager) == '2026-10-04'
+    assert run(manager) == []
+
+def test_failed_page_stops_watermark(manager):
+    assert run(manager, echouees={'https://exemple.fr/b'}) == ['a', 'b']
+    assert watermark(manager) == '2026-10-01'
+    assert sorted(run(manager)) == ['b', 'c']
+
+def test_unreadable_sitemap_keeps_watermark(manager):
+    assert run(manager, limite=None) == ['d', 'b', 'a', 'c']
+    assert watermark(manager) == '2026-10-04'
+    manager.marques_sitemap().update("https://exemple.fr/", None)
+    assert run(manager, scraper=FakeScraper(None)) == []
+    assert watermark(manager) == '2026-10-04'
@@ -0,0 +1,81 @@
+# tests/test_streaming.py
+
+from bs4 import BeautifulSoup
+
+from scraper.streaming import ContainerStreamParser, decode_chunks
+
+NESTED_LISTS = """
+<ul class="grid">
+  <li><div class="product"><h3>Tee-shirt</h3>
+    <ul class="colors"><li>rouge</li><li>bleu</li></ul>
+    <span class="price">19,90 €</span></div></li>
+  <li><div class="product"><h3>Pull</h3>
+    <ul class="colors"><li>vert</li></ul>
+    <span class="price">39,90 €</span></div></li>
+</ul>
+"""
+
+NESTED_TABLES = """
+<table><tr><td>
+  <table class="quote"><tr><td>ACME</td></tr><tr><td>12,5</td></tr></table>
+  <table class="quote"><tr><td>INITECH</td><td><table><tr><td>+1,2 %</td></tr></table></td></tr></table>
+</td></tr></table>
+"""
+
+NESTED_DIVS = """
+<div class="page"><div class="list">
+  <div class="item"><div class="title">Un</div><div><div>détail</div></div><p>fin</p></div>
+  <div class="item"><div class="title">Deux</div><p>fin</p></div>
+</div></div>
+"""
+
+def stream(html, selector, chunk_size=7):
+    """Fragments streamés pour `selector`, le HTML étant reçu par petits morceaux"""
+    parser = ContainerStreamParser({'item': [selector]})
+    fragments = []
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+        fragments.extend(fragment for _, fragment in parser.drain())
+    parser.close()
+    fragments.extend(fragment for _, fragment in parser.drain())
+    return [BeautifulSoup(fragment, 'html.parser').find().get_text(' ', strip=True) for fragment in fragments]
+
+def full_dom(html, selector):
+    return [element.get_text(' ', strip=True) for element in BeautifulSoup(html, 'html.parser').select(selector)]
+
+def test_nested_lists_keep_whole_container():
+    streamed = stream(NESTED_LISTS, '.product')
+    assert streamed == full_dom(NESTED_LISTS, '.product')
+    assert '19,90 €' in streamed[0]
+
+def test_nested_tables():
+    assert stream(NESTED_TABLES, 'table.quote') == full_dom(NESTED_TABLES, 'table.quote')
+
+def test_nested_divs():
+    assert stream(NESTED_DIVS, '.item') == full_dom(NESTED_DIVS, '.item')
+
+def test_unclosed_container_ends_with_its_ancestor():
+    html = '<ul><li><div class="product">A<li>B</ul><p>après</p>'
+    assert stream(html, '.product') == full_dom(html, '.product') == ['A B']
+
+LATIN1_PAGE = (
+    '<html><head><meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1">'
+    '</head><body><div class="product"><h3>Crème brûlée</h3><span class="price">4,50 €</span></div>'
+    '</body></html>'
+)
+
+def test_meta_charset_used_without_content_type_charset():
+    data = LATIN1_PAGE.replace('€', 'EUR').encode('latin-1')
+    chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+    text = ''.join(decode_chunks(chunks))
+    # Même lecture que le chemin non streamé (BeautifulSoup sur les octets)
+    assert stream(text, '.product') == full_dom(data, '.product') == ['Crème brûlée 4,50 EUR']
+
+def test_meta_charset_attribute_and_default():
+    data = '<meta charset="windows-1252"><p>déjà 5 €</p>'.encode('cp1252')
+    assert ''.join(decode_chunks([data])) == data.decode('cp1252')
+    assert ''.join(decode_chunks(['<p>été</p>'.encode('utf-8')])) == '<p>été</p>'
+
+def test_header_charset_takes_precedence():
+    data = '<meta charset="utf-8"><p>été</p>'.encode('latin-1')
+    assert ''.join(decode_chunks([data], 'latin-1')) == '<meta charset="utf-8"><p>été</p>'
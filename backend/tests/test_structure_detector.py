@@ -0,0 +1,42 @@
+# tests/test_structure_detector.py
+
+from bs4 import BeautifulSoup
+
+from scraper.structure_detector import detect_record_group
+
+KEYWORDS = ('product', 'item', 'card')
+
+def product(i):
+    return (f'<div class="tile"><h3>Produit {i}</h3><span class="amount">{i},99 €</span>'
+            f'<img src="/img/{i}.png"><a href="/produit/{i}">Voir</a></div>')
+
+def detect(html, min_repeat=3, keywords=KEYWORDS):
+    return detect_record_group(BeautifulSoup(html, 'html.parser'), min_repeat=min_repeat, keywords=keywords)
+
+def test_row_wrapped_grid_returns_products_not_rows():
+    rows = ''.join('<div class="row">' + ''.join(product(r * 4 + c) for c in range(4)) + '</div>'
+                   for r in range(10))
+    group = detect(f'<main><div class="grid">{rows}</div></main>')
+
+    assert len(group['items']) == 40
+    assert group['selector'] == 'div.tile'
+    assert [item.h3.get_text() for item in group['items']] == [f"Produit {i}" for i in range(40)]
+
+def test_flat_list_is_unchanged():
+    group = detect('<section>' + ''.join(product(i) for i in range(12)) + '</section>')
+    assert len(group['items']) == 12
+    assert group['selector'] == 'div.tile'
+
+def test_records_with_uniform_children_are_not_unwrapped():
+    # Chaque carte n'a que des <span> : ce sont bien les cartes, pas les <span>
+    cards = ''.join(f'<div class="card"><span>Article numéro {i}</span><span>{i} €</span></div>' for i in range(12))
+    group = detect(f'<div>{cards}</div>')
+    assert len(group['items']) == 12
+    assert group['selector'] == 'div.card'
+
+def test_inner_lists_do_not_replace_their_records():
+    items = ''.join(f'<li class="product"><h3>Produit {i}</h3><ul class="colors"><li>rouge</li><li>bleu</li></ul></li>'
+                    for i in range(8))
+    group = detect(f'<ul>{items}</ul>')
+    assert len(group['items']) == 8
+    assert group['selector'] == 'li.product'
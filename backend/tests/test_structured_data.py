@@ -0,0 +1,16 @@
+# tests/test_structured_data.py
+
+from scraper.structured_data import extract_products
+
+def embedded(payload):
+    return f'<html><body><script type="application/json">{payload}</script></body></html>'
+
+def test_name_and_price_lists_without_product_signal_are_ignored():
+    html = embedded('{"shipping": [{"name": "Standard", "price": 4.9}, {"name": "Express", "price": 9.9}]}')
+    assert extract_products(html) == []
+
+def test_state_products_need_sku_image_link_or_type():
+    html = embedded('{"items": [{"name": "Lampe", "price": 19.9, "sku": "L1"},'
+                    ' {"name": "Chaise", "price": 49, "image": "/chaise.jpg"},'
+                    ' {"__typename": "Product", "title": "Table", "price": 120}]}')
+    assert [product['name'] for product in extract_products(html)] == ['Lampe', 'Chaise', 'Table']
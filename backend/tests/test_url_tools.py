@@ -0,0 +1,40 @@
+# tests/test_url_tools.py
+
+from utils.bloom import BloomFilter
+from utils.url_tools import canonicalize_url, in_scope, is_probably_html, registrable_domain
+
+def test_canonical_form_merges_equivalent_links():
+    variants = [
+        "HTTPS://Exemple.fr:443/actu/../actu/article?b=2&a=1#commentaires",
+        "https://exemple.fr/actu/article?a=1&b=2&utm_source=lettre&fbclid=x",
+        "/actu/article?a=1&b=2",
+    ]
+    canonical = {canonicalize_url(url, base="https://exemple.fr/") for url in variants}
+    assert canonical == {"https://exemple.fr/actu/article?a=1&b=2"}
+
+def test_non_http_links_ignored():
+    assert canonicalize_url("javascript:void(0)") is None
+    assert canonicalize_url("mailto:contact@exemple.fr") is None
+    assert canonicalize_url("ftp://exemple.fr/fichier") is None
+    assert canonicalize_url("http://exemple.fr:8080") == "http://exemple.fr:8080/"
+
+def test_scope_and_html_filter():
+    assert registrable_domain("www.bbc.co.uk") == "bbc.co.uk"
+    assert in_scope("https://sport.lemonde.fr/a", "https://www.lemonde.fr/", 'domain')
+    assert not in_scope("https://sport.lemonde.fr/a", "https://www.lemonde.fr/", 'host')
+    assert not in_scope("https://lefigaro.fr/", "https://www.lemonde.fr/", 'domain')
+    assert in_scope("https://lefigaro.fr/", "https://www.lemonde.fr/", 'all')
+    assert not is_probably_html("https://exemple.fr/photo.JPG")
+    assert is_probably_html("https://exemple.fr/article")
+
+def test_bloom_filter_has_no_false_negatives():
+    seen = BloomFilter(capacity=1000, error_rate=0.01)
+    urls = [f"https://exemple.fr/{i}" for i in range(1000)]
+    assert all(seen.add(url) for url in urls[:10])
+    for url in urls:
+        seen.add(url)
+    assert all(url in seen for url in urls)
+    assert not seen.add(urls[0])
+    false_positives = sum(f"https://autre.fr/{i}" in seen for i in range(10000))
+    assert false_positives < 300
+    assert not seen.saturated
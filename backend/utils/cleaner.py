@@ -1,30 +1,277 @@
+import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 from bs4 import BeautifulSoup
+from bs4.dammit import EntitySubstitution
+
+from utils.normalizers import (
+    AMOUNT_FIELDS, CURRENCY_FIELD, PERCENT_FIELDS, first_field, normalize_date, parse_currency, parse_number
+)
+from utils.records import Record, RecordBatch, record_type
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Types de site traités par le nettoyage boursier (nom du scraper et ancien nom)
+BOURSE_SITE_TYPES = ("bourse", "boursier")
+
+# Balise simple : <b>, </p>, <br/>, <a href="..." class=x>
+SIMPLE_TAG_RE = re.compile(
+    r'</?([a-zA-Z][a-zA-Z0-9]*)'
+    r'(?:\s+[a-zA-Z_:][-\w:.]*(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s"\'=<>`]+))?)*'
+    r'\s*/?>'
+)
+# Balises dont le contenu n'est pas du texte ordinaire pour html.parser / get_text()
+RAW_TEXT_TAGS = frozenset([
+    'script', 'style', 'template', 'rt', 'rp', 'textarea', 'title',
+    'xmp', 'iframe', 'noembed', 'noframes', 'noscript', 'plaintext'
+])
+# Références telles que html.parser les découpe : entité nommée suivie de ';' ou d'un
+# séparateur (&amp; ?a=1&b=2), numérique complète (&#233; &#xE9;), '&' littéral
+# (devant autre chose qu'une lettre ou '#') ; tout autre '&' tombe dans le dernier groupe
+ENTITY_RE = re.compile(
+    r'&(?:([a-zA-Z][-.a-zA-Z0-9]*)(?:;|(?=[^-.a-zA-Z0-9;]))|#([0-9]{1,7});|#[xX]([0-9a-fA-F]{1,6});'
+    r'|(?=[^a-zA-Z#]|$))|(&)'
+)
+
+def _safe_codepoint(codepoint):
+    """
+    Caractères numériques décodés tels quels par html.parser
+
+    Exclut les contrôles, les non-caractères et 128-159 (lus comme du windows-1252).
+    """
+    return 0x20 <= codepoint < 0x7F or 0xA0 <= codepoint < 0xD800 or 0xE000 <= codepoint < 0xFDD0 \
+        or 0xFDF0 <= codepoint < 0xFFFE
+
+def _unescape(text):
+    """Entités de `text` décodées comme par BeautifulSoup, ou None si un cas particulier se présente"""
+    pieces = []
+    position = 0
+    for match in ENTITY_RE.finditer(text):
+        name, decimal, hexadecimal, other = match.groups()
+        if other:
+            return None
+        if name:
+            # Entité inconnue : html.parser garde '&nom' (sans le ';' éventuel)
+            character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name, f"&{name}")
+        elif decimal or hexadecimal:
+            codepoint = int(decimal) if decimal else int(hexadecimal, 16)
+            if not _safe_codepoint(codepoint):
+                return None
+            character = chr(codepoint)
+        else:
+            character = '&'
+        pieces.append(text[position:match.start()])
+        pieces.append(character)
+        position = match.end()
+    pieces.append(text[position:])
+    return ''.join(pieces)
+
+def _fast_text(text):
+    """Texte de `text` sans construire de DOM, ou None si le balisage n'est pas simple"""
+    segments = []
+    position = 0
+    for tag in SIMPLE_TAG_RE.finditer(text):
+        if tag.group(1).lower() in RAW_TEXT_TAGS:
+            return None
+        segments.append(text[position:tag.start()])
+        position = tag.end()
+    segments.append(text[position:])
+
+    for i, segment in enumerate(segments):
+        # Commentaire, déclaration ou '<' isolé : laissé à html.parser
+        if '<' in segment:
+            return None
+        if '&' in segment:
+            segment = _unescape(segment)
+            if segment is None:
+                return None
+            segments[i] = segment
+    return ''.join(segments)
+
+def html_to_text(text):
+    """
+    Équivalent de BeautifulSoup(text, "html.parser").get_text(), aux espaces près
+
+    Les chaînes sans '<' ni '&' sont rendues telles quelles ; les balises
+    simples et les entités complètes sont retirées par expressions
+    régulières. Seul le reste (commentaires, <script>, '&' ambigus...)
+    passe par BeautifulSoup. Les nœuds faits uniquement d'espaces, que
+    BeautifulSoup réduit à un caractère, sont conservés : le résultat est
+    identique une fois les espaces regroupés.
+    """
+    if '<' not in text and '&' not in text:
+        return text
+    fast = _fast_text(text)
+    if fast is not None:
+        return fast
+    return BeautifulSoup(text, "html.parser").get_text()
+
+# En dessous, le démarrage des processus et la sérialisation coûtent plus que le nettoyage
+PARALLEL_MIN_RECORDS = 50000
+# Nombre de paquets par worker quand chunk_size n'est pas fourni (équilibrage de charge)
+CHUNKS_PER_WORKER = 4
+
+# Nettoyeur du processus worker, transmis une fois à son démarrage
+_worker_cleaner = None
+
+def _init_worker(cleaner):
+    global _worker_cleaner
+    _worker_cleaner = cleaner
+
+def _clean_chunk(chunk):
+    """Nettoie un paquet d'enregistrements dans un processus worker"""
+    return [_worker_cleaner.clean_item(item) for item in chunk]
+
+def clean_text(text):
+    """Texte sans HTML, espaces regroupés"""
+    text = html_to_text(text)
+    text = WHITESPACE_RE.sub(' ', text)
+    return text.strip()
+
+def normalize_whitespace(text):
+    """Espaces regroupés, balisage conservé"""
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+# Nettoyage d'une chaîne selon (remove_html_tags, normalize_whitespace)
+TEXT_RULES = {
+    (True, True): clean_text,
+    (True, False): html_to_text,
+    (False, True): normalize_whitespace,
+    (False, False): None
+}
+
+# Règles appliquées sans configuration : le nettoyage historique de clean()
+DEFAULT_RULES = {
+    'remove_html_tags': True,
+    'normalize_whitespace': True,
+    'remove_empty_fields': False,
+    'convert_prices': False,
+    'normalize_dates': False,
+    'date_fields': ['date']
+}
 
 class DataCleaner:
     def __init__(self, site_type="generic"):
         self.site_type = site_type.lower()
+        self.configure()
+
+    def configure(self, options=None):
+        """
+        Compile les règles de nettoyage (section 'cleaning' de la configuration)
+
+        Les règles sont résolues une seule fois ici en fonctions ; clean_item
+        les applique ensuite en un seul passage par enregistrement. Les règles
+        absentes de `options` gardent leur valeur de DEFAULT_RULES.
+
+        Règles :
+            remove_html_tags, normalize_whitespace: nettoyage des chaînes
+            remove_empty_fields: retirer les champs vides ('' ou None)
+            convert_prices: ajouter prix_valeur, devise, variation_valeur et
+                variation_pourcentage_valeur (float), sans modifier les champs d'origine
+            normalize_dates, date_fields: dates de ces champs en ISO 8601
+        """
+        rules = dict(DEFAULT_RULES)
+        for name, value in (options or {}).items():
+            if name not in DEFAULT_RULES:
+                print(f"⚠️ Règle de nettoyage inconnue ignorée : {name}")
+                continue
+            rules[name] = value
+
+        self.rules = rules
+        self._clean_value = TEXT_RULES[(bool(rules['remove_html_tags']), bool(rules['normalize_whitespace']))]
+        self._field_rules = {field: normalize_date for field in rules['date_fields']} if rules['normalize_dates'] else {}
+        self._drop_empty = bool(rules['remove_empty_fields'])
+        self._convert_prices = bool(rules['convert_prices'])
+        return self
+
+    def clean(self, raw_data, workers=1, chunk_size=None):
+        """
+        Nettoie une liste d'enregistrements (dicts ou Record)
+
+        Args:
+            raw_data: Enregistrements à nettoyer ; un RecordBatch donne un RecordBatch
+            workers: Nombre de processus (None : un par cœur), limité au nombre de
+                cœurs. En dessous de PARALLEL_MIN_RECORDS enregistrements, le
+                nettoyage reste séquentiel
+            chunk_size: Enregistrements envoyés à un worker à la fois
+
+        Returns:
+            Enregistrements nettoyés, dans l'ordre d'origine
+        """
+        if isinstance(raw_data, RecordBatch):
+            return RecordBatch(self.clean(list(raw_data), workers, chunk_size))
+
+        raw_data = list(raw_data)
+        # Pas plus de processus que de cœurs : le nettoyage est purement CPU
+        cpus = os.cpu_count() or 1
+        workers = min(workers or cpus, cpus)
+        if workers <= 1 or len(raw_data) < PARALLEL_MIN_RECORDS:
+            return [self.clean_item(item) for item in raw_data]
 
-    def clean(self, raw_data):
-        """ Nettoie une liste de dictionnaires """
-        return [self.clean_item(item) for item in raw_data]
+        chunk_size = chunk_size or -(-len(raw_data) // (workers * CHUNKS_PER_WORKER))
+        chunks = [raw_data[i:i + chunk_size] for i in range(0, len(raw_data), chunk_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                     initializer=_init_worker, initargs=(self,)) as executor:
+                cleaned = []
+                for result in executor.map(_clean_chunk, chunks):
+                    cleaned.extend(result)
+                return cleaned
+        except (BrokenProcessPool, OSError, pickle.PicklingError) as e:
+            print(f"⚠️ Nettoyage parallèle impossible ({e}), nettoyage séquentiel")
+            return [self.clean_item(item) for item in raw_data]
+
+    def clean_columns(self, raw_data, decimal=None):
+        """
+        Nettoie les données colonne par colonne (pandas) pour les gros volumes
+
+        Le texte et les dates sont nettoyés comme par `clean`, puis les prix et
+        variations sont convertis en colonnes float64 (prix_valeur, devise,
+        variation_valeur, variation_pourcentage_valeur), directement exportables.
+        Une colonne ne pouvant pas manquer sur une seule ligne,
+        remove_empty_fields n'est pas appliqué.
+
+        Args:
+            raw_data: Enregistrements ou DataFrame
+            decimal: Séparateur décimal imposé (',' ou '.'), déduit par ligne sinon
+
+        Returns:
+            DataFrame
+        """
+        from utils.columnar import clean_site_columns, to_columns
+
+        frame = to_columns(raw_data, clean_text=self._clean_value is not None, decimal=decimal,
+                           text_function=self._clean_value, field_functions=self._field_rules)
+        return clean_site_columns(frame, self.site_type)
 
     def clean_item(self, item):
-        """ Nettoie un seul élément """
-        cleaned_item = {}
+        """ Nettoie un seul élément (même classe en sortie pour un Record) """
+        cleaned_item = record_type(item)() if isinstance(item, Record) else {}
+        clean_value = self._clean_value
+        field_rules = self._field_rules
 
         for key, value in item.items():
             if isinstance(value, str):
-                cleaned_value = self._clean_text(value)
-            else:
-                cleaned_value = value
+                if clean_value is not None:
+                    value = clean_value(value)
+                rule = field_rules.get(key)
+                if rule is not None:
+                    value = rule(value)
 
-            cleaned_item[key] = cleaned_value
+            if self._drop_empty and (value is None or value == ''):
+                continue
+            cleaned_item[key] = value
+
+        if self._convert_prices:
+            self._add_numeric_fields(cleaned_item)
 
         # Appliquer nettoyage spécifique au site
         if self.site_type == "ecommerce":
             cleaned_item = self._clean_ecommerce(cleaned_item)
-        elif self.site_type == "boursier":
+        elif self.site_type in BOURSE_SITE_TYPES:
             cleaned_item = self._clean_bourse(cleaned_item)
         elif self.site_type == "wikipedia":
             cleaned_item = self._clean_wikipedia(cleaned_item)
@@ -33,9 +280,29 @@ class DataCleaner:
 
     def _clean_text(self, text):
         # Supprimer HTML, espaces, sauts de ligne, etc.
-        text = BeautifulSoup(text, "html.parser").get_text()
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return clean_text(text)
+
+    def _add_numeric_fields(self, item):
+        """Ajoute les montants et pourcentages convertis en float (mêmes champs que clean_columns)"""
+        numeric = {}
+        for target, sources in AMOUNT_FIELDS.items():
+            source = first_field(item, sources)
+            if source is None:
+                continue
+            text = '' if item[source] is None else str(item[source])
+            numeric[target] = parse_number(text)
+            if target == 'prix_valeur':
+                numeric[CURRENCY_FIELD] = parse_currency(text)
+
+        for target, sources in PERCENT_FIELDS.items():
+            source = first_field(item, sources)
+            if source is not None:
+                numeric[target] = parse_number('' if item[source] is None else str(item[source]))
+
+        for key, value in numeric.items():
+            if self._drop_empty and (value is None or value == ''):
+                continue
+            item[key] = value
 
     def _clean_ecommerce(self, item):
         if "price" in item:
@@ -0,0 +1,163 @@
+# utils/columnar.py
+
+import numpy as np
+import pandas as pd
+
+from utils.cleaner import BOURSE_SITE_TYPES, clean_text
+from utils.normalizers import (
+    AMOUNT_FIELDS, CURRENCY_CODES, CURRENCY_FIELD, CURRENCY_RE, GROUPING_RE, NUMBER_RE,
+    PERCENT_FIELDS, first_field
+)
+from utils.records import RecordBatch
+
+def _as_text(values):
+    """Série de chaînes (valeurs absentes -> chaîne vide)"""
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    return series.astype(object).where(series.notna(), '').astype(str)
+
+def parse_numbers(values, decimal=None):
+    """
+    Premier nombre de chaque valeur en float64 (NaN si absent)
+
+    Les opérations `str` portent sur les valeurs distinctes de la colonne
+    (les prix se répètent beaucoup), le résultat est redistribué par index.
+
+    Le séparateur décimal est déduit ligne par ligne : avec '.' et ',', le
+    dernier des deux ; avec un seul séparateur présent une seule fois, décimal
+    sauf s'il est suivi d'exactement 3 chiffres (1.299 € et 1,299 $ sont des
+    milliers, 0,125 non) ; répété, c'est un séparateur de milliers.
+    `decimal` (',' ou '.') impose le séparateur pour toutes les lignes.
+    """
+    text = _as_text(values)
+    codes, uniques = _unique_values(text)
+    number = uniques.astype(str).str.extract(NUMBER_RE, expand=False).fillna('')
+    number = (number.str.replace(GROUPING_RE, '', regex=True)
+                    .str.replace('−', '-', regex=False)
+                    .str.rstrip('.,'))
+
+    if decimal in (',', '.'):
+        comma_decimal = pd.Series(decimal == ',', index=number.index)
+        dot_decimal = ~comma_decimal
+    else:
+        last_comma = number.str.rfind(',')
+        last_dot = number.str.rfind('.')
+        commas = number.str.count(',')
+        dots = number.str.count(r'\.')
+        digits_after = number.str.len() - 1 - np.maximum(last_comma, last_dot)
+        both = (commas > 0) & (dots > 0)
+        # 0,125 reste décimal : un séparateur de milliers ne suit pas un zéro seul
+        after_zero = number.str.match(r'[+-]?0[.,]')
+        single = (commas + dots == 1) & ((digits_after != 3) | after_zero)
+        comma_decimal = (both & (last_comma > last_dot)) | (single & (commas == 1))
+        dot_decimal = (both & (last_dot > last_comma)) | (single & (dots == 1))
+
+    # Séparateur décimal ramené à '.', séparateurs de milliers retirés
+    cleaned = number.str.replace(r'[.,]', '', regex=True)
+    cleaned[comma_decimal] = number[comma_decimal].str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+    cleaned[dot_decimal] = number[dot_decimal].str.replace(',', '', regex=False)
+    parsed = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype='float64')
+    return pd.Series(parsed[codes], index=text.index, dtype='float64')
+
+def parse_currencies(values):
+    """Code ISO de la devise de chaque valeur (€ -> EUR), vide si absente"""
+    text = _as_text(values)
+    codes, uniques = _unique_values(text)
+    symbol = uniques.astype(str).str.extract(CURRENCY_RE, expand=False)
+    currencies = symbol.replace(CURRENCY_CODES).fillna('').to_numpy(dtype=object)
+    return pd.Series(currencies[codes], index=text.index, dtype=str)
+
+def parse_amounts(values, decimal=None):
+    """Montants ('1 299,00 €', '$1,299.00') en DataFrame (valeur float64, devise)"""
+    return pd.DataFrame({
+        'valeur': parse_numbers(values, decimal),
+        'devise': parse_currencies(values)
+    })
+
+def parse_percentages(values, decimal=None):
+    """Variations ('+1,25 %', '-0.8%') en float64, en points de pourcentage"""
+    return parse_numbers(values, decimal)
+
+def _unique_values(series):
+    """(codes, valeurs distinctes) : chaque valeur distincte n'est traitée qu'une fois"""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    return codes, pd.Series(uniques, dtype=object)
+
+def map_text_column(series, function):
+    """Applique `function` aux chaînes d'une colonne, une fois par valeur distincte"""
+    values = series.to_numpy(dtype=object, copy=True)
+    codes, uniques = _unique_values(series)
+    is_text = uniques.map(type).eq(str).to_numpy()
+    cleaned = np.array([function(value) if text else value for value, text in zip(uniques, is_text)],
+                       dtype=object)
+    present = codes >= 0
+    values[present] = cleaned[codes[present]]
+
+    result = pd.Series(values, index=series.index, name=series.name)
+    if not pd.api.types.is_object_dtype(series.dtype):
+        result = result.astype(series.dtype)
+    return result
+
+def clean_text_column(series):
+    """Même résultat que DataCleaner._clean_text, appliqué à une colonne"""
+    return map_text_column(series, clean_text)
+
+def _text_columns(frame):
+    return [column for column in frame.columns if not pd.api.types.is_numeric_dtype(frame[column])]
+
+def clean_site_columns(frame, site_type):
+    """Équivalents vectorisés du nettoyage spécifique au site de DataCleaner"""
+    if site_type == "ecommerce" and "price" in frame.columns:
+        frame["price"] = frame["price"].str.replace(r"[^\d.,]", "", regex=True)
+    elif site_type in BOURSE_SITE_TYPES and "variation" in frame.columns:
+        frame["variation"] = frame["variation"].str.replace("%", "", regex=False).str.strip()
+    elif site_type == "wikipedia":
+        for column in _text_columns(frame):
+            frame[column] = frame[column].str.replace(r"\[\d+\]", "", regex=True)
+    return frame
+
+def to_columns(records, clean_text=True, decimal=None, text_function=None, field_functions=None):
+    """
+    Enregistrements en DataFrame nettoyé colonne par colonne
+
+    Ajoute les colonnes typées de AMOUNT_FIELDS et PERCENT_FIELDS (float64)
+    et la devise du prix, quand leurs colonnes sources existent. Les colonnes
+    d'origine sont conservées telles quelles (après nettoyage du texte).
+
+    Args:
+        clean_text: Nettoyer les colonnes de texte
+        text_function: Nettoyage d'une chaîne (par défaut celui de DataCleaner)
+        field_functions: {colonne: fonction} appliquées ensuite (dates...)
+    """
+    if isinstance(records, pd.DataFrame):
+        frame = records
+    elif isinstance(records, RecordBatch):
+        # Déjà rangé par colonnes : pas d'enregistrement reconstruit
+        frame = pd.DataFrame({name: records.column(name, np.nan) for name in records.field_names()})
+    else:
+        frame = pd.DataFrame.from_records(list(records))
+
+    if clean_text:
+        for column in _text_columns(frame):
+            if text_function is None:
+                frame[column] = clean_text_column(frame[column])
+            else:
+                frame[column] = map_text_column(frame[column], text_function)
+
+    for column, function in (field_functions or {}).items():
+        if column in frame.columns:
+            frame[column] = map_text_column(frame[column], function)
+
+    for target, sources in AMOUNT_FIELDS.items():
+        source = first_field(frame.columns, sources)
+        if source is None:
+            continue
+        frame[target] = parse_numbers(frame[source], decimal).to_numpy()
+        if target == 'prix_valeur':
+            frame[CURRENCY_FIELD] = parse_currencies(frame[source]).to_numpy()
+
+    for target, sources in PERCENT_FIELDS.items():
+        source = first_field(frame.columns, sources)
+        if source is not None:
+            frame[target] = parse_percentages(frame[source], decimal).to_numpy()
+
+    return frame
@@ -2,23 +2,26 @@
 
 import csv
 import json
+from collections.abc import Mapping
 import pandas as pd
 from fpdf import FPDF
 from pathlib import Path
 import os
 from datetime import datetime
 
+from utils.records import json_default
+
 def export_data(data, filename, format_type, options=None):
     """
     Exporte les données dans le format spécifié
     
     Args:
-        data: Liste de dictionnaires à exporter
+        data: Enregistrements (dicts, Record, RecordBatch) ou DataFrame (nettoyage en colonnes) à exporter
         filename: Nom du fichier (avec ou sans extension)
         format_type: Format d'export ('csv', 'json', 'xlsx', 'pdf')
         options: Options supplémentaires (optionnel)
     """
-    if not data:
+    if is_empty(data):
         print("❌ Aucune donnée à exporter.")
         return False
     
@@ -50,6 +53,16 @@ def export_data(data, filename, format_type, options=None):
         print(f"❌ Erreur lors de l'export {format_type.upper()}: {e}")
         return False
 
+def is_empty(data):
+    """Vrai si aucune donnée (liste vide, DataFrame vide ou None)"""
+    return data is None or len(data) == 0
+
+def as_records(data):
+    """Liste de dictionnaires ; un DataFrame est converti (NaN -> None)"""
+    if isinstance(data, pd.DataFrame):
+        return json.loads(data.to_json(orient='records', force_ascii=False, double_precision=15))
+    return data
+
 def clean_filename(filename, format_type):
     """Nettoie le nom de fichier et ajoute l'extension"""
     # Supprimer les caractères non autorisés
@@ -72,10 +85,18 @@ def export_to_csv(data, filename, options=None):
     include_index = options.get('include_index', False)
     
     try:
+        # Colonnes typées écrites directement
+        if isinstance(data, pd.DataFrame):
+            if include_index:
+                data = data.assign(_index=range(1, len(data) + 1))
+            data.to_csv(filename, sep=delimiter, encoding=encoding, index=False)
+            print(f"✅ Exporté en CSV : {filename} ({len(data)} lignes)")
+            return True
+        
         # Obtenir toutes les clés possibles de tous les dictionnaires
         all_keys = set()
         for item in data:
-            if isinstance(item, dict):
+            if isinstance(item, Mapping):
                 all_keys.update(item.keys())
         
         all_keys = sorted(list(all_keys))
@@ -85,10 +106,11 @@ def export_to_csv(data, filename, options=None):
             dict_writer.writeheader()
             
             for i, item in enumerate(data):
-                if isinstance(item, dict):
+                if isinstance(item, Mapping):
                     # Ajouter un index si demandé
                     if include_index:
-                        item['_index'] = i + 1
+                        # Copie : les lignes d'un RecordBatch sont en lecture seule
+                        item = {**item, '_index': i + 1}
                     dict_writer.writerow(item)
                 else:
                     # Si ce n'est pas un dict, créer une ligne simple
@@ -112,6 +134,7 @@ def export_to_json(data, filename, options=None):
     encoding = options.get('encoding', 'utf-8')
     
     try:
+        data = as_records(data)
         export_data_final = data
         
         # Ajouter des métadonnées si demandé
@@ -128,7 +151,7 @@ def export_to_json(data, filename, options=None):
             }
         
         with open(filename, 'w', encoding=encoding) as f:
-            json.dump(export_data_final, f, ensure_ascii=False, indent=indent)
+            json.dump(export_data_final, f, ensure_ascii=False, indent=indent, default=json_default)
         
         print(f"✅ Exporté en JSON : {filename} ({len(data)} éléments)")
         return True
@@ -184,6 +207,7 @@ def export_to_pdf(data, filename, options=None):
         options = {}
     
     try:
+        data = as_records(data)
         pdf = FPDF()
         pdf.add_page()
         pdf.set_auto_page_break(auto=True, margin=15)
@@ -210,7 +234,7 @@ def export_to_pdf(data, filename, options=None):
             
             pdf.set_font("Arial", size=9)
             
-            if isinstance(item, dict):
+            if isinstance(item, Mapping):
                 for key, value in item.items():
                     # Nettoyer et encoder le texte
                     key_clean = clean_text_for_pdf(str(key))
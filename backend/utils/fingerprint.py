@@ -0,0 +1,115 @@
+# utils/fingerprint.py
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+from utils.records import json_default, record_type, restore_records
+
+# À changer quand l'extraction évolue : les résultats mémorisés deviennent caducs
+FINGERPRINT_VERSION = 2
+
+# Parties volatiles d'une page, jamais lues par les extracteurs. Les dates et
+# horodatages du contenu sont conservés : ce sont des données extraites.
+VOLATILE_PATTERNS = [
+    # Commentaires (temps de génération, identifiant de serveur...)
+    re.compile(rb'<!--.*?-->', re.S),
+    # Jetons CSRF dans les formulaires et les <meta>
+    re.compile(rb'<(?:input|meta)\b[^>]*(?:csrf|xsrf|authenticity_token|requestverificationtoken)[^>]*>', re.I),
+    # Balises ouvrantes des scripts et feuilles de style externes (nonces, ?v=123,
+    # integrity) ; le contenu des <script> (JSON-LD, état d'hydratation) est conservé
+    re.compile(rb'<(?:script|link)\b[^>]*>', re.I),
+]
+WHITESPACE_RE = re.compile(rb'\s+')
+
+def normalize_content(html):
+    """Contenu débarrassé des parties volatiles, pour comparer deux versions d'une page"""
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+    for pattern in VOLATILE_PATTERNS:
+        html = pattern.sub(b'', html)
+    return WHITESPACE_RE.sub(b' ', html).strip()
+
+def content_fingerprint(html, scope=''):
+    """
+    Empreinte (blake2b) du contenu normalisé d'une page
+
+    `scope` décrit l'extraction (classe de scraper, réglages, modèles
+    appris) : la même page extraite autrement n'a pas les mêmes résultats.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{FINGERPRINT_VERSION}:{scope}:".encode('utf-8'))
+    digest.update(normalize_content(html))
+    return digest.hexdigest()
+
+class FingerprintStore:
+    """
+    Empreinte de la dernière version vue de chaque URL et résultats extraits
+
+    Un fichier JSON par URL ({fingerprint, records, kinds}). Si l'empreinte d'une
+    page téléchargée est identique, les résultats sont réutilisés sans
+    parsing ni extraction.
+    """
+
+    def __init__(self, directory="cache/fingerprints"):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0}
+        self._lock = threading.Lock()
+
+    def _path(self, url):
+        return self.directory / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def lookup(self, url, fingerprint):
+        """Résultats mémorisés si la page n'a pas changé, sinon None"""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+
+        with self._lock:
+            if entry and entry.get('fingerprint') == fingerprint:
+                self.stats['hits'] += 1
+                return restore_records(entry['records'], entry.get('kinds'))
+            self.stats['misses'] += 1
+            return None
+
+    def store(self, url, fingerprint, records):
+        """Mémorise l'empreinte d'une page et ses résultats"""
+        path = self._path(url)
+        temporary = path.with_suffix(f'.{threading.get_ident()}.tmp')
+        try:
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump({'url': url, 'fingerprint': fingerprint, 'records': records,
+                           'kinds': [record_type(record).__name__ for record in records]},
+                          f, ensure_ascii=False, default=json_default)
+            os.replace(temporary, path)
+        except (OSError, TypeError, ValueError) as e:
+            temporary.unlink(missing_ok=True)
+            print(f"⚠️ Résultats non mémorisés pour {url} : {e}")
+            return
+        with self._lock:
+            self.stats['stored'] += 1
+
+    def print_stats(self):
+        """Affiche les pages reconnues comme inchangées"""
+        total = self.stats['hits'] + self.stats['misses'] or 1
+        print("\n♻️ EMPREINTES DE CONTENU")
+        print("=" * 50)
+        print(f"   {self.stats['hits']} pages inchangées (hits), {self.stats['misses']} à extraire (miss) "
+              f"({self.stats['hits'] / total:.0%} évitées), {self.stats['stored']} résultats mémorisés")
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+def get_fingerprint_store(directory="cache/fingerprints"):
+    """Retourne le magasin d'empreintes partagé associé à un dossier"""
+    path = str(Path(directory).resolve())
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = FingerprintStore(directory)
+        return _stores[path]
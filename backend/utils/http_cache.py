@@ -0,0 +1,241 @@
+# utils/http_cache.py
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+class HttpCache:
+    """
+    Cache HTTP sur disque avec revalidation conditionnelle
+
+    Chaque entrée est composée d'un corps (`<clé>.body`) et de ses métadonnées
+    (`<clé>.json` : ETag, Last-Modified, max-age...). Les entrées les moins
+    récemment utilisées sont supprimées quand la taille maximale est dépassée.
+    """
+
+    MAX_AGE_RE = re.compile(r'max-age\s*=\s*"?(\d+)', re.I)
+
+    def __init__(self, directory="cache/http", max_size_mb=200):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    @staticmethod
+    def key(url):
+        """Clé de cache d'une URL"""
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key):
+        return self.directory / f"{key}.body"
+
+    def _meta_path(self, key):
+        return self.directory / f"{key}.json"
+
+    def _load_index(self):
+        """Reconstruit l'index LRU depuis les métadonnées présentes sur disque"""
+        entries = []
+        for meta_path in self.directory.glob("*.json"):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    entries.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+
+        entries.sort(key=lambda entry: entry.get('last_access', 0))
+        return OrderedDict((entry['key'], entry) for entry in entries if 'key' in entry)
+
+    def _write_meta(self, entry):
+        with open(self._meta_path(entry['key']), 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+
+    def _remove(self, key):
+        self._index.pop(key, None)
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _parse_cache_control(self, headers):
+        """Retourne (stockable, max_age) d'après Cache-Control"""
+        cache_control = headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control:
+            return False, None
+        if 'no-cache' in cache_control:
+            return True, 0
+
+        match = self.MAX_AGE_RE.search(cache_control)
+        if not match:
+            return True, None
+
+        max_age = int(match.group(1))
+        try:
+            # Temps déjà passé dans un cache intermédiaire
+            max_age -= int(headers.get('Age', 0))
+        except ValueError:
+            pass
+        return True, max(0, max_age)
+
+    def lookup(self, url):
+        """Retourne l'entrée de cache d'une URL (ou None)"""
+        key = self.key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if not self._body_path(key).exists():
+                self._remove(key)
+                return None
+            self._index.move_to_end(key)
+            return dict(entry)
+
+    def is_fresh(self, entry):
+        """Vrai si l'entrée peut être servie sans contacter le serveur"""
+        max_age = entry.get('max_age')
+        return bool(max_age) and time.time() - entry['stored_at'] < max_age
+
+    def conditional_headers(self, entry):
+        """Headers de revalidation (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read_body(self, entry):
+        """Lit le corps d'une entrée et la marque comme utilisée"""
+        try:
+            body = self._body_path(entry['key']).read_bytes()
+        except OSError:
+            with self._lock:
+                self._remove(entry['key'])
+            return None
+
+        with self._lock:
+            cached = self._index.get(entry['key'])
+            if cached is not None:
+                cached['last_access'] = time.time()
+                self._write_meta(cached)
+        return body
+
+    def get_fresh(self, url, count_miss=True):
+        """
+        Retourne le corps en cache s'il est encore frais, sinon None
+
+        Compte un hit, ou un miss si l'URL n'est pas en cache (une entrée
+        périmée est comptée à sa revalidation). `count_miss=False` quand une
+        requête qui le comptera suit (get_html_requests).
+        """
+        entry = self.lookup(url)
+        body = None
+        if entry and self.is_fresh(entry):
+            body = self.read_body(entry)
+        with self._lock:
+            if body is not None:
+                self.stats['hits'] += 1
+            elif entry is None and count_miss:
+                self.stats['misses'] += 1
+        return body
+
+    def revalidated(self, entry, headers):
+        """
+        Réponse 304 : rafraîchit l'entrée et retourne le corps en cache
+
+        Retourne None si le corps a disparu entre-temps (éviction par un
+        autre thread...) : l'entrée est alors supprimée et la page doit être
+        redemandée sans validateurs. Avec `no-store`, le corps est retourné
+        mais l'entrée est supprimée.
+        """
+        storable, max_age = self._parse_cache_control(headers)
+
+        with self._lock:
+            cached = self._index.get(entry['key'])
+            if cached is not None and storable:
+                cached['stored_at'] = time.time()
+                cached['max_age'] = max_age
+                cached['etag'] = headers.get('ETag', cached.get('etag'))
+                cached['last_modified'] = headers.get('Last-Modified', cached.get('last_modified'))
+                self._write_meta(cached)
+
+        body = self.read_body(entry)
+        with self._lock:
+            if body is None or not storable:
+                self._remove(entry['key'])
+            if body is not None:
+                self.stats['revalidated'] += 1
+        return body
+
+    def remove(self, url):
+        """Supprime l'entrée d'une URL"""
+        with self._lock:
+            self._remove(self.key(url))
+
+    def store(self, url, headers, body):
+        """Enregistre une réponse 200 si elle est réutilisable"""
+        key = self.key(url)
+        storable, max_age = self._parse_cache_control(headers)
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        with self._lock:
+            # Rien à réutiliser ni à revalider : inutile de stocker
+            if not storable or not (etag or last_modified or max_age):
+                self._remove(key)
+                return False
+
+            if len(body) > self.max_size:
+                return False
+
+            entry = {
+                'key': key,
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'max_age': max_age,
+                'stored_at': time.time(),
+                'last_access': time.time(),
+                'size': len(body)
+            }
+
+            self._body_path(key).write_bytes(body)
+            self._write_meta(entry)
+            self._index[key] = entry
+            self._index.move_to_end(key)
+            self.stats['stored'] += 1
+            self._evict()
+        return True
+
+    def _evict(self):
+        """Supprime les entrées les moins récemment utilisées (verrou tenu)"""
+        total = sum(entry.get('size', 0) for entry in self._index.values())
+        while total > self.max_size and self._index:
+            key, entry = next(iter(self._index.items()))
+            total -= entry.get('size', 0)
+            self._remove(key)
+            self.stats['evicted'] += 1
+
+    def clear(self):
+        """Vide complètement le cache"""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+# Un seul cache par dossier, partagé par toutes les instances de scraper
+_caches = {}
+_caches_lock = threading.Lock()
+
+def get_http_cache(directory="cache/http", max_size_mb=200):
+    """Retourne le cache HTTP partagé associé à un dossier"""
+    path = str(Path(directory).resolve())
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = HttpCache(directory, max_size_mb)
+        return _caches[path]
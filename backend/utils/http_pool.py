@@ -0,0 +1,137 @@
+# utils/http_pool.py
+
+import threading
+
+from requests.adapters import HTTPAdapter
+
+class ConnectionPoolRegistry:
+    """
+    Pools de connexions HTTP partagés par toutes les instances de scraper
+
+    Chaque scraper garde sa propre `requests.Session` (cookies, headers),
+    mais les adaptateurs montés dessus sont communs : les connexions TCP/TLS
+    ouvertes vers un hôte sont réutilisées d'un scraper à l'autre.
+    Les nouveaux essais sont gérés par `get_html_requests`, pas par l'adaptateur.
+    """
+
+    def __init__(self, pool_connections=20, pool_maxsize=10):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.host_pool_sizes = {}
+        self.http2_enabled = False
+        self._lock = threading.Lock()
+        self._default_adapter = None
+        self._host_adapters = {}
+
+    def configure(self, pool_connections=None, pool_maxsize=None, host_pool_sizes=None):
+        """
+        Configure la taille des pools (à appeler avant de créer les scrapers)
+
+        Args:
+            pool_connections: Nombre d'hôtes gardés en cache par adaptateur
+            pool_maxsize: Connexions conservées par hôte
+            host_pool_sizes: Tailles spécifiques {hôte: connexions}
+        """
+        with self._lock:
+            # Ne recréer un adaptateur (et perdre ses connexions) que si sa taille change
+            if pool_connections and pool_connections != self.pool_connections:
+                self.pool_connections = pool_connections
+                self._default_adapter = None
+                self._host_adapters.clear()
+            if pool_maxsize and pool_maxsize != self.pool_maxsize:
+                self.pool_maxsize = pool_maxsize
+                self._default_adapter = None
+            for host, size in (host_pool_sizes or {}).items():
+                if self.host_pool_sizes.get(host.lower()) != size:
+                    self.host_pool_sizes[host.lower()] = size
+                    self._host_adapters.pop(host.lower(), None)
+
+    def enable_http2(self):
+        """Active HTTP/2 (support expérimental de urllib3, nécessite le paquet `h2`)"""
+        try:
+            import urllib3.http2
+            urllib3.http2.inject_into_urllib3()
+        except ImportError:
+            print("⚠️ HTTP/2 indisponible (urllib3 >= 2.3 et h2 requis)")
+            return False
+        self.http2_enabled = True
+        print("🚄 HTTP/2 activé")
+        return True
+
+    def _new_adapter(self, maxsize):
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=maxsize,
+            max_retries=0
+        )
+
+    def default_adapter(self):
+        """Adaptateur commun à tous les hôtes sans taille spécifique"""
+        with self._lock:
+            if self._default_adapter is None:
+                self._default_adapter = self._new_adapter(self.pool_maxsize)
+            return self._default_adapter
+
+    def host_adapter(self, host):
+        """Adaptateur dédié à un hôte configuré (ou None)"""
+        host = host.lower()
+        with self._lock:
+            if host not in self.host_pool_sizes:
+                return None
+            if host not in self._host_adapters:
+                self._host_adapters[host] = self._new_adapter(self.host_pool_sizes[host])
+            return self._host_adapters[host]
+
+    def mount(self, session):
+        """Monte les adaptateurs partagés sur une session"""
+        adapter = self.default_adapter()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        # requests choisit le préfixe monté le plus long
+        for host in list(self.host_pool_sizes):
+            adapter = self.host_adapter(host)
+            for scheme in ('http', 'https'):
+                session.mount(f"{scheme}://{host}/", adapter)
+        return session
+
+    def stats(self):
+        """
+        Compteurs par hôte : requêtes, connexions ouvertes (miss)
+        et requêtes servies par une connexion réutilisée (hit)
+        """
+        with self._lock:
+            adapters = [self._default_adapter] + list(self._host_adapters.values())
+
+        stats = {}
+        for adapter in adapters:
+            if adapter is None:
+                continue
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                host = f"{key.key_scheme}://{key.key_host}:{key.key_port or ''}".rstrip(':')
+                host_stats = stats.setdefault(host, {'requests': 0, 'hits': 0, 'misses': 0})
+                host_stats['requests'] += pool.num_requests
+                host_stats['misses'] += pool.num_connections
+                host_stats['hits'] += max(0, pool.num_requests - pool.num_connections)
+        return stats
+
+    def print_stats(self):
+        """Affiche les compteurs de réutilisation des connexions"""
+        print("\n🔌 POOLS DE CONNEXIONS")
+        print("=" * 50)
+        for host, host_stats in sorted(self.stats().items()):
+            total = host_stats['requests'] or 1
+            print(f"   {host}: {host_stats['requests']} requêtes, "
+                  f"{host_stats['hits']} hits / {host_stats['misses']} miss "
+                  f"({host_stats['hits'] / total:.0%} de réutilisation)")
+
+# Registre partagé par toutes les instances de scraper du processus
+_shared_pool_registry = ConnectionPoolRegistry()
+
+def get_pool_registry():
+    """Retourne le registre de pools de connexions du processus"""
+    return _shared_pool_registry
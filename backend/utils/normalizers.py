@@ -0,0 +1,160 @@
+# utils/normalizers.py
+
+import re
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+# Symboles et codes ISO reconnus dans les prix
+CURRENCY_CODES = {'€': 'EUR', '$': 'USD', '£': 'GBP', '¥': 'JPY'}
+ISO_CURRENCIES = ('EUR', 'USD', 'GBP', 'JPY', 'CHF', 'CAD', 'AUD', 'CNY', 'SEK', 'NOK', 'DKK', 'PLN')
+CURRENCY_RE = r'([€$£¥]|\b(?:' + '|'.join(ISO_CURRENCIES) + r')\b)'
+
+# Premier nombre du texte, avec son signe et ses séparateurs (1 299,00 / -0.45 / 1'299.50)
+NUMBER_RE = r"([+\-−]?\d[\d\s'.,]*)"
+# Séparateurs de milliers non ambigus : espaces (insécables compris) et apostrophes
+GROUPING_RE = r"[\s']"
+
+CURRENCY_PATTERN = re.compile(CURRENCY_RE)
+NUMBER_PATTERN = re.compile(NUMBER_RE)
+GROUPING_PATTERN = re.compile(GROUPING_RE)
+
+# Champs numériques ajoutés : nom -> champs sources par ordre de préférence
+AMOUNT_FIELDS = {
+    'prix_valeur': ('prix_brut', 'prix', 'price'),
+    'variation_valeur': ('variation_absolue', 'variation_brute', 'variation'),
+}
+PERCENT_FIELDS = {
+    'variation_pourcentage_valeur': ('variation_pourcentage', 'change_percent'),
+}
+# Code devise extrait de la même source que 'prix_valeur'
+CURRENCY_FIELD = 'devise'
+
+def first_field(fields, candidates):
+    """Premier des champs candidats présent dans `fields` (dict ou colonnes), ou None"""
+    for name in candidates:
+        if name in fields:
+            return name
+    return None
+
+@lru_cache(maxsize=8192)
+def parse_number(text, decimal=None):
+    """
+    Premier nombre de `text` en float, ou None
+
+    Même règle que la version vectorisée (utils.columnar.parse_numbers) :
+    avec '.' et ',', le dernier des deux est décimal ; un séparateur unique
+    suivi d'exactement 3 chiffres est un séparateur de milliers (sauf après
+    un zéro seul) ; répété, c'est un séparateur de milliers.
+    """
+    match = NUMBER_PATTERN.search(text)
+    if not match:
+        return None
+    number = GROUPING_PATTERN.sub('', match.group(1)).replace('−', '-').rstrip('.,')
+
+    if decimal not in (',', '.'):
+        last_comma, last_dot = number.rfind(','), number.rfind('.')
+        commas, dots = number.count(','), number.count('.')
+        decimal = ''
+        if commas and dots:
+            decimal = ',' if last_comma > last_dot else '.'
+        elif commas + dots == 1:
+            digits_after = len(number) - 1 - max(last_comma, last_dot)
+            if digits_after != 3 or re.match(r'[+-]?0[.,]', number):
+                decimal = ',' if commas else '.'
+
+    if decimal == ',':
+        number = number.replace('.', '').replace(',', '.')
+    elif decimal == '.':
+        number = number.replace(',', '')
+    else:
+        number = number.replace('.', '').replace(',', '')
+    try:
+        return float(number)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=1024)
+def parse_currency(text):
+    """Code ISO de la devise mentionnée dans `text` (€ -> EUR), vide si absente"""
+    match = CURRENCY_PATTERN.search(text)
+    if not match:
+        return ''
+    return CURRENCY_CODES.get(match.group(1), match.group(1))
+
+MONTHS = {
+    'janvier': 1, 'janv': 1, 'février': 2, 'fevrier': 2, 'févr': 2, 'fevr': 2, 'mars': 3,
+    'avril': 4, 'avr': 4, 'mai': 5, 'juin': 6, 'juillet': 7, 'juil': 7, 'août': 8, 'aout': 8,
+    'septembre': 9, 'sept': 9, 'octobre': 10, 'novembre': 11, 'décembre': 12, 'decembre': 12, 'déc': 12,
+    'january': 1, 'jan': 1, 'february': 2, 'feb': 2, 'march': 3, 'mar': 3, 'april': 4, 'apr': 4,
+    'may': 5, 'june': 6, 'jun': 6, 'july': 7, 'jul': 7, 'august': 8, 'aug': 8, 'september': 9,
+    'sep': 9, 'october': 10, 'oct': 10, 'november': 11, 'nov': 11, 'december': 12, 'dec': 12
+}
+
+TIME_RE = r'(?:,?\s+(?:à\s+|at\s+|-\s+)?(\d{1,2})[:h](\d{2})(?::(\d{2}))?\s*([ap]\.?m\.?)?)?'
+# 17/10/2026, 17.10.2026 08:30 (jour en premier, sauf si impossible)
+NUMERIC_DATE_RE = re.compile(r'\b(\d{1,2})[/.-](\d{1,2})[/.-](\d{4}|\d{2})\b' + TIME_RE, re.I)
+# 17 octobre 2026, 1er oct. 2026 à 08h30
+DAY_MONTH_DATE_RE = re.compile(r'\b(\d{1,2})(?:er)?\s+([^\W\d_]+)\.?,?\s+(\d{4})' + TIME_RE, re.I)
+# Oct 17, 2026 8:30 pm
+MONTH_DAY_DATE_RE = re.compile(r'\b([^\W\d_]+)\.?\s+(\d{1,2}),?\s+(\d{4})' + TIME_RE, re.I)
+
+def _format_date(year, month, day, hour=None, minute=None, second=None, meridiem=None):
+    if year < 100:
+        year += 2000
+    if hour is None:
+        return datetime(year, month, day).date().isoformat()
+    hour = int(hour)
+    if meridiem:
+        meridiem = meridiem.lower().replace('.', '')
+        hour = hour % 12 + (12 if meridiem == 'pm' else 0)
+    return datetime(year, month, day, hour, int(minute), int(second or 0)).isoformat()
+
+@lru_cache(maxsize=2048)
+def normalize_date(text):
+    """
+    Date d'un texte en ISO 8601 ('2026-10-17' ou '2026-10-17T08:30:00'), sinon le texte inchangé
+
+    Reconnaît l'ISO 8601, les dates RFC 2822 des flux RSS, les dates
+    numériques (jour en premier) et les mois en toutes lettres (français ou
+    anglais). Les dates relatives ("il y a 2 heures") sont laissées telles
+    quelles. Mis en cache : un flux répète les mêmes horodatages.
+    """
+    value = text.strip()
+    if not value:
+        return text
+
+    try:
+        parsed = datetime.fromisoformat(value)
+        return parsed.date().isoformat() if len(value) == 10 else parsed.isoformat()
+    except ValueError:
+        pass
+
+    if ',' in value[:5] or value[-3:].upper() in ('GMT', 'UTC') or value[-5:-4] in ('+', '-'):
+        try:
+            return parsedate_to_datetime(value).isoformat()
+        except (TypeError, ValueError, IndexError):
+            pass
+
+    try:
+        match = NUMERIC_DATE_RE.search(value)
+        if match:
+            day, month, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+            if month > 12 >= day:
+                day, month = month, day
+            return _format_date(year, month, day, *match.groups()[3:])
+
+        match = DAY_MONTH_DATE_RE.search(value)
+        if match and match.group(2).lower() in MONTHS:
+            return _format_date(int(match.group(3)), MONTHS[match.group(2).lower()], int(match.group(1)),
+                                *match.groups()[3:])
+
+        match = MONTH_DAY_DATE_RE.search(value)
+        if match and match.group(1).lower() in MONTHS:
+            return _format_date(int(match.group(3)), MONTHS[match.group(1).lower()], int(match.group(2)),
+                                *match.groups()[3:])
+    except ValueError:
+        # 31/02/2026, 25h00...
+        pass
+
+    return text
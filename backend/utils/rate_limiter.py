@@ -0,0 +1,124 @@
+# utils/rate_limiter.py
+
+import asyncio
+import random
+import threading
+import time
+import urllib.parse
+
+class TokenBucket:
+    """Seau à jetons : un jeton toutes les `interval` secondes, `burst` jetons max"""
+
+    def __init__(self, interval, burst=1):
+        self.interval = interval
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def configure(self, interval, burst=None):
+        """Met à jour le débit (et éventuellement la rafale) du seau"""
+        self._refill()
+        self.interval = interval
+        if burst is not None:
+            self.burst = max(1, burst)
+            self.tokens = min(self.tokens, self.burst)
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.interval > 0:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) / self.interval)
+        else:
+            self.tokens = float(self.burst)
+        self.updated = now
+
+    def reserve(self):
+        """Réserve un jeton et retourne le temps d'attente avant de l'utiliser"""
+        self._refill()
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        # Jeton emprunté sur le futur : les appelants suivants attendront d'autant plus
+        return -self.tokens * self.interval
+
+class HostRateLimiter:
+    """
+    Limiteur de débit partagé, avec un seau à jetons par hôte (netloc)
+
+    La réservation se fait sous verrou, l'attente en dehors : un thread
+    (ou une coroutine) qui patiente pour un hôte ne ralentit pas les autres.
+    """
+
+    def __init__(self, default_burst=1):
+        self.default_burst = default_burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_key(url):
+        """Clé du seau : le netloc de l'URL"""
+        return urllib.parse.urlparse(url).netloc.lower()
+
+    def configure(self, url, interval, burst=None):
+        """Configure le débit d'un hôte"""
+        with self._lock:
+            self._get_bucket(self.host_key(url), interval, burst)
+
+    def _get_bucket(self, host, interval, burst):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(interval, burst or self.default_burst)
+            self._buckets[host] = bucket
+        elif bucket.interval != interval or (burst is not None and bucket.burst != burst):
+            bucket.configure(interval, burst)
+        return bucket
+
+    def reserve(self, url, interval, burst=None, jitter=None):
+        """
+        Réserve un créneau pour l'hôte de `url`
+
+        Args:
+            interval: Délai moyen entre deux requêtes vers cet hôte
+            burst: Nombre de requêtes autorisées en rafale
+            jitter: Intervalle (min, max) ajouté aux attentes (mode furtif)
+
+        Returns:
+            Temps d'attente en secondes
+        """
+        if interval <= 0:
+            return 0.0
+
+        with self._lock:
+            wait = self._get_bucket(self.host_key(url), interval, burst).reserve()
+
+        if jitter and wait > 0:
+            wait = max(0.1, wait + random.uniform(*jitter))  # Minimum 0.1s
+        return wait
+
+    def acquire(self, url, interval, burst=None, jitter=None):
+        """Attend (bloquant) le prochain créneau pour l'hôte, retourne l'attente"""
+        wait = self.reserve(url, interval, burst, jitter)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url, interval, burst=None, jitter=None):
+        """Équivalent asyncio de `acquire`, sans bloquer la boucle d'événements"""
+        wait = self.reserve(url, interval, burst, jitter)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def reset(self, url=None):
+        """Oublie l'état d'un hôte (ou de tous les hôtes)"""
+        with self._lock:
+            if url is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(self.host_key(url), None)
+
+# Limiteur partagé par toutes les instances de scraper du processus
+_shared_rate_limiter = HostRateLimiter()
+
+def get_rate_limiter():
+    """Retourne le limiteur de débit partagé du processus"""
+    return _shared_rate_limiter
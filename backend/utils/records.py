@@ -0,0 +1,254 @@
+# utils/records.py
+
+from collections.abc import Mapping, MutableMapping, MutableSequence
+
+class Record(MutableMapping):
+    """
+    Enregistrement scrapé compact : un slot par champ connu au lieu d'un dict
+
+    S'utilise comme un dict (record['nom'], .get(), .items(), dict(record),
+    comparaison avec un dict). Un champ jamais affecté est absent, comme une
+    clé de dict ; les champs hors FIELDS vont dans un dict annexe, créé
+    seulement au premier champ imprévu.
+    """
+
+    __slots__ = ('_extra',)
+    FIELDS = ()
+    _FIELD_SET = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, *args, **kwargs):
+        self._extra = None
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        # Ordre des FIELDS (celui des anciens dicts), puis champs annexes
+        for name in self.FIELDS:
+            if hasattr(self, name):
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self):
+        return record_type(self)(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+class Product(Record):
+    """Produit e-commerce (EcommerceScraper)"""
+    FIELDS = ('nom', 'prix', 'prix_brut', 'description', 'image_url', 'index',
+              'prix_valeur', 'devise', 'url_source')
+    __slots__ = FIELDS
+
+class Quote(Record):
+    """Cotation boursière (BourseScraper)"""
+    FIELDS = ('nom', 'prix', 'prix_brut', 'variation_absolue', 'variation_pourcentage', 'variation_brute',
+              'index', 'type', 'prix_valeur', 'devise', 'variation_valeur', 'variation_pourcentage_valeur',
+              'url_source')
+    __slots__ = FIELDS
+
+class NewsItem(Record):
+    """Actualité ou lien d'article (BourseScraper, NewsScraper)"""
+    FIELDS = ('titre', 'description', 'date', 'lien', 'index', 'type', 'profondeur', 'url_source')
+    __slots__ = FIELDS
+
+# Classes d'enregistrement par nom (résultats relus depuis un fichier JSON)
+RECORD_TYPES = {cls.__name__: cls for cls in (Product, Quote, NewsItem)}
+
+class ReadOnlyRow:
+    """
+    Ligne reconstruite par RecordBatch : une copie, donc en lecture seule
+
+    Modifier la copie serait perdu sans erreur ; il faut passer par
+    `batch[i] = record` ou `batch.set_field()`. `record.copy()` donne un
+    enregistrement modifiable de la classe d'origine.
+    """
+
+    __slots__ = ()
+    # Classe d'origine (modifiable), fixée pour chaque sous-classe
+    _mutable_type = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._mutable_type = next(base for base in cls.__mro__[1:] if not issubclass(base, ReadOnlyRow))
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Ligne de RecordBatch en lecture seule : modifier record.copy() "
+                        "puis batch[i] = record, ou utiliser batch.set_field()")
+
+    __setitem__ = __delitem__ = _read_only
+
+class ReadOnlyDict(ReadOnlyRow, dict):
+    __slots__ = ()
+    update = pop = popitem = setdefault = clear = __ior__ = ReadOnlyRow._read_only
+
+    def __reduce__(self):
+        # pickle remplirait le dict par __setitem__
+        return ReadOnlyDict, (dict(self),)
+
+class ReadOnlyProduct(ReadOnlyRow, Product):
+    __slots__ = ()
+
+class ReadOnlyQuote(ReadOnlyRow, Quote):
+    __slots__ = ()
+
+class ReadOnlyNewsItem(ReadOnlyRow, NewsItem):
+    __slots__ = ()
+
+# Classe d'enregistrement -> variante en lecture seule (créée à la demande pour les autres)
+_READ_ONLY_TYPES = {cls._mutable_type: cls for cls in (ReadOnlyDict, ReadOnlyProduct, ReadOnlyQuote, ReadOnlyNewsItem)}
+
+def read_only_type(cls):
+    """Variante en lecture seule d'une classe d'enregistrement"""
+    read_only = _READ_ONLY_TYPES.get(cls)
+    if read_only is None:
+        read_only = _READ_ONLY_TYPES.setdefault(
+            cls, type(f"ReadOnly{cls.__name__}", (ReadOnlyRow, cls), {'__slots__': ()})
+        )
+    return read_only
+
+def record_type(record):
+    """Classe modifiable d'un enregistrement (classe d'origine d'une ligne de RecordBatch)"""
+    return type(record)._mutable_type if isinstance(record, ReadOnlyRow) else type(record)
+
+def restore_records(records, kinds=None):
+    """Dicts relus en enregistrements de leur classe d'origine (`kinds` : noms de classe)"""
+    if not kinds or len(kinds) != len(records):
+        return records
+    return [RECORD_TYPES[kind](record) if kind in RECORD_TYPES else record
+            for record, kind in zip(records, kinds)]
+
+# Valeur d'un champ absent dans une colonne de RecordBatch
+MISSING = object()
+
+class RecordBatch(MutableSequence):
+    """
+    Enregistrements rangés par colonnes : une liste de valeurs par champ
+
+    Pour les gros volumes (pagination, crawl, lots d'URLs) : environ 8 octets
+    par valeur, sans objet par enregistrement. batch[i] (et l'itération)
+    reconstruit l'enregistrement dans sa classe d'origine (Product, dict...) :
+    c'est une copie en lecture seule (ReadOnlyRow), une modification lève
+    TypeError au lieu d'être perdue. Pour modifier le lot : batch[i] = record
+    ou set_field().
+    """
+
+    __slots__ = ('_kinds', '_columns')
+
+    def __init__(self, records=()):
+        # Classe de chaque enregistrement, puis champ -> valeurs (MISSING si absent)
+        self._kinds = []
+        self._columns = {}
+        self.extend(records)
+
+    def __len__(self):
+        return len(self._kinds)
+
+    def _row(self, index):
+        kind = self._kinds[index]
+        values = {name: column[index] for name, column in self._columns.items() if column[index] is not MISSING}
+        if kind is dict:
+            return ReadOnlyDict(values)
+        record = kind(values)
+        record.__class__ = read_only_type(kind)
+        return record
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RecordBatch(self._row(i) for i in range(*index.indices(len(self))))
+        return self._row(index)
+
+    def _kind(self, record):
+        return record_type(record) if isinstance(record, Record) else dict
+
+    def _add_columns(self, record):
+        for name in record:
+            if name not in self._columns:
+                self._columns[name] = [MISSING] * len(self._kinds)
+
+    def append(self, record):
+        self._add_columns(record)
+        self._kinds.append(self._kind(record))
+        for name, column in self._columns.items():
+            column.append(record[name] if name in record else MISSING)
+
+    def insert(self, index, record):
+        self._add_columns(record)
+        self._kinds.insert(index, self._kind(record))
+        for name, column in self._columns.items():
+            column.insert(index, record[name] if name in record else MISSING)
+
+    def __setitem__(self, index, record):
+        if isinstance(index, slice):
+            raise TypeError("RecordBatch ne remplace pas de tranche")
+        self._add_columns(record)
+        self._kinds[index] = self._kind(record)
+        for name, column in self._columns.items():
+            column[index] = record[name] if name in record else MISSING
+
+    def __delitem__(self, index):
+        del self._kinds[index]
+        for column in self._columns.values():
+            del column[index]
+
+    def column(self, name, default=None):
+        """Valeurs d'un champ pour tous les enregistrements (`default` si absent)"""
+        values = self._columns.get(name)
+        if values is None:
+            return [default] * len(self)
+        return [default if value is MISSING else value for value in values]
+
+    def set_field(self, name, value):
+        """Affecte la même valeur à un champ de tous les enregistrements"""
+        self._columns[name] = [value] * len(self)
+
+    def field_names(self):
+        return list(self._columns)
+
+    def __repr__(self):
+        return f"<RecordBatch {len(self)} enregistrements, champs {self.field_names()}>"
+
+def json_default(obj):
+    """Hook `default` de json.dump : enregistrements et lots en dict / liste"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, RecordBatch):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
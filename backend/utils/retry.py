@@ -0,0 +1,133 @@
+# utils/retry.py
+
+import random
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Codes HTTP qui justifient un nouvel essai
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class RetryableError(Exception):
+    """Réponse HTTP temporaire (429, 5xx) qui justifie un nouvel essai"""
+
+def parse_retry_after(value):
+    """Convertit un header Retry-After (secondes ou date HTTP) en secondes"""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+def backoff_delay(attempt, base=0.5, max_delay=30, retry_after=None):
+    """
+    Délai avant le prochain essai
+
+    Retry-After est prioritaire ; sinon backoff exponentiel avec jitter
+    complet (tirage uniforme entre 0 et base * 2^attempt).
+    """
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(max_delay, base * (2 ** attempt)))
+
+class CircuitBreaker:
+    """
+    Disjoncteur par hôte, partagé entre les instances de scraper
+
+    Après `failure_threshold` échecs consécutifs, l'hôte est ignoré pendant
+    `reset_timeout` secondes, puis une seule requête de test est autorisée :
+    son succès referme le circuit, son échec le rouvre. Une requête de test
+    restée sans verdict pendant ce délai est remplacée par une autre.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def configure(self, failure_threshold=None, reset_timeout=None):
+        """Met à jour les seuils du disjoncteur (seulement s'ils changent)"""
+        with self._lock:
+            if failure_threshold and failure_threshold != self.failure_threshold:
+                self.failure_threshold = failure_threshold
+            if reset_timeout and reset_timeout != self.reset_timeout:
+                self.reset_timeout = reset_timeout
+
+    @staticmethod
+    def host_key(url):
+        return urllib.parse.urlparse(url).netloc.lower()
+
+    def _state(self, host):
+        return self._hosts.setdefault(host, {'state': self.CLOSED, 'failures': 0, 'opened_at': 0, 'timeout': 0,
+                                             'probe_at': 0})
+
+    def allow(self, url):
+        """Vrai si une requête vers l'hôte de `url` peut être tentée"""
+        with self._lock:
+            state = self._state(self.host_key(url))
+
+            if state['state'] == self.CLOSED:
+                return True
+
+            now = time.monotonic()
+            if state['state'] == self.OPEN and now - state['opened_at'] >= state['timeout']:
+                # Laisser passer une seule requête de test
+                state['state'] = self.HALF_OPEN
+                state['probe_at'] = now
+                return True
+
+            if state['state'] == self.HALF_OPEN and now - state['probe_at'] >= state['timeout']:
+                # Requête de test restée sans verdict (ni succès ni échec) : en tenter une autre
+                state['probe_at'] = now
+                return True
+
+            return False
+
+    def record_success(self, url):
+        """Une réponse valide referme le circuit"""
+        with self._lock:
+            state = self._state(self.host_key(url))
+            state['state'] = self.CLOSED
+            state['failures'] = 0
+
+    def record_failure(self, url, retry_after=None):
+        """Comptabilise un échec et ouvre le circuit si nécessaire"""
+        with self._lock:
+            host = self.host_key(url)
+            state = self._state(host)
+            state['failures'] += 1
+
+            if state['state'] == self.HALF_OPEN or state['failures'] >= self.failure_threshold:
+                if state['state'] != self.OPEN:
+                    print(f"⛔ Circuit ouvert pour {host} ({state['failures']} échecs)")
+                state['state'] = self.OPEN
+                state['opened_at'] = time.monotonic()
+                state['timeout'] = max(self.reset_timeout, retry_after or 0)
+
+    def status(self):
+        """État du disjoncteur pour chaque hôte"""
+        with self._lock:
+            return {host: dict(state) for host, state in self._hosts.items()}
+
+# Disjoncteur partagé par toutes les instances de scraper du processus
+_shared_circuit_breaker = CircuitBreaker()
+
+def get_circuit_breaker():
+    """Retourne le disjoncteur partagé du processus"""
+    return _shared_circuit_breaker
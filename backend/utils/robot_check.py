@@ -1,9 +1,151 @@
 # utils/robot_check.py
+import asyncio
+import threading
+import time
+import urllib.parse
+import urllib.request
 import urllib.robotparser
+from urllib.error import HTTPError
+
+class RobotsCache:
+    """
+    Cache des fichiers robots.txt, par origine (schéma + hôte)
+
+    Un robots.txt récupéré est conservé `ttl` secondes. Les échecs
+    (serveur injoignable, erreur 5xx) sont mis en cache `negative_ttl`
+    secondes pour ne pas refaire une requête bloquante à chaque URL.
+    """
+
+    def __init__(self, ttl=3600, negative_ttl=300, timeout=10, user_agent='*'):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._origin_locks = {}
+
+    @staticmethod
+    def origin(url):
+        """Origine d'une URL (https://exemple.com)"""
+        parsed = urllib.parse.urlparse(url)
+        return f"{parsed.scheme or 'http'}://{parsed.netloc.lower()}"
+
+    def _fetch(self, origin):
+        """Télécharge et parse le robots.txt d'une origine, retourne (parser, ttl)"""
+        robots_url = f"{origin}/robots.txt"
+        parser = urllib.robotparser.RobotFileParser(robots_url)
+
+        try:
+            request = urllib.request.Request(robots_url, headers={'User-Agent': self.user_agent})
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                lines = response.read().decode('utf-8', errors='ignore').splitlines()
+            parser.parse(lines)
+            return parser, self.ttl
+
+        except HTTPError as e:
+            # Même règles que RobotFileParser.read()
+            if e.code in (401, 403):
+                parser.disallow_all = True
+                return parser, self.ttl
+            if 400 <= e.code < 500:
+                parser.allow_all = True
+                return parser, self.ttl
+            # Erreur serveur : on s'abstient, mais pas longtemps
+            parser.disallow_all = True
+            print(f"⚠️ robots.txt indisponible ({e.code}) pour {origin}")
+            return parser, self.negative_ttl
+
+        except Exception as e:
+            # Injoignable ou trop lent : autorisé par défaut, revérifié plus tard
+            print(f"⚠️ robots.txt inaccessible pour {origin} ({e})")
+            parser.allow_all = True
+            return parser, self.negative_ttl
+
+    def get_parser(self, url):
+        """Retourne le parser robots.txt de l'origine de `url` (mis en cache)"""
+        origin = self.origin(url)
+
+        with self._lock:
+            entry = self._entries.get(origin)
+            if entry and entry['expires'] > time.monotonic():
+                return entry['parser']
+            origin_lock = self._origin_locks.setdefault(origin, threading.Lock())
+
+        # Un seul téléchargement par origine, même avec plusieurs threads
+        with origin_lock:
+            with self._lock:
+                entry = self._entries.get(origin)
+                if entry and entry['expires'] > time.monotonic():
+                    return entry['parser']
+
+            parser, ttl = self._fetch(origin)
+            parser.modified()
+
+            with self._lock:
+                self._entries[origin] = {'parser': parser, 'expires': time.monotonic() + ttl}
+            return parser
+
+    def is_allowed(self, url, user_agent='*'):
+        """Vrai si robots.txt autorise l'accès à `url`"""
+        return self.get_parser(url).can_fetch(user_agent, url)
+
+    def crawl_delay(self, url, user_agent='*'):
+        """
+        Délai minimal entre deux requêtes demandé par le site
+
+        Combine `Crawl-delay` et `Request-rate` (n requêtes / s secondes),
+        retourne None si aucun des deux n'est déclaré.
+        """
+        parser = self.get_parser(url)
+        delays = []
+
+        crawl_delay = parser.crawl_delay(user_agent)
+        if crawl_delay:
+            delays.append(float(crawl_delay))
+
+        request_rate = parser.request_rate(user_agent)
+        if request_rate and request_rate.requests:
+            delays.append(request_rate.seconds / request_rate.requests)
+
+        return max(delays) if delays else None
+
+    def request_rate(self, url, user_agent='*'):
+        """`Request-rate` déclaré pour l'agent (ou None)"""
+        return self.get_parser(url).request_rate(user_agent)
+
+    def site_maps(self, url):
+        """Sitemaps déclarés dans robots.txt"""
+        return self.get_parser(url).site_maps() or []
+
+    async def is_allowed_async(self, url, user_agent='*'):
+        """Équivalent asyncio de `is_allowed`"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.is_allowed, url, user_agent)
+
+    async def crawl_delay_async(self, url, user_agent='*'):
+        """Équivalent asyncio de `crawl_delay`"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.crawl_delay, url, user_agent)
+
+    def invalidate(self, url=None):
+        """Oublie le robots.txt d'une origine (ou de toutes)"""
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self.origin(url), None)
+
+# Cache partagé par tout le processus
+_shared_robots_cache = RobotsCache()
+
+def get_robots_cache():
+    """Retourne le cache robots.txt du processus"""
+    return _shared_robots_cache
 
 def is_scraping_allowed(url, user_agent='*'):
-    rp = urllib.robotparser.RobotFileParser()
-    domain = '/'.join(url.split('/')[:3]) + '/robots.txt'
-    rp.set_url(domain)
-    rp.read()
-    return rp.can_fetch(user_agent, url)
+    return _shared_robots_cache.is_allowed(url, user_agent)
+
+def get_crawl_delay(url, user_agent='*'):
+    """Délai demandé par robots.txt pour `url` (ou None)"""
+    return _shared_robots_cache.crawl_delay(url, user_agent)
@@ -0,0 +1,141 @@
+# utils/selector_stats.py
+
+import json
+import os
+import threading
+import urllib.parse
+from pathlib import Path
+
+class SelectorStats:
+    """
+    Compteurs de succès des sélecteurs, par hôte et par champ
+
+    Une cascade de sélecteurs est réordonnée par taux de succès observé
+    sur l'hôte dès `min_samples` essais. À égalité (et tant que les
+    échantillons manquent), l'ordre statique des classes de scraper est conservé.
+
+    Une page ne fournit que quelques essais par champ et l'ordre est fixé
+    une fois par page : sans `path`, le gain se limite aux longs crawls
+    d'un même hôte. Avec `path`, les compteurs sont relus et sauvegardés
+    (JSON, comme les modèles d'extraction) et profitent aux exécutions
+    suivantes ; deux exécutions simultanées gardent les compteurs de la
+    dernière sauvegarde.
+    """
+
+    def __init__(self, min_samples=10, path=None):
+        self.min_samples = min_samples
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._dirty = False
+        # {(hôte, champ): {'probes': n, 'hits': {sélecteur: n}}}
+        self._counters = self._load()
+
+    def _load(self):
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Statistiques de sélecteurs illisibles ({self.path}) : {e}")
+            return {}
+        return {(host, field): counter for host, fields in data.items() for field, counter in fields.items()}
+
+    def save(self):
+        """Sauvegarde les compteurs modifiés (écriture atomique) ; sans `path`, ne fait rien"""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            data = {}
+            for (host, field), counter in self._counters.items():
+                data.setdefault(host, {})[field] = counter
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temporary = self.path.with_suffix('.tmp')
+                with open(temporary, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                os.replace(temporary, self.path)
+            except OSError as e:
+                print(f"⚠️ Statistiques de sélecteurs non sauvegardées : {e}")
+                return
+            self._dirty = False
+
+    @staticmethod
+    def host_key(url):
+        return urllib.parse.urlparse(url).netloc.lower()
+
+    def record(self, host, field, selector):
+        """Enregistre un essai de cascade et le sélecteur gagnant (None si aucun)"""
+        with self._lock:
+            counter = self._counters.setdefault((host, field), {'probes': 0, 'hits': {}})
+            counter['probes'] += 1
+            self._dirty = True
+            if selector is not None:
+                counter['hits'][selector] = counter['hits'].get(selector, 0) + 1
+
+    def order(self, host, field, selectors):
+        """Sélecteurs triés par succès décroissants (ordre statique en cas d'égalité)"""
+        with self._lock:
+            counter = self._counters.get((host, field))
+            if not counter or counter['probes'] < self.min_samples:
+                return list(selectors)
+            hits = dict(counter['hits'])
+
+        ranked = sorted(enumerate(selectors), key=lambda pair: (-hits.get(pair[1], 0), pair[0]))
+        return [selector for _, selector in ranked]
+
+    def report(self, host):
+        """{champ: (essais, [(sélecteur, succès), ...])} pour un hôte"""
+        with self._lock:
+            return {
+                field: (counter['probes'], sorted(counter['hits'].items(), key=lambda pair: -pair[1]))
+                for (counter_host, field), counter in self._counters.items()
+                if counter_host == host
+            }
+
+    def reset(self, host=None):
+        """Oublie les compteurs d'un hôte (ou de tous)"""
+        with self._lock:
+            if host is None:
+                self._counters.clear()
+            else:
+                for key in [key for key in self._counters if key[0] == host]:
+                    del self._counters[key]
+            self._dirty = True
+
+class TrackedCascade:
+    """Cascade qui compte, pour un hôte, le sélecteur gagnant à chaque appel"""
+
+    __slots__ = ('cascade', 'stats', 'host', 'field')
+
+    def __init__(self, cascade, stats, host, field):
+        self.cascade = cascade
+        self.stats = stats
+        self.host = host
+        self.field = field
+
+    @property
+    def selectors(self):
+        return self.cascade.selectors
+
+    def first_with_index(self, item):
+        element, index = self.cascade.first_with_index(item)
+        self.stats.record(self.host, self.field, None if index is None else self.cascade.selectors[index])
+        return element, index
+
+    def first(self, item):
+        return self.first_with_index(item)[0]
+
+# Compteurs partagés par toutes les instances de scraper du processus, par fichier
+_stores = {}
+_stores_lock = threading.Lock()
+
+def get_selector_stats(path=None):
+    """Retourne les compteurs partagés associés à un fichier (None : en mémoire seulement)"""
+    key = str(Path(path).resolve()) if path else None
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = SelectorStats(path=path)
+        return _stores[key]
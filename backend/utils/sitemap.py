@@ -0,0 +1,193 @@
+# utils/sitemap.py
+
+import gzip
+import io
+import json
+import os
+import threading
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+from utils.robot_check import get_robots_cache
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+def _local_name(tag):
+    """Nom d'un élément sans son espace de noms ({http://...}loc -> loc)"""
+    return tag.rsplit('}', 1)[-1]
+
+def parse_lastmod(value):
+    """Date W3C d'un <lastmod> (2026-10-01, 2026-10-01T08:00:00Z...) en datetime UTC, ou None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def discover_sitemaps(url):
+    """Sitemaps déclarés dans robots.txt, sinon /sitemap.xml à la racine du site"""
+    sitemaps = get_robots_cache().site_maps(url)
+    if sitemaps:
+        return list(dict.fromkeys(sitemaps))
+    parts = urlsplit(url)
+    return [f"{parts.scheme}://{parts.netloc}/sitemap.xml"]
+
+def _open_stream(response):
+    """Flux du corps de la réponse, décompressé si le fichier lui-même est gzippé (.xml.gz)"""
+    # Content-Encoding (gzip de transport) décodé par urllib3
+    response.raw.decode_content = True
+    # Le flux est relu par BufferedReader après la fin du corps : ne pas le fermer
+    response.raw.auto_close = False
+    stream = io.BufferedReader(response.raw)
+    if stream.peek(2)[:2] == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+def _session_fetch(session, timeout):
+    """Téléchargement d'un sitemap par une session requests nue (réponse ouverte ou None)"""
+    def fetch(url):
+        try:
+            response = session.get(url, stream=True, timeout=timeout)
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️ Sitemap inaccessible : {url} ({e})")
+            return None
+    return fetch
+
+def iter_sitemap(sitemap_url, session=None, since=None, timeout=30, max_depth=3, fetch=None, failures=None):
+    """
+    URLs d'un sitemap (ou d'un index de sitemaps), en streaming
+
+    Le XML est lu avec `iterparse` au fil du téléchargement et chaque
+    <url> est libéré après lecture : un sitemap de 50 000 URLs n'est
+    jamais entièrement en mémoire. Avec `since`, les pages (et les
+    sitemaps d'un index) dont le <lastmod> est antérieur ou égal sont
+    ignorés ; les entrées sans <lastmod> sont conservées.
+
+    Args:
+        fetch: fetch(url) -> réponse requests ouverte en streaming, ou None en
+            cas d'échec (par défaut `session.get`, sans User-Agent ni délai)
+        failures: Liste complétée par les sitemaps inaccessibles ou illisibles
+            (page d'erreur HTML au lieu de XML...), pour ne pas les confondre
+            avec un sitemap vide
+
+    Yields:
+        (url, lastmod en datetime UTC ou None)
+    """
+    fetch = fetch or _session_fetch(session or requests.Session(), timeout)
+    pending = [(sitemap_url, 0)]
+    visited = set()
+
+    while pending:
+        current, depth = pending.pop(0)
+        if current in visited or depth > max_depth:
+            continue
+        visited.add(current)
+
+        response = fetch(current)
+        if response is None:
+            if failures is not None:
+                failures.append(current)
+            continue
+
+        # Page d'erreur ou de blocage servie avec un code 200
+        if 'html' in response.headers.get('Content-Type', '').lower():
+            response.close()
+            print(f"⚠️ Sitemap invalide : {current} (HTML reçu au lieu de XML)")
+            if failures is not None:
+                failures.append(current)
+            continue
+
+        children = []
+        with response:
+            try:
+                root = None
+                for event, element in ET.iterparse(_open_stream(response), events=('start', 'end')):
+                    if event == 'start':
+                        if root is None:
+                            root = element
+                        continue
+
+                    name = _local_name(element.tag)
+                    if name not in ('url', 'sitemap'):
+                        continue
+
+                    loc, lastmod = None, None
+                    for child in element:
+                        child_name = _local_name(child.tag)
+                        if child_name == 'loc' and child.text:
+                            loc = child.text.strip()
+                        elif child_name == 'lastmod':
+                            lastmod = parse_lastmod(child.text)
+                    # Libérer les entrées déjà lues
+                    root.clear()
+
+                    if not loc or (since and lastmod and lastmod <= since):
+                        continue
+                    if name == 'sitemap':
+                        children.append((loc, depth + 1))
+                    else:
+                        yield loc, lastmod
+            except (ET.ParseError, OSError, EOFError) as e:
+                print(f"⚠️ Sitemap illisible : {current} ({e})")
+                if failures is not None:
+                    failures.append(current)
+
+        pending.extend(children)
+
+class SitemapWatermarks:
+    """
+    Date de dernière modification la plus récente vue par site (JSON)
+
+    La marque n'est avancée qu'après un scraping réussi (`update`), pour
+    ne pas perdre les pages d'une exécution interrompue.
+    """
+
+    def __init__(self, path="cache/sitemap_watermarks.json"):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._marks = json.load(f)
+        except FileNotFoundError:
+            self._marks = {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Marques de sitemap illisibles ({self.path}) : {e}")
+            self._marks = {}
+
+    @staticmethod
+    def key(url):
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc.lower()}"
+
+    def get(self, url):
+        """Marque du site de `url` (datetime UTC) ou None"""
+        with self._lock:
+            return parse_lastmod(self._marks.get(self.key(url)))
+
+    def update(self, url, lastmod):
+        """Avance la marque du site (jamais en arrière)"""
+        if lastmod is None:
+            return
+        with self._lock:
+            current = parse_lastmod(self._marks.get(self.key(url)))
+            if current and current >= lastmod:
+                return
+            self._marks[self.key(url)] = lastmod.isoformat()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_suffix('.tmp')
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(self._marks, f, indent=2)
+            os.replace(temporary, self.path)
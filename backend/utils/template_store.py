@@ -0,0 +1,90 @@
+# utils/template_store.py
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+class TemplateStore:
+    """
+    Modèles d'extraction appris par hôte, persistés dans un fichier JSON
+
+    Un modèle associe un type de conteneur ('products', 'news_containers'...) aux
+    sélecteurs qui ont fonctionné sur cet hôte : celui des conteneurs et
+    ceux de chaque champ ({'container': 'div.tile', 'fields': {'name': 'h3'}}).
+    """
+
+    def __init__(self, path="cache/templates.json"):
+        self.path = Path(path)
+        self.stats = {'hits': 0, 'misses': 0, 'learned': 0, 'forgotten': 0}
+        self._lock = threading.Lock()
+        self._templates = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Modèles d'extraction illisibles ({self.path}) : {e}")
+            return {}
+
+    def _save(self):
+        """Écriture atomique (fichier temporaire puis renommage)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix('.tmp')
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(self._templates, f, indent=2, ensure_ascii=False)
+        os.replace(temporary, self.path)
+
+    def get(self, host, kind):
+        """Modèle mémorisé pour un hôte et un type de contenu (ou None)"""
+        with self._lock:
+            template = self._templates.get(host.lower(), {}).get(kind)
+            self.stats['hits' if template else 'misses'] += 1
+            return template
+
+    def host_templates(self, host):
+        """Modèles mémorisés pour un hôte, tous types confondus (copie, sans statistiques)"""
+        with self._lock:
+            return json.loads(json.dumps(self._templates.get(host.lower(), {})))
+
+    def learn(self, host, kind, container, fields):
+        """Mémorise les sélecteurs qui ont fonctionné (écrit seulement s'ils changent)"""
+        template = {'container': container, 'fields': dict(fields)}
+        with self._lock:
+            templates = self._templates.setdefault(host.lower(), {})
+            current = templates.get(kind)
+            if current and current['container'] == container and current['fields'] == template['fields']:
+                return False
+            template['learned_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+            templates[kind] = template
+            self.stats['learned'] += 1
+            self._save()
+            return True
+
+    def forget(self, host, kind=None):
+        """Oublie le modèle d'un type de contenu (ou tous ceux de l'hôte)"""
+        with self._lock:
+            templates = self._templates.get(host.lower())
+            if not templates:
+                return
+            if kind is None:
+                del self._templates[host.lower()]
+            elif templates.pop(kind, None) is None:
+                return
+            self.stats['forgotten'] += 1
+            self._save()
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+def get_template_store(path="cache/templates.json"):
+    """Retourne le magasin de modèles partagé associé à un fichier"""
+    resolved = str(Path(path).resolve())
+    with _stores_lock:
+        if resolved not in _stores:
+            _stores[resolved] = TemplateStore(path)
+        return _stores[resolved]
@@ -0,0 +1,95 @@
+# utils/url_tools.py
+
+import posixpath
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+# Paramètres de suivi marketing, sans effet sur le contenu de la page
+TRACKING_PARAMS = frozenset([
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_ga', '_gl', 'ref_src', 'ref_url', 'cmpid', 'xtor', 'ito', 'ocid'
+])
+TRACKING_PREFIXES = ('utm_', 'pk_', 'hsa_')
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Extensions de ressources qui ne sont pas des pages HTML
+NON_HTML_EXTENSIONS = frozenset([
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico', '.pdf', '.zip',
+    '.gz', '.mp3', '.mp4', '.avi', '.mov', '.css', '.js', '.json', '.xml', '.rss'
+])
+
+IGNORED_SCHEMES = ('javascript:', 'mailto:', 'tel:', 'data:')
+
+# Suffixes à deux niveaux les plus courants (exemple.co.uk)
+SECOND_LEVEL_SUFFIXES = frozenset(['co', 'com', 'org', 'net', 'gov', 'ac', 'edu', 'gouv'])
+
+def is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+def canonicalize_url(url, base=None):
+    """
+    Forme canonique d'une URL, pour dédoublonner les liens
+
+    Résout l'URL relative, met le schéma et l'hôte en minuscules, retire
+    le port par défaut, le fragment et les paramètres de suivi, trie la
+    query string. Retourne None pour les liens non HTTP (javascript:, mailto:...).
+    """
+    if not url:
+        return None
+    url = url.strip()
+    if url.lower().startswith(IGNORED_SCHEMES):
+        return None
+    if base:
+        url = urljoin(base, url)
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS:
+        return None
+
+    host = (parts.hostname or '').rstrip('.')
+    if ':' in host:
+        host = f"[{host}]"  # IPv6
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+
+    path = parts.path or '/'
+    if '/.' in path:
+        # Segments '.' et '..' restés dans une URL absolue
+        normalized = posixpath.normpath(path)
+        path = normalized + ('/' if path.endswith('/') and normalized != '/' else '')
+
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not is_tracking_param(name))
+    return urlunsplit((scheme, netloc, path, urlencode(query), ''))
+
+def registrable_domain(host):
+    """Domaine enregistrable approximatif (www.lemonde.fr -> lemonde.fr, a.b.co.uk -> b.co.uk)"""
+    labels = (host or '').lower().rstrip('.').split('.')
+    if len(labels) >= 3 and labels[-2] in SECOND_LEVEL_SUFFIXES and len(labels[-1]) == 2:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+def in_scope(url, start_url, scope='domain'):
+    """
+    Vrai si `url` reste dans le périmètre du crawl
+
+    scope : 'host' (même hôte), 'domain' (même domaine, sous-domaines compris)
+    ou 'all' (aucune restriction)
+    """
+    if scope == 'all':
+        return True
+    host = urlsplit(url).hostname or ''
+    start_host = urlsplit(start_url).hostname or ''
+    if scope == 'host':
+        return host == start_host
+    return registrable_domain(host) == registrable_domain(start_host)
+
+def is_probably_html(url):
+    """Faux pour les liens vers des images, PDF, archives..."""
+    path = urlsplit(url).path.lower()
+    return posixpath.splitext(path)[1] not in NON_HTML_EXTENSIONS